@@ -0,0 +1,132 @@
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+TOOLS_DIR = REPO_ROOT / "tools"
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from cgir.core.oklab import to_lch, to_lch_batch  # noqa: E402
+
+
+def test_to_lch_batch_matches_scalar():
+    rng = np.random.default_rng(7)
+    ab = rng.uniform(-0.4, 0.4, size=(257, 2))
+    # Include gray axis and the negative real axis (hue +pi must canonicalize to -pi)
+    ab[0] = (0.0, 0.0)
+    ab[1] = (-0.2, 0.0)
+    # Just below +pi, inside the band the scalar path also snaps to -pi
+    ab[2] = (-0.2, 1e-16)
+    h, S = to_lch_batch(ab)
+    assert h.dtype == np.float64 and S.dtype == np.float64
+    assert h[1] == -math.pi and h[2] == -math.pi
+    for (a, b), hv, sv in zip(ab, h, S):
+        _, h_ref, s_ref = to_lch(0.5, float(a), float(b))
+        assert math.isclose(hv, h_ref, abs_tol=1e-12)
+        assert math.isclose(sv, s_ref, abs_tol=1e-12)
+
+
+def test_quantize_matches_builtin_round_half_even():
+    import random
+    import struct
+
+    from cgir.core.numeric import quantize, qtuple
+
+    rng = random.Random(1234)
+    samples = [0.0, -0.0, 1, -3, 2.5e-12, -2.5e-12, 0.5e-12, 1e300, float("inf"), float("-inf")]
+    for _ in range(20000):
+        samples.append(rng.uniform(-1.0, 1.0))
+        samples.append(struct.unpack("d", struct.pack("Q", rng.getrandbits(64)))[0])
+        # Values sitting on (or next to) a decimal tie at dp=12
+        samples.append(round(rng.uniform(-2.0, 2.0), 12) + rng.choice((0.5e-12, -0.5e-12)))
+    for x in samples:
+        for dp in (0, 6, 12):
+            want = round(float(x), ndigits=dp)
+            got = quantize(x, dp)
+            if want != want:
+                assert got != got
+                continue
+            assert got == want and math.copysign(1.0, got) == math.copysign(1.0, want)
+            assert type(got) is float
+    assert qtuple(samples[:64], 12) == tuple(round(float(v), ndigits=12) for v in samples[:64])
+
+
+def _clamp_angle_pi_remainder(h):
+    # Previous math.remainder-based implementation, kept as the reference
+    wrapped = math.remainder(h, 2.0 * math.pi)
+    if abs(wrapped - math.pi) <= 1e-15 or wrapped > math.pi:
+        wrapped = -math.pi
+    if wrapped < -math.pi:
+        wrapped += 2.0 * math.pi
+    if wrapped >= math.pi:
+        wrapped -= 2.0 * math.pi
+    return wrapped
+
+
+def test_clamp_angle_pi_matches_remainder_reference():
+    from cgir.core.numeric import clamp_angle_pi
+
+    hs = list(np.linspace(-10.0 * math.pi, 10.0 * math.pi, 20001))
+    for k in range(-10, 11):
+        base = k * math.pi
+        hs.append(base)
+        x = base
+        for _ in range(4):
+            x = math.nextafter(x, math.inf)
+            hs.append(x)
+        x = base
+        for _ in range(4):
+            x = math.nextafter(x, -math.inf)
+            hs.append(x)
+    for h in hs:
+        got = clamp_angle_pi(float(h))
+        assert -math.pi <= got < math.pi
+        assert math.isclose(got, _clamp_angle_pi_remainder(float(h)), rel_tol=0.0, abs_tol=1e-15)
+
+
+def test_mix_and_reachability_share_one_kernel():
+    from cgir.core.mixing import InputWeight, mix_oklab, reachable_convex_given_weights
+
+    id2ok = {"n1": (0.5, 0.1, 0.1), "n2": (0.7, -0.1, 0.0), "n3": (0.6, 0.0, -0.05)}
+    inputs = [InputWeight("n3", 2.0), InputWeight("n1", 1.0), InputWeight("n2", 1.0)]
+    mixed = mix_oklab(id2ok, inputs)
+    assert mixed == (0.6, 0.0, 0.0)
+    assert reachable_convex_given_weights(mixed, id2ok, inputs, tol=1e-12)
+    assert not reachable_convex_given_weights((0.6, 0.0, 0.01), id2ok, inputs)
+    # One-shot iterables are accepted as well
+    assert mix_oklab(id2ok, (iw for iw in inputs)) == mixed
+    assert reachable_convex_given_weights(mixed, id2ok, iter(inputs), tol=1e-12)
+
+
+def test_mix_small_and_large_fan_in_paths_agree(monkeypatch):
+    from cgir.core import mixing
+    from cgir.core.mixing import InputWeight, mix_oklab
+
+    rng = np.random.default_rng(3)
+    for n in (1, 3, mixing.MIX_NUMPY_MIN + 5):
+        ids = [f"n{i}" for i in range(n)]
+        id2ok = {nid: tuple(rng.uniform(-0.3, 0.9, size=3).tolist()) for nid in ids}
+        weights = rng.uniform(-0.2, 1.0, size=n).tolist()
+        weights[0] = float("nan")  # clamped to 0.0 like the other nonpositive weights
+        inputs = [InputWeight(nid, w) for nid, w in zip(ids, weights)]
+        results = []
+        for threshold in (0, 10**9):  # NumPy path, then pure-Python path
+            monkeypatch.setattr(mixing, "MIX_NUMPY_MIN", threshold)
+            results.append((mixing._mix_inputs(id2ok, inputs), mix_oklab(id2ok, inputs)))
+        assert results[0] == results[1]
+
+
+def test_cmax_ok_v1_batch_matches_scalar():
+    from cgir.core.droplet import cmax_ok_v1, cmax_ok_v1_batch
+
+    hs = np.linspace(-math.pi, math.pi, num=720, endpoint=False)
+    for L in (0.0, 0.3, 0.5, 0.65, 1.0):
+        batch = cmax_ok_v1_batch(L, hs)
+        assert batch.dtype == np.float64 and batch.shape == hs.shape
+        for h, v in zip(hs, batch):
+            assert math.isclose(v, cmax_ok_v1(L, float(h)), rel_tol=0.0, abs_tol=1e-15)
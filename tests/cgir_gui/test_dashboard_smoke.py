@@ -80,4 +80,44 @@ def test_dashboard_stats(monkeypatch, tmp_path):
         # Last run should reflect exit code 0
         assert "exit 0" in w.lbl_last_run.text()
     finally:
-        w.deleteLater()
\ No newline at end of file
+        w.deleteLater()
+
+def test_dashboard_counts_track_nested_changes(monkeypatch, tmp_path):
+    app = QApplication.instance() or QApplication([])
+
+    repo_dir = tmp_path / "repo"
+    examples_dir = repo_dir / "examples" / "cgir"
+    nested = examples_dir / "nested"
+    nested.mkdir(parents=True, exist_ok=True)
+    (examples_dir / "a.json").write_text("{}\n", encoding="utf-8")
+
+    class _Params:
+        def __init__(self, out_dir: str) -> None:
+            self.out_dir = out_dir
+
+    class _WS:
+        def __init__(self, last_opened_dir: str, out_dir: str) -> None:
+            self.last_opened_dir = last_opened_dir
+            self.params = _Params(out_dir)
+            self.recent_files = []
+
+    ws = _WS(str(examples_dir), str(repo_dir / "build" / "cgir"))
+    monkeypatch.setattr(dashboard_module, "load_workspace", lambda: ws)
+    monkeypatch.setattr(dashboard_module, "repo_root", lambda: repo_dir)
+
+    w = DashboardWidget(on_open_file=None)
+    try:
+        w.refresh()
+        assert int(w.lbl_examples_count.text()) == 1
+
+        # Adding a file in a subdirectory does not bump the parent's mtime;
+        # the per-directory cache must still pick it up.
+        (nested / "b.json").write_text("{}\n", encoding="utf-8")
+        w.refresh()
+        assert int(w.lbl_examples_count.text()) == 2
+
+        (examples_dir / "a.json").unlink()
+        w.refresh()
+        assert int(w.lbl_examples_count.text()) == 1
+    finally:
+        w.deleteLater()
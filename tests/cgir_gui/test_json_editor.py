@@ -0,0 +1,303 @@
+# pylint: disable=import-error,no-name-in-module
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+# Headless Qt
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Ensure repo root is importable
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PySide6.QtWidgets import QApplication  # type: ignore
+
+from tools.cgir_gui.json_editor import JsonEditorWidget  # type: ignore
+
+SCHEMA_PATH = REPO_ROOT / "docs" / "ir" / "cgir-schema.json"
+EXAMPLE = REPO_ROOT / "examples" / "cgir" / "trace_snn_mix.json"
+
+
+def test_json_editor_validates_and_shares_parse():
+    app = QApplication.instance() or QApplication([])
+
+    w = JsonEditorWidget(None, schema_path=str(SCHEMA_PATH))
+    try:
+        w.load_file(EXAMPLE)
+        w._validate_now()
+        assert w.lbl_status.text() == "Valid JSON (schema OK)"
+        assert w.diag_list.count() == 0
+
+        # parsed() reuses the parse done by validation for the same text
+        first = w.parsed()
+        assert first is not None and first is w.parsed()
+
+        # text() is read from the widget once per revision
+        assert w.text() is w.text()
+
+        w.set_text('{"cgir_version": ')
+        assert w.text() == '{"cgir_version": '
+        w._validate_now()
+        assert w.lbl_status.text() == "Invalid JSON"
+        assert w.parsed() is None
+        assert w.diag_list.count() == 1
+    finally:
+        w.deleteLater()
+
+
+def test_json_editor_skips_unchanged_text():
+    app = QApplication.instance() or QApplication([])
+
+    w = JsonEditorWidget(None, schema_path=str(SCHEMA_PATH))
+    try:
+        w.set_text('{"cgir_version": 1}')
+        w._validate_now()
+        assert w.diag_list.count() == 1
+
+        # Same text: the debounced pass is a no-op, an explicit request still runs
+        w.diag_list.clear()
+        w._validate_now()
+        assert w.diag_list.count() == 0
+        w._validate_now(force=True)
+        assert w.diag_list.count() == 1
+    finally:
+        w.deleteLater()
+
+
+def test_json_editor_validates_large_documents_off_thread():
+    import json
+
+    from PySide6.QtCore import QThreadPool  # type: ignore
+
+    import tools.cgir_gui.json_editor as json_editor_module  # type: ignore
+
+    app = QApplication.instance() or QApplication([])
+
+    w = JsonEditorWidget(None, schema_path=str(SCHEMA_PATH))
+    try:
+        doc = {"cgir_version": 1, "notes": "x" * json_editor_module._ASYNC_MIN_CHARS}
+        w.set_text(json.dumps(doc))
+        w._validate_now()
+        assert w.lbl_status.text() == "Validating…"
+
+        QThreadPool.globalInstance().waitForDone(10000)
+        app.processEvents()
+        assert w.lbl_status.text().startswith("Schema invalid")
+        assert w.diag_list.count() >= 1
+        # The worker's parse is reused by parsed()
+        assert w.parsed() is w.parsed() and w.parsed()["cgir_version"] == 1
+    finally:
+        w.deleteLater()
+
+
+def test_json_editor_destroyed_mid_validation_drops_the_result(monkeypatch):
+    import json
+    import threading
+
+    from PySide6.QtCore import QEvent, QThreadPool, Qt  # type: ignore
+
+    import tools.cgir_gui.json_editor as json_editor_module  # type: ignore
+
+    app = QApplication.instance() or QApplication([])
+    started, release = threading.Event(), threading.Event()
+    real_check = json_editor_module._check_text
+
+    def _slow_check(*args, **kwargs):
+        started.set()
+        release.wait(5)
+        return real_check(*args, **kwargs)
+
+    monkeypatch.setattr(json_editor_module, "_check_text", _slow_check)
+    w = JsonEditorWidget(None, schema_path=str(SCHEMA_PATH))
+    signals = w._validate_signals
+    delivered = []
+    signals.done.connect(lambda *args: delivered.append(args), Qt.DirectConnection)
+    w.set_text(json.dumps({"notes": "x" * json_editor_module._ASYNC_MIN_CHARS}))
+    w._validate_now()
+    assert started.wait(5)
+    cancel = signals.inflight
+    w.deleteLater()
+    app.sendPostedEvents(None, QEvent.DeferredDelete)
+    assert signals.closed.is_set() and cancel.is_set()
+    release.set()
+    assert QThreadPool.globalInstance().waitForDone(10000)
+    app.processEvents()
+    assert delivered == []
+
+
+def test_json_editor_save_replaces_file(tmp_path):
+    app = QApplication.instance() or QApplication([])
+
+    target = tmp_path / "doc.json"
+    target.write_text('{"old": true}', encoding="utf-8")
+    target.chmod(0o640)
+    w = JsonEditorWidget(None, schema_path=str(SCHEMA_PATH))
+    try:
+        w.load_file(target)
+        w.set_text('{"a": [1, 2]}')
+        w._on_save()
+        assert target.read_text(encoding="utf-8") == '{\n  "a": [\n    1,\n    2\n  ]\n}\n'
+        assert [p.name for p in tmp_path.iterdir()] == ["doc.json"]
+        # The replacement keeps the original file's permissions
+        assert target.stat().st_mode & 0o777 == 0o640
+        assert not w.is_modified()
+    finally:
+        w.deleteLater()
+
+
+def test_json_editor_save_and_format_keep_big_integers(tmp_path):
+    app = QApplication.instance() or QApplication([])
+
+    target = tmp_path / "doc.json"
+    target.write_text("{}", encoding="utf-8")
+    w = JsonEditorWidget(None, schema_path=str(SCHEMA_PATH))
+    try:
+        w.load_file(target)
+        w.set_text('{"id": 123456789012345678901234567890, "low": -9223372036854775809, "x": NaN}')
+        w._on_format()
+        assert w.text() == (
+            '{\n  "id": 123456789012345678901234567890,\n  "low": -9223372036854775809,\n  "x": NaN\n}'
+        )
+        w._on_save()
+        assert target.read_text(encoding="utf-8") == w.text() + "\n"
+    finally:
+        w.deleteLater()
+
+
+def test_json_editor_revalidates_only_changed_keys(monkeypatch):
+    import json
+
+    import tools.cgir_gui.json_editor as json_editor_module  # type: ignore
+
+    app = QApplication.instance() or QApplication([])
+
+    w = JsonEditorWidget(None, schema_path=str(SCHEMA_PATH))
+    try:
+        span_scans = []
+        real_spans = json_editor_module._top_level_spans
+        monkeypatch.setattr(
+            json_editor_module, "_top_level_spans", lambda t: span_scans.append(t) or real_spans(t)
+        )
+        doc = json.loads(EXAMPLE.read_text(encoding="utf-8"))
+        w.set_text(json.dumps(doc))
+        w._validate_now()
+        assert w.lbl_status.text() == "Valid JSON (schema OK)"
+        # The full pass parses the document once; value spans wait for an edit
+        assert span_scans == []
+
+        # The edit falls inside "neurons": no whole-document pass may run
+        def _no_full_pass(*a, **k):
+            raise AssertionError("full validation pass")
+
+        monkeypatch.setattr(json_editor_module, "_validate_full", _no_full_pass)
+        doc["neurons"][0]["bogus"] = 1
+        w.set_text(json.dumps(doc))
+        w._validate_now()
+        incremental = [w.diag_list.item(i).text() for i in range(w.diag_list.count())]
+        assert incremental and all(d.startswith("$.neurons.0") for d in incremental)
+        # Spans were found once, for the baseline text; later edits shift them
+        assert len(span_scans) == 1
+        doc["neurons"][0]["bogus"] = 22
+        w.set_text(json.dumps(doc))
+        w._validate_now()
+        assert len(span_scans) == 1
+        monkeypatch.undo()
+
+        # An edit between top-level values is not scoped to one key
+        calls = []
+        real_full = json_editor_module._validate_full
+        monkeypatch.setattr(
+            json_editor_module, "_validate_full", lambda *a, **k: calls.append(1) or real_full(*a, **k)
+        )
+        w.set_text(" " + w.text())
+        w._validate_now()
+        assert calls == [1]
+        assert sorted(w.diag_list.item(i).text() for i in range(w.diag_list.count())) == sorted(incremental)
+        monkeypatch.undo()
+
+        w._validate_now(force=True)
+        full = [w.diag_list.item(i).text() for i in range(w.diag_list.count())]
+        assert sorted(incremental) == sorted(full)
+    finally:
+        w.deleteLater()
+
+
+def test_scoped_validation_falls_back_on_root_relative_refs(tmp_path):
+    import json
+
+    import tools.cgir_gui.json_editor as json_editor_module  # type: ignore
+
+    # "$ref": "#" means the document root: a per-key schema would resolve it to itself
+    schema = {
+        "type": "object",
+        "properties": {"a": {"type": "integer"}, "self": {"$ref": "#"}},
+        "additionalProperties": False,
+    }
+    path = tmp_path / "recursive.schema.json"
+    path.write_text(json.dumps(schema), encoding="utf-8")
+    key = (str(path), path.stat().st_mtime_ns)
+    assert json_editor_module._get_key_validator(*key, "self") is None
+    assert json_editor_module._get_stream_plan(*key) is None
+    # Refs into the carried $defs keep the per-key path for the repo schema
+    mtime_ns = SCHEMA_PATH.stat().st_mtime_ns
+    assert json_editor_module._get_key_validator(str(SCHEMA_PATH), mtime_ns, "neurons") is not None
+    # A subschema's own $defs would shadow the root's
+    assert json_editor_module._scoped_schema({"$defs": {}}, {"$defs": {}, "$ref": "#/$defs/x"}) is None
+
+    app = QApplication.instance() or QApplication([])
+    w = JsonEditorWidget(None, schema_path=str(path))
+    try:
+        w.set_text('{"a": 1, "self": {"a": 2}}')
+        w._validate_now()
+        assert w.lbl_status.text() == "Valid JSON (schema OK)"
+        # Changing one key still reports what the root schema says about it
+        w.set_text('{"a": 1, "self": {"a": 2, "bogus": 3}}')
+        w._validate_now()
+        diags = [w.diag_list.item(i).text() for i in range(w.diag_list.count())]
+        assert len(diags) == 1 and diags[0].startswith("$.self")
+    finally:
+        w.deleteLater()
+
+
+def test_json_editor_format_is_noop_when_formatted():
+    app = QApplication.instance() or QApplication([])
+
+    w = JsonEditorWidget(None, schema_path=str(SCHEMA_PATH))
+    try:
+        w.set_text('{"a":[1,2]}')
+        w._on_format()
+        assert w.lbl_status.text() == "Formatted JSON"
+        formatted = w.text()
+
+        w._on_format()
+        assert w.lbl_status.text() == "Already formatted"
+        assert w.text() is formatted
+    finally:
+        w.deleteLater()
+
+
+def test_stream_check_matches_full_parse():
+    import json
+
+    import pytest
+
+    pytest.importorskip("ijson")
+    import tools.cgir_gui.json_editor as json_editor_module  # type: ignore
+
+    mtime_ns = SCHEMA_PATH.stat().st_mtime_ns
+    validator, _schema = json_editor_module._get_validator(str(SCHEMA_PATH), mtime_ns)
+    plan = json_editor_module._get_stream_plan(str(SCHEMA_PATH), mtime_ns)
+    assert plan is not None and "events" in plan
+
+    doc = json.loads(EXAMPLE.read_text(encoding="utf-8"))
+    doc["events"] = doc["events"] * 3 + [5]
+    doc["neurons"][0]["bogus"] = 1
+    del doc["cgir_version"]
+    for text in (EXAMPLE.read_text(encoding="utf-8"), json.dumps(doc), "[1, 2]"):
+        streamed = json_editor_module._stream_check_text(text, validator, plan)
+        full = json_editor_module._check_text(text, validator, json.loads)
+        assert streamed.status == full.status
+        assert sorted(streamed.diags) == sorted(full.diags)
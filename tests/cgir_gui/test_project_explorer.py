@@ -49,4 +49,105 @@ def test_project_explorer_smoke(tmp_path):
         sel = w.selected_path()
         assert sel is not None and sel.name == "a.json"
     finally:
-        w.deleteLater()
\ No newline at end of file
+        w.deleteLater()
+
+def test_project_explorer_lists_directories_lazily(tmp_path):
+    app = QApplication.instance() or QApplication([])
+
+    sub = tmp_path / "Sub"
+    sub.mkdir()
+    (sub / "deep.json").write_text("{}", encoding="utf-8")
+    (sub / "skip.txt").write_text("", encoding="utf-8")
+    (tmp_path / "a.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "Z.json").write_text("{}", encoding="utf-8")
+
+    w = ProjectExplorer(None)
+    try:
+        w.set_root(str(tmp_path))
+        model = w.model
+        model.fetchMore(w.tree.rootIndex())
+        names = [model.index(r, 0, w.tree.rootIndex()).data() for r in range(model.rowCount(w.tree.rootIndex()))]
+        # Directories first, then files case-insensitively; non-JSON files hidden
+        assert names == ["Sub", "a.json", "Z.json"]
+
+        sub_idx = model.index(0, 0, w.tree.rootIndex())
+        assert model.hasChildren(sub_idx) and model.canFetchMore(sub_idx)
+        assert model.rowCount(sub_idx) == 0
+
+        deep = model.index(str(sub / "deep.json"))
+        assert deep.isValid() and model.parent(deep) == sub_idx
+        assert model.rowCount(sub_idx) == 1
+        assert model.filePath(deep) == str(sub / "deep.json")
+        assert not model.index(str(sub / "skip.txt")).isValid()
+        # Entries arrive pre-sorted from the model; the view does not sort again
+        assert not w.tree.isSortingEnabled()
+    finally:
+        w.deleteLater()
+
+
+def test_project_explorer_picks_up_directory_changes(tmp_path):
+    app = QApplication.instance() or QApplication([])
+
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    (sub / "keep.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "b.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "gone.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "loop").symlink_to(tmp_path, target_is_directory=True)
+
+    w = ProjectExplorer(None)
+    try:
+        w.set_root(str(tmp_path))
+        model, root = w.model, w.tree.rootIndex()
+        names = lambda: [model.index(r, 0, root).data() for r in range(model.rowCount(root))]  # noqa: E731
+        model.fetchMore(root)
+        assert names() == ["loop", "sub", "b.json", "gone.json"]
+        # Symlinked directories are listed but not followed (a cycle would expand forever)
+        loop = model.index(str(tmp_path / "loop"))
+        assert loop.isValid() and not model.hasChildren(loop) and not model.canFetchMore(loop)
+        assert not model.index(str(tmp_path / "loop" / "b.json")).isValid()
+        keep = model.index(str(sub / "keep.json"))
+        assert not model.canFetchMore(root)
+
+        (tmp_path / "gone.json").unlink()
+        (tmp_path / "a.json").write_text("{}", encoding="utf-8")
+        (tmp_path / "new_dir").mkdir()
+        os.utime(tmp_path, ns=(0, os.stat(tmp_path).st_mtime_ns + 10**9))
+        assert model.canFetchMore(root)
+        model.fetchMore(root)
+        assert names() == ["loop", "new_dir", "sub", "a.json", "b.json"]
+        assert not model.canFetchMore(root)
+        # Unchanged subtrees survive, with their rows renumbered
+        sub_idx = model.index(str(sub))
+        assert sub_idx.row() == 2 and model.rowCount(sub_idx) == 1 and model.parent(keep) == sub_idx
+
+        (sub / "more.json").write_text("{}", encoding="utf-8")
+        os.utime(sub, ns=(0, os.stat(sub).st_mtime_ns + 10**9))
+        w.refresh()
+        assert [model.index(r, 0, sub_idx).data() for r in range(model.rowCount(sub_idx))] == ["keep.json", "more.json"]
+    finally:
+        w.deleteLater()
+
+
+def test_project_explorer_watches_an_opened_folder(tmp_path):
+    import time
+
+    app = QApplication.instance() or QApplication([])
+
+    (tmp_path / "a.json").write_text("{}", encoding="utf-8")
+    w = ProjectExplorer(None)
+    try:
+        # An arbitrary folder, outside the directories the main window watches
+        w.set_root(str(tmp_path))
+        model, root = w.model, w.tree.rootIndex()
+        model.fetchMore(root)
+        assert model.rowCount(root) == 1
+
+        (tmp_path / "b.json").write_text("{}", encoding="utf-8")
+        deadline = time.monotonic() + 5
+        while model.rowCount(root) < 2 and time.monotonic() < deadline:
+            app.processEvents()
+            time.sleep(0.01)
+        assert [model.index(r, 0, root).data() for r in range(model.rowCount(root))] == ["a.json", "b.json"]
+    finally:
+        w.deleteLater()
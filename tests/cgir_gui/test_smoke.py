@@ -43,6 +43,9 @@ def test_process_controller_runs_python_echo(tmp_path):
     def _on_finished(res):
         done["result"] = res
 
+    chunks: list[str] = []
+    pc.output.connect(chunks.append)
+
     loop = QEventLoop()
     pc.finished.connect(lambda res: (_on_finished(res), loop.quit()))
 
@@ -61,6 +64,250 @@ def test_process_controller_runs_python_echo(tmp_path):
     assert done["result"] is not None, "Process did not finish"
     res = done["result"]
     exit_code = int(getattr(res, "exit_code", -1))
-    stdout = str(getattr(res, "stdout", ""))
     assert exit_code == 0
-    assert "ok" in stdout
\ No newline at end of file
+    # Output is read back from the run log on demand, without the log header
+    assert res.stdout is None
+    assert res.read_stdout().strip() == "ok"
+    assert res.read_stdout(max_bytes=3).strip() == "ok"
+    assert "".join(chunks).strip() == "ok"
+
+def test_run_meta_writer_batches_until_flush(tmp_path):
+    import json
+
+    from tools.cgir_gui.io_pool import wait_for_io  # type: ignore
+    from tools.cgir_gui.process_controller import RunMetaWriter  # type: ignore
+
+    app = QApplication.instance() or QApplication([])
+
+    writer = RunMetaWriter(interval_ms=60000)
+    writer.submit(tmp_path / "a.json", {"exit_code": 0, "cmd": ["é"]})
+    writer.submit(tmp_path / "b.json", {"exit_code": 1})
+    assert list(tmp_path.iterdir()) == []
+
+    writer.flush()
+    wait_for_io()
+    assert json.loads((tmp_path / "a.json").read_text(encoding="utf-8")) == {"exit_code": 0, "cmd": ["é"]}
+    assert json.loads((tmp_path / "b.json").read_text(encoding="utf-8"))["exit_code"] == 1
+
+def test_buffered_log_flushes_by_size(tmp_path):
+    from tools.cgir_gui.process_controller import _BufferedLog  # type: ignore
+
+    path = tmp_path / "run.log"
+    log = _BufferedLog(path, max_bytes=8)
+    log.write(b"abc")
+    assert path.read_bytes() == b""
+    log.write(b"defghi")
+    assert path.read_bytes() == b"abcdefghi"
+    log.write(b"j")
+    log.close()
+    assert path.read_bytes() == b"abcdefghij"
+
+def test_process_controller_flushes_log_while_output_pauses():
+    app = QApplication.instance() or QApplication([])
+
+    pc = ProcessController()
+    try:
+        pc.run(
+            [sys.executable, "-c", "import time; print('early', flush=True); time.sleep(30)"],
+            workdir=REPO_ROOT,
+        )
+        log_path = pc._log_path
+        loop = QEventLoop()
+        QTimer.singleShot(1500, loop.quit)
+        loop.exec()
+        # Still running and quiet: what it printed is already in the log
+        assert pc._proc is not None
+        assert b"early" in log_path.read_bytes()
+    finally:
+        loop = QEventLoop()
+        pc.finished.connect(loop.quit)
+        QTimer.singleShot(10000, loop.quit)
+        pc.terminate()
+        loop.exec()
+
+def test_process_controller_reuses_timers():
+    app = QApplication.instance() or QApplication([])
+
+    pc = ProcessController()
+    timers = (pc._timeout_timer, pc._kill_timer)
+    timeouts: list[bool] = []
+    pc.timeout.connect(lambda: timeouts.append(True))
+
+    codes: list[int] = []
+    for script, timeout_ms in (("import time; time.sleep(30)", 200), ("print('ok')", 10000)):
+        loop = QEventLoop()
+        pc.finished.connect(loop.quit)
+        QTimer.singleShot(10000, loop.quit)
+        pc.run([sys.executable, "-c", script], workdir=REPO_ROOT, on_finish=codes.append, timeout_ms=timeout_ms)
+        loop.exec()
+        pc.finished.disconnect(loop.quit)
+
+    assert timeouts == [True] and len(codes) == 2 and codes[1] == 0
+    assert (pc._timeout_timer, pc._kill_timer) == timers
+    assert not pc._timeout_timer.isActive() and not pc._kill_timer.isActive()
+
+
+def test_process_controller_kill_grace_is_clamped():
+    app = QApplication.instance() or QApplication([])
+
+    assert ProcessController()._kill_grace_ms == 2000
+    assert ProcessController(kill_grace_ms=0)._kill_grace_ms == 1
+    assert ProcessController(kill_grace_ms=10**9)._kill_grace_ms == 59_999
+
+
+def test_process_controller_kill_grace_is_bounded_by_timeout():
+    app = QApplication.instance() or QApplication([])
+
+    pc = ProcessController(kill_grace_ms=30_000)
+    loop = QEventLoop()
+    pc.finished.connect(loop.quit)
+    QTimer.singleShot(10000, loop.quit)
+    pc.run([sys.executable, "-c", "import time; time.sleep(30)"], workdir=REPO_ROOT, timeout_ms=5000)
+    try:
+        # Never longer than the timeout itself
+        assert pc._kill_grace_ms == 5000
+        # Terminated early: the kill is due no later than the timeout was
+        pc.terminate()
+        assert not pc._timeout_timer.isActive()
+        assert pc._kill_timer.isActive() and pc._kill_timer.interval() <= 5000
+    finally:
+        loop.exec()
+    assert not pc._kill_timer.isActive()
+
+
+def test_process_controller_coalesces_output():
+    app = QApplication.instance() or QApplication([])
+
+    pc = ProcessController()
+    chunks: list[str] = []
+    pc.output.connect(chunks.append)
+    for raw in (b"a\n", b"\xc3", b"\xa9\n"):
+        pc._handle_output(raw)
+    assert chunks == [] and pc._out_timer.isActive()
+
+    loop = QEventLoop()
+    pc.output.connect(loop.quit)
+    QTimer.singleShot(5000, loop.quit)
+    loop.exec()
+    assert chunks == ["a\né\n"] and not pc._out_timer.isActive()
+
+
+def test_editor_tabs_reused_and_capped(monkeypatch, tmp_path):
+    import tools.cgir_gui.main_window as main_window_module  # type: ignore
+
+    app = QApplication.instance() or QApplication([])
+    # Keep the test from touching the repo's .cgir/workspace.json
+    monkeypatch.setattr(main_window_module, "write_workspace_bytes", lambda *a, **k: None)
+
+    win = MainWindow()
+    try:
+        base_tabs = win.tabs.count()
+        paths = []
+        for i in range(main_window_module.MAX_EDITOR_TABS + 3):
+            p = tmp_path / f"f{i}.json"
+            p.write_text("{}", encoding="utf-8")
+            paths.append(p)
+            win.open_in_editor(p)
+        assert win.tabs.count() == base_tabs + main_window_module.MAX_EDITOR_TABS
+
+        # Reopening an open file switches to its tab instead of adding one
+        win.open_in_editor(paths[-1])
+        assert win.tabs.count() == base_tabs + main_window_module.MAX_EDITOR_TABS
+        assert win.tabs.tabText(win.tabs.currentIndex()) == paths[-1].name
+
+        win.show_dashboard()
+        assert win.tabs.currentWidget() is win.dashboard
+        # Reordering tabs keeps show_dashboard pointed at the dashboard
+        win.tabs.tabBar().moveTab(win.tabs.indexOf(win.dashboard), win.tabs.count() - 1)
+        win.tabs.setCurrentIndex(0)
+        win.show_dashboard()
+        assert win.tabs.currentWidget() is win.dashboard
+    finally:
+        win.close()
+
+
+def test_editor_over_cap_with_modified_tabs_still_opens(monkeypatch, tmp_path):
+    import tools.cgir_gui.main_window as main_window_module  # type: ignore
+
+    app = QApplication.instance() or QApplication([])
+    monkeypatch.setattr(main_window_module, "write_workspace_bytes", lambda *a, **k: None)
+
+    win = MainWindow()
+    try:
+        base_tabs = win.tabs.count()
+        for i in range(main_window_module.MAX_EDITOR_TABS):
+            p = tmp_path / f"f{i}.json"
+            p.write_text("{}", encoding="utf-8")
+            win.open_in_editor(p)
+            win.tabs.currentWidget().editor.document().setModified(True)
+
+        # Every other editor has unsaved changes: the new one must not be the victim
+        extra = tmp_path / "extra.json"
+        extra.write_text("{}", encoding="utf-8")
+        win.open_in_editor(extra)
+        assert win.tabs.count() == base_tabs + main_window_module.MAX_EDITOR_TABS + 1
+        assert win.tabs.tabText(win.tabs.currentIndex()) == extra.name
+        assert extra.resolve() in win._editors_by_path
+    finally:
+        for ed in win._editors_by_path.values():
+            ed.editor.document().setModified(False)
+        win.close()
+
+
+def test_fs_refresh_is_throttled(monkeypatch):
+    import tools.cgir_gui.main_window as main_window_module  # type: ignore
+
+    app = QApplication.instance() or QApplication([])
+    monkeypatch.setattr(main_window_module, "write_workspace_bytes", lambda *a, **k: None)
+
+    win = MainWindow()
+    try:
+        calls = []
+        monkeypatch.setattr(win.dashboard, "refresh", lambda: calls.append(1))
+        for _ in range(50):
+            win._on_fs_changed("x")
+        # Leading refresh only; the burst is coalesced into one trailing refresh
+        assert len(calls) == 1
+        win._refresh_timer.stop()
+        win._on_refresh_cooldown()
+        assert len(calls) == 2
+        win._refresh_timer.stop()
+        win._on_refresh_cooldown()
+        assert len(calls) == 2
+    finally:
+        win.close()
+
+
+def test_workspace_saves_are_coalesced(monkeypatch):
+    import tools.cgir_gui.main_window as main_window_module  # type: ignore
+
+    app = QApplication.instance() or QApplication([])
+    import json
+
+    from tools.cgir_gui.io_pool import wait_for_io  # type: ignore
+
+    saves = []
+    monkeypatch.setattr(
+        main_window_module, "write_workspace_bytes", lambda data, *a, **k: saves.append(json.loads(data)["params"]["dp"])
+    )
+
+    win = MainWindow()
+    try:
+        targets = (1, 2, 3) if win.params_panel.spin_dp.value() > 3 else (4, 5, 6)
+        for dp in targets:
+            win.params_panel.spin_dp.setValue(dp)
+        assert saves == [] and win._ws_save_timer.isActive()
+
+        win._flush_ws()
+        # Written on the I/O thread
+        wait_for_io()
+        assert saves == [targets[-1]]
+        # Nothing changed since the last write: no second write
+        win._update_ws_params()
+        win._flush_ws()
+        wait_for_io()
+        assert saves == [targets[-1]]
+    finally:
+        win.close()
+    wait_for_io()
+    assert saves == [targets[-1]]
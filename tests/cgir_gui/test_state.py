@@ -0,0 +1,111 @@
+# pylint: disable=import-error
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+# Ensure repo root is importable
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from tools.cgir_gui.state import (  # type: ignore
+    WorkspaceState,
+    load_workspace,
+    save_workspace,
+    update_last_opened,
+    update_params,
+    workspace_file,
+    write_atomic,
+    write_workspace_bytes,
+)
+
+
+def test_workspace_round_trip(tmp_path):
+    ws = WorkspaceState()
+    ws = update_params(ws, schema="s.json", dp=7, out_dir="out")
+    ws = update_last_opened(ws, directory="d", file="é.json")
+    ws.panel_layout.docks = {"left": {"visible": True}}
+    save_workspace(ws, root=tmp_path)
+
+    raw = workspace_file(tmp_path).read_text(encoding="utf-8")
+    assert raw.endswith("}\n") and "é.json" in raw
+    assert json.loads(raw)["params"] == {"schema": "s.json", "dp": 7, "out_dir": "out"}
+
+    loaded = load_workspace(root=tmp_path)
+    assert loaded.params.dp == 7 and loaded.params.schema == "s.json"
+    assert loaded.last_opened_dir == "d" and loaded.last_opened_file == "é.json"
+    assert loaded.recent_files == ["é.json"]
+    assert loaded.panel_layout.docks == {"left": {"visible": True}}
+
+
+def test_workspace_save_leaves_no_temp_file(tmp_path):
+    save_workspace(WorkspaceState(), root=tmp_path)
+    save_workspace(update_params(WorkspaceState(), dp=3), root=tmp_path)
+    assert [p.name for p in workspace_file(tmp_path).parent.iterdir()] == ["workspace.json"]
+    assert load_workspace(root=tmp_path).params.dp == 3
+
+
+def test_concurrent_workspace_writes_do_not_share_a_temp_file(tmp_path):
+    import threading
+
+    payloads = [json.dumps({"version": 1, "n": i, "pad": "x" * 50_000}).encode() for i in range(8)]
+    errors = []
+
+    def write(data):
+        try:
+            for _ in range(10):
+                write_workspace_bytes(data, root=tmp_path)
+        except Exception as e:  # pragma: no cover - the failure being guarded against
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(d,)) for d in payloads]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    # Whichever write landed last, the file holds one complete payload
+    assert workspace_file(tmp_path).read_bytes() in payloads
+    assert [p.name for p in workspace_file(tmp_path).parent.iterdir()] == ["workspace.json"]
+
+
+def test_write_atomic_keeps_file_mode(tmp_path):
+    import os
+    import stat
+
+    p = tmp_path / "x.json"
+    write_atomic(p, b"{}")
+    umask = os.umask(0)
+    os.umask(umask)
+    assert stat.S_IMODE(p.stat().st_mode) == 0o666 & ~umask
+    p.chmod(0o640)
+    write_atomic(p, b"[]")
+    assert p.read_bytes() == b"[]" and stat.S_IMODE(p.stat().st_mode) == 0o640
+
+
+def test_write_atomic_writes_through_links(tmp_path):
+    import os
+
+    target = tmp_path / "real.json"
+    target.write_bytes(b"{}")
+    link = tmp_path / "link.json"
+    link.symlink_to(target)
+    write_atomic(link, b"[1]")
+    assert link.is_symlink() and target.read_bytes() == b"[1]"
+
+    hard = tmp_path / "hard.json"
+    os.link(target, hard)
+    write_atomic(target, b"[2]")
+    assert hard.read_bytes() == b"[2]" and os.path.samefile(hard, target)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["hard.json", "link.json", "real.json"]
+
+
+def test_recent_files_moves_reopened_file_to_front():
+    ws = WorkspaceState(recent_files=[f"f{i}" for i in range(20)])
+    update_last_opened(ws, file="f5")
+    assert ws.recent_files[:2] == ["f5", "f0"] and len(ws.recent_files) == 20
+    update_last_opened(ws, file="new")
+    assert ws.recent_files[:2] == ["new", "f5"] and "f19" not in ws.recent_files
+    assert len(ws.recent_files) == len(set(ws.recent_files)) == 20
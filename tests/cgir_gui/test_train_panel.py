@@ -0,0 +1,197 @@
+# pylint: disable=import-error,no-name-in-module
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+
+# Headless Qt
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Ensure repo root is importable
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import numpy as np  # type: ignore
+from PySide6.QtCore import QEvent, QEventLoop, Qt, QTimer  # type: ignore
+from PySide6.QtWidgets import QApplication  # type: ignore
+
+from tools.cgir_gui import train_panel  # type: ignore
+from tools.cgir_gui.train_panel import TrainPanel  # type: ignore
+
+
+def _write_attrib(path: Path) -> None:
+    events = [
+        {
+            "index": 0,
+            "target_ok": {"L": 0.5, "a": 0.1, "b": 0.0},
+            "alphas": [{"id": "n0", "alpha": 0.75}, {"id": "n1", "alpha": 0.25}],
+            "residual_norm": 1.5e-7,
+            "sum_alpha_before_norm": 1.0,
+            "normalized": True,
+        },
+        {"index": 1, "error": "singular"},
+    ]
+    path.write_text(json.dumps({"events": events}), encoding="utf-8")
+
+
+def _load(w: TrainPanel, path: Path) -> None:
+    """Load an attribution file and wait for the background parse to be applied."""
+    loop = QEventLoop()
+    w.attribs_loaded.connect(loop.quit)
+    w._loader_signals.failed.connect(loop.quit)
+    QTimer.singleShot(5000, loop.quit)
+    w._load_attrib_file(path)
+    loop.exec()
+    w.attribs_loaded.disconnect(loop.quit)
+    w._loader_signals.failed.disconnect(loop.quit)
+
+
+def test_train_panel_table_is_model_backed(monkeypatch, tmp_path):
+    app = QApplication.instance() or QApplication([])
+    errors = []
+    monkeypatch.setattr(train_panel.QMessageBox, "critical", lambda *args: errors.append(args[-1]))
+
+    path = tmp_path / "x_attrib.json"
+    _write_attrib(path)
+
+    w = TrainPanel(None)
+    try:
+        _load(w, path)
+        assert errors == []
+        model = w.table.model()
+        assert model.rowCount() == 2 and model.columnCount() == 4
+        assert [model.headerData(c, Qt.Horizontal) for c in range(4)] == list(train_panel.AttribEventsModel.HEADERS)
+        assert [model.index(0, c).data() for c in range(4)] == ["0", "1.5e-07", "true", "1"]
+        assert model.index(1, 1).data() == "error"
+        # Cells are read from one structured array of the event scalars
+        assert model._table.dtype == train_panel._EVENT_TABLE_DTYPE and model._table["error"].tolist() == [False, True]
+        assert not hasattr(w._events[0], "__dict__")
+        assert model.index(0, 0).data(Qt.ForegroundRole) is None
+        assert model.index(1, 0).data(Qt.ForegroundRole) is not None
+
+        ev = w._events[0]
+        assert ev.alpha_ids == ("n0", "n1") and ev.alpha_vals.dtype == np.float32
+        assert ev.alpha_vals.tolist() == [0.75, 0.25]
+        assert [p.get_height() for p in w.figure.axes[0].patches] == [0.75, 0.25]
+
+        # Selecting a row plots that event
+        ax = w.figure.axes[0]
+        w.table.selectRow(1)
+        # Same axes, cleared and redrawn
+        assert w.figure.axes == [ax] and not ax.patches
+        assert "Error: singular" in [t.get_text() for t in ax.texts]
+
+        w._clear_table()
+        assert model.rowCount() == 0
+    finally:
+        w.deleteLater()
+
+
+def test_train_panel_streams_large_attrib_files(monkeypatch, tmp_path):
+    import pytest
+
+    pytest.importorskip("ijson")
+
+    app = QApplication.instance() or QApplication([])
+    path = tmp_path / "x_attrib.json"
+    _write_attrib(path)
+
+    w = TrainPanel(None)
+    try:
+        _load(w, path)
+        full = list(w._events)
+        # Every file counts as large: read through ijson, same events
+        monkeypatch.setattr(train_panel, "_HAS_IJSON", True)
+        monkeypatch.setattr(train_panel, "_STREAM_MIN_BYTES", 0)
+        _load(w, path)
+        assert w._events == full and len(full) == 2
+        assert full[1].error == "singular"
+        for a, b in zip(w._events, full):
+            assert a.alpha_ids == b.alpha_ids and np.array_equal(a.alpha_vals, b.alpha_vals)
+    finally:
+        w.deleteLater()
+
+
+def test_train_panel_loads_attrib_files_off_the_gui_thread(monkeypatch, tmp_path):
+    app = QApplication.instance() or QApplication([])
+    errors = []
+    monkeypatch.setattr(train_panel.QMessageBox, "critical", lambda *args: errors.append(args[-1]))
+
+    path = tmp_path / "x_attrib.json"
+    _write_attrib(path)
+
+    w = TrainPanel(None)
+    try:
+        # Nothing is applied synchronously
+        w._load_attrib_file(path)
+        assert w._events == [] and w._model.rowCount() == 0
+        _load(w, path)
+        assert len(w._events) == 2 and w._model.rowCount() == 2
+
+        # A superseded load is dropped
+        stale = w._load_seq
+        w._on_attribs_loaded(stale - 1, path, [], train_panel._events_table([]))
+        assert len(w._events) == 2
+
+        # Parse failures are reported on the GUI thread
+        bad = tmp_path / "bad_attrib.json"
+        bad.write_text("{", encoding="utf-8")
+        _load(w, bad)
+        assert len(errors) == 1 and str(bad) in errors[0]
+    finally:
+        w.deleteLater()
+
+
+def test_train_panel_destroyed_mid_load_drops_the_result(monkeypatch, tmp_path):
+    import threading
+
+    from PySide6.QtCore import QThreadPool  # type: ignore
+
+    app = QApplication.instance() or QApplication([])
+    path = tmp_path / "x_attrib.json"
+    _write_attrib(path)
+
+    started, release = threading.Event(), threading.Event()
+    real_read = train_panel._read_attrib_events
+
+    def _slow_read(p):
+        started.set()
+        release.wait(5)
+        return real_read(p)
+
+    monkeypatch.setattr(train_panel, "_read_attrib_events", _slow_read)
+    w = TrainPanel(None)
+    signals = w._loader_signals
+    delivered = []
+    signals.loaded.connect(lambda *args: delivered.append(args), Qt.DirectConnection)
+    w._load_attrib_file(path)
+    assert started.wait(5)
+    w.deleteLater()
+    app.sendPostedEvents(None, QEvent.DeferredDelete)
+    assert signals.closed.is_set()
+    release.set()
+    assert QThreadPool.globalInstance().waitForDone(5000)
+    app.processEvents()
+    assert delivered == []
+
+
+def test_train_console_is_plain_text_with_bounded_backlog(monkeypatch):
+    app = QApplication.instance() or QApplication([])
+    monkeypatch.setattr(train_panel, "CONSOLE_MAX_LINES", 3)
+
+    w = TrainPanel(None)
+    try:
+        assert w.console.maximumBlockCount() == 3
+        # Chunks are joined as-is, so a line split across two reads stays one line
+        for chunk in ("a\nb", "c\n", "d\ne\n"):
+            w._append_log(chunk)
+        # Queued until the flush timer fires, then written in one insert
+        assert w._log_timer.isActive() and w.console.toPlainText() == ""
+        w._flush_log()
+        assert not w._log_timer.isActive() and w._log_buf == []
+        assert w.console.toPlainText() == "d\ne\n"
+    finally:
+        w.deleteLater()
@@ -0,0 +1,257 @@
+# pylint: disable=import-error,no-name-in-module
+from __future__ import annotations
+
+import math
+import os
+import sys
+from pathlib import Path
+
+# Headless Qt
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Ensure repo root (and tools/, for the cgir.core droplet geometry) are importable
+REPO_ROOT = Path(__file__).resolve().parents[2]
+for p in (REPO_ROOT, REPO_ROOT / "tools"):
+    if str(p) not in sys.path:
+        sys.path.insert(0, str(p))
+
+import numpy as np  # type: ignore
+from PySide6.QtCore import QEventLoop, QTimer  # type: ignore
+from PySide6.QtWidgets import QApplication  # type: ignore
+
+from tools.cgir_gui import viz_panel  # type: ignore
+from tools.cgir_gui.viz_panel import VizPanel  # type: ignore
+
+
+def test_viz_boundary_is_cached_per_slice(monkeypatch):
+    app = QApplication.instance() or QApplication([])
+
+    w = VizPanel(None)
+    try:
+        a, b = w._get_boundary(0.65, 720)
+        assert a.shape == b.shape == (720,)
+        hs = np.linspace(-math.pi, math.pi, num=720, endpoint=False)
+        assert np.allclose(np.hypot(a, b), [viz_panel.cmax_ok_v1(0.65, float(h)) for h in hs])
+
+        # The hue grid and its trig are shared by every slice
+        hues = w._get_hues(720)
+        assert w._get_hues(720) is hues and np.array_equal(hues[0], hs) and np.allclose(hues[1], np.cos(hs))
+        monkeypatch.setattr(viz_panel.np, "cos", lambda *args: (_ for _ in ()).throw(AssertionError))
+        w._get_boundary(0.5, 720)
+        monkeypatch.undo()
+
+        # A repeated slice is served from the cache
+        monkeypatch.setattr(viz_panel, "cmax_ok_v1_batch", lambda *args: (_ for _ in ()).throw(AssertionError))
+        assert w._get_boundary(0.65, 720)[0] is a
+
+        monkeypatch.undo()
+        for i in range(viz_panel.BOUNDARY_CACHE_SIZE):
+            w._get_boundary(i / 100.0, 720)
+        assert len(w._bnd_cache) == viz_panel.BOUNDARY_CACHE_SIZE
+        assert (0.65, 720) not in w._bnd_cache
+    finally:
+        w.deleteLater()
+
+
+def test_viz_stream_points_match_full_parse(tmp_path):
+    import json
+
+    import pytest
+
+    pytest.importorskip("ijson")
+
+    ok = lambda L, a, b: {"ok_state": {"L": L, "a": a, "b": b}}  # noqa: E731
+    inst = {
+        "neurons": [{"id": "n0", "state": ok(0.5, 0.1, -0.2)}, {"id": "n1", "state": {}}, {"state": ok(0.7, 0, 0)}],
+        "events": [
+            {"mix_raw_ok": ok(0.6, 0.25, 0.125), "after_projection_ok": ok(0.6, 0.2, 0.1), "meta": {"ok_state": ok(9, 9, 9)}},
+            {"mix_raw_ok": {"ok_state": {"L": 0.1}}, "after_projection_ok": ok(0.3, -0.05, 0.05)},
+            # Values are read as float() would: strings parse, null / nested values do not
+            {"mix_raw_ok": {"ok_state": {"x": {"L": 1}, "L": "0.4", "a": 0, "b": 0.5}}},
+            {
+                "mix_raw_ok": {"ok_state": {"L": None, "a": 0, "b": 0}},
+                "after_projection_ok": {"ok_state": {"L": {"v": 1}, "a": 0, "b": 0}},
+            },
+            {"after_projection_ok": {"ok_state": {"L": [0.2], "a": 0, "b": 0, "L2": 7}}},
+        ],
+    }
+    path = tmp_path / "inst.json"
+    path.write_text(json.dumps(inst), encoding="utf-8")
+
+    streamed = viz_panel._stream_points(path)
+    full = viz_panel._collect_points(viz_panel._read_json(path))
+    assert streamed.keys() == full.keys()
+    for key in full:
+        assert streamed[key].shape == full[key].shape and np.array_equal(streamed[key], full[key])
+    assert len(streamed["neurons"]) == 2 and len(streamed["mix_raw"]) == 2 and len(streamed["after_proj"]) == 2
+    assert streamed["mix_raw"][1].tolist() == [0.4, 0.0, 0.5]
+
+
+def test_viz_render_plots_point_arrays(monkeypatch, tmp_path):
+    import json
+
+    app = QApplication.instance() or QApplication([])
+    errors = []
+    monkeypatch.setattr(viz_panel.QMessageBox, "critical", lambda *args: errors.append(args[-1]))
+
+    ok = lambda L, a, b: {"ok_state": {"L": L, "a": a, "b": b}}  # noqa: E731
+    inst = {
+        "neurons": [{"state": ok(0.65, 0.1, -0.2)}, {"state": ok(0.2, 0.0, 0.1)}, {"state": {}}],
+        "events": [{"mix_raw_ok": ok(0.65, 0.25, 0.125), "after_projection_ok": {}}],
+    }
+    path = tmp_path / "inst.json"
+    path.write_text(json.dumps(inst), encoding="utf-8")
+
+    pts = viz_panel._collect_points(inst)
+    assert {k: v.shape for k, v in pts.items()} == {"neurons": (2, 3), "mix_raw": (1, 3), "after_proj": (0, 3)}
+    assert pts["neurons"].dtype == np.float64 and pts["neurons"][0].tolist() == [0.65, 0.1, -0.2]
+
+    w = VizPanel(None)
+    try:
+        w.edit_path.setText(str(path))
+        w.spin_L.setValue(0.65)
+        renders = []
+        w.rendered.connect(lambda: renders.append(1))
+        loop = QEventLoop()
+        w.rendered.connect(loop.quit)
+        QTimer.singleShot(5000, loop.quit)
+        # Requests within one frame are coalesced into one render
+        for _ in range(3):
+            w.render_plot()
+        assert not w._has_plot()
+        boundary, colls = w._boundary, list(w._ax.collections)
+        loop.exec()
+        assert errors == [] and renders == [1]
+        ax = w.figure.axes[0]
+        # The boundary and the collections are updated in place, not recreated
+        assert list(ax.patches) == [boundary] and list(ax.collections) == colls and len(colls) == 6
+        # neurons: one in-slice + one other; mix_raw: one in-slice; after_proj: none
+        counts = {k: [len(c.get_offsets()) for c in v] for k, v in w._overlays.items()}
+        assert counts == {"neurons": [1, 1], "mix_raw": [1, 0], "after_proj": [0, 0]}
+        assert np.allclose(boundary.get_xy()[:-1], np.column_stack(w._get_boundary(0.65, viz_panel.BOUNDARY_POINTS)))
+
+        # Overlay toggles blit over the cached background instead of rebuilding the plot
+        w.canvas.draw()
+        assert w._bg is not None
+        legend = lambda: [t.get_text() for t in ax.get_legend().get_texts()]  # noqa: E731
+        assert legend() == ["Droplet slice", "neurons", "mix_raw_ok"]
+        w.chk_mix.setChecked(False)
+        assert w.figure.axes == [ax] and list(ax.collections) == colls
+        assert [c.get_visible() for c in w._overlays["mix_raw"]] == [False, False]
+        assert legend() == ["Droplet slice", "neurons"]
+        w.chk_mix.setChecked(True)
+        # Empty collections stay hidden
+        assert [c.get_visible() for c in w._overlays["mix_raw"]] == [True, False]
+    finally:
+        w.deleteLater()
+
+
+def test_viz_L_change_reuses_parsed_points(monkeypatch, tmp_path):
+    import json
+
+    app = QApplication.instance() or QApplication([])
+    errors = []
+    monkeypatch.setattr(viz_panel.QMessageBox, "critical", lambda *args: errors.append(args[-1]))
+    loads = []
+    real_load = viz_panel._load_points
+    monkeypatch.setattr(viz_panel, "_load_points", lambda p: loads.append(p) or real_load(p))
+
+    path = tmp_path / "inst.json"
+    path.write_text(json.dumps({"neurons": [{"state": {"ok_state": {"L": 0.5, "a": 0.1, "b": 0.0}}}]}), encoding="utf-8")
+
+    w = VizPanel(None)
+
+    def render(step):
+        loop = QEventLoop()
+        w.rendered.connect(loop.quit)
+        QTimer.singleShot(2000, loop.quit)
+        step()
+        loop.exec()
+        w.rendered.disconnect(loop.quit)
+
+    try:
+        w.edit_path.setText(str(path))
+        render(w.render_plot)
+        render(lambda: w.spin_L.setValue(0.5))
+        assert errors == [] and len(loads) == 1
+        assert [len(c.get_offsets()) for c in w._overlays["neurons"]] == [1, 0]
+
+        # A failing file is reported once; later L steps do not re-render it
+        path.unlink()
+        render(lambda: w.spin_L.setValue(0.4))
+        render(lambda: w.spin_L.setValue(0.3))
+        assert len(errors) == 1 and not w._has_plot()
+    finally:
+        w.deleteLater()
+
+
+def test_viz_other_points_are_stride_sampled():
+    app = QApplication.instance() or QApplication([])
+
+    w = VizPanel(None)
+    try:
+        n = 5001
+        arr = np.column_stack((np.full(n, 0.2), np.arange(n, dtype=float), np.zeros(n)))
+        w._plot_slice(0.65, {"neurons": arr})
+        _, coll = w._overlays["neurons"]
+        offs = np.asarray(coll.get_offsets())
+        # Every third row (5001 / 2000 rounded up), spread over the whole input, in order
+        assert offs.shape == (1667, 2) and offs[:, 0].tolist() == list(range(0, 5001, 3))
+    finally:
+        w.deleteLater()
+
+
+def test_viz_export_is_fixed_size_and_includes_overlays(monkeypatch, tmp_path):
+    from PySide6.QtGui import QImage  # type: ignore
+
+    app = QApplication.instance() or QApplication([])
+    errors = []
+    monkeypatch.setattr(viz_panel.QMessageBox, "critical", lambda *args: errors.append(args[-1]))
+    out = tmp_path / "viz.png"
+    monkeypatch.setattr(viz_panel.QFileDialog, "getSaveFileName", lambda *args: (str(out), "PNG (*.png)"))
+
+    w = VizPanel(None)
+    try:
+        w.resize(300, 200)
+        w._plot_slice(0.65, {"neurons": np.array([[0.65, 0.05, 0.02]])})
+        drawn = []
+        neurons = w._overlays["neurons"][0]
+        orig_draw = neurons.draw
+        monkeypatch.setattr(neurons, "draw", lambda *args, **kw: (drawn.append(1), orig_draw(*args, **kw)))
+        w.export_png()
+        assert errors == [] and w._last_image_path == out
+        # Figure size at EXPORT_DPI, not the widget's pixel size
+        img = QImage(str(out))
+        side = round(6.5 * viz_panel.EXPORT_DPI)
+        assert (img.width(), img.height()) == (side, side)
+        # The blitted overlay and legend are in the export, and stay animated afterwards
+        assert drawn and neurons.get_animated() and w._ax.get_legend().get_animated()
+    finally:
+        w.deleteLater()
+
+
+def test_viz_slice_kernel_matches_numpy_selection():
+    from tools.cgir_gui import _viz_kernels  # type: ignore
+
+    rng = np.random.default_rng(0)
+    for n, max_other in ((0, 4), (7, 4), (50, 4), (101, 10), (3000, 2000), (3001, 1000)):
+        arr = rng.random((n, 3))
+        arr[::3, 0] = 0.5
+        ref = _viz_kernels._select_slice_np(arr, 0.5, 1e-3, max_other)
+        # Plain-Python run of the loop kernel numba compiles
+        got = _viz_kernels._select_slice_loops(arr, 0.5, 1e-3, max_other)
+        for r, g in zip(ref, got):
+            assert r.shape == g.shape and np.array_equal(r, g)
+        assert all(np.array_equal(r, g) for r, g in zip(ref, _viz_kernels.select_slice(arr, 0.5, 1e-3, max_other)))
+
+
+def test_viz_slice_sample_spans_all_other_points():
+    from tools.cgir_gui import _viz_kernels  # type: ignore
+
+    max_other = 100
+    n_out = 2 * max_other - 1
+    arr = np.column_stack((np.zeros(n_out), np.arange(n_out, dtype=float), np.zeros(n_out)))
+    for kernel in (_viz_kernels._select_slice_np, _viz_kernels._select_slice_loops):
+        _, other = kernel(arr, 0.5, 1e-3, max_other)
+        # Stride 2, not the first max_other rows in file order
+        assert other[:, 0].tolist() == list(range(0, n_out, 2))
@@ -0,0 +1,28 @@
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from tools.docs_lint.check_docs_links import MD_LINK_RE, scan_markdown  # noqa: E402
+
+
+def test_link_text_may_contain_brackets(tmp_path):
+    md = tmp_path / "page.md"
+    (tmp_path / "api.md").write_text("# api\n", encoding="utf-8")
+    md.write_text(
+        "See [`a[0]`](api.md) and [the [RFC] text](missing.md).\n"
+        "![fig [1]](img/none.png) [plain](api.md)\n",
+        encoding="utf-8",
+    )
+
+    found = [m.groups() for m in MD_LINK_RE.finditer(md.read_text(encoding="utf-8"))]
+    assert found == [("", "api.md"), ("", "missing.md"), ("!", "img/none.png"), ("", "api.md")]
+
+    broken = scan_markdown(md, tmp_path, verbose=False)
+    assert [(b["url"], b["kind"]) for b in broken] == [("missing.md", "link"), ("img/none.png", "image")]
+
+
+def test_link_text_does_not_span_lines():
+    assert MD_LINK_RE.search("[a\nb](x.md)") is None
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from tools.oir.json_io import dumps_json, load_json  # noqa: E402
+
+
+def test_load_json_keeps_integers_beyond_64_bits(tmp_path):
+    big = 123456789012345678901234567890
+    low = -(2**63) - 1
+    p = tmp_path / "doc.json"
+    p.write_text('{"seed": %d, "low": %d, "ok": 7}' % (big, low), encoding="utf-8")
+    doc = load_json(p)
+    assert doc == {"seed": big, "low": low, "ok": 7}
+    assert type(doc["seed"]) is int and type(doc["low"]) is int
+    assert load_json(p) == doc
+    p.write_bytes(dumps_json(doc))
+    assert load_json(p) == doc
+
+
+def test_load_json_accepts_nan_and_infinity(tmp_path):
+    p = tmp_path / "doc.json"
+    p.write_text('{"a": NaN, "b": Infinity}', encoding="utf-8")
+    doc = load_json(p)
+    assert doc["a"] != doc["a"] and doc["b"] == float("inf")
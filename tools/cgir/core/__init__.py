@@ -4,8 +4,8 @@ Numeric policy, OKLab/OKLch conversions, droplet projection, and mixing utilitie
 """
 
 from .numeric import quantize, qtuple, approx_equal, clamp_angle_pi  # re-export
-from .oklab import to_lch, from_lch, gray_axis_bias
-from .droplet import cmax_ok_v1, project_radial_clamp, is_inside_droplet, clamp_to_droplet_and_test
+from .oklab import to_lch, to_lch_batch, from_lch, gray_axis_bias
+from .droplet import cmax_ok_v1, cmax_ok_v1_batch, project_radial_clamp, is_inside_droplet, clamp_to_droplet_and_test
 
 __all__ = [
     "quantize",
@@ -13,9 +13,11 @@ __all__ = [
     "approx_equal",
     "clamp_angle_pi",
     "to_lch",
+    "to_lch_batch",
     "from_lch",
     "gray_axis_bias",
     "cmax_ok_v1",
+    "cmax_ok_v1_batch",
     "project_radial_clamp",
     "is_inside_droplet",
     "clamp_to_droplet_and_test",
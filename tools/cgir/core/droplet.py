@@ -3,6 +3,8 @@ from __future__ import annotations
 import math
 from typing import Tuple
 
+import numpy as np
+
 from .numeric import quantize, qtuple, approx_equal
 from .oklab import to_lch, from_lch, gray_axis_bias
 
@@ -26,6 +28,16 @@ def cmax_ok_v1(L: float, h: float) -> float:
     return max(0.0, base + ripple)
 
 
+def cmax_ok_v1_batch(L: float, h: np.ndarray) -> np.ndarray:
+    """
+    Vectorized counterpart of cmax_ok_v1 for one L over an array of hues (e.g. a
+    droplet slice boundary). Returns float64 with the shape of h.
+    """
+    h = np.asarray(h, dtype=np.float64)
+    base = 0.35 * (1.0 - abs(2.0 * float(L) - 1.0)) + 0.05
+    return np.maximum(base + 0.03 * np.sin(3.0 * h), 0.0)
+
+
 def project_radial_clamp(
     L: float, a: float, b: float, tol: float = 1e-12, dp: int = 12
 ) -> Tuple[float, float, float]:
@@ -1,37 +1,107 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Tuple
+from itertools import chain
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
 
 from .numeric import quantize, qtuple, approx_equal, stable_sorted, safe_div
 from .oklab import to_lch, from_lch, gray_axis_bias
 
 
+# Fan-ins below this are mixed in pure Python: for a few inputs, building the
+# NumPy arrays costs more than the vectorized products save
+MIX_NUMPY_MIN = 64
+
+
 @dataclass(frozen=True)
 class InputWeight:
     neuron_id: str
     weight: float
 
 
+def _by_id(iw: InputWeight) -> str:
+    return iw.neuron_id
+
+
+def _sort_and_sum(inputs: Iterable[InputWeight]) -> Tuple[List[InputWeight], float]:
+    """
+    Stable sort by neuron_id (ties keep original order) and exactly rounded total
+    (math.fsum) of the clamped nonnegative weights.
+    """
+    items = stable_sorted(inputs, key=_by_id)  # sorted() already copies into a new list
+    total = math.fsum(max(0.0, iw.weight) for iw in items)
+    return items, total
+
+
 def normalize_weights(inputs: Iterable[InputWeight], dp: int = 12) -> List[InputWeight]:
     """
     Deterministically normalize nonnegative weights to sum to 1.0.
-    Stable sort by neuron_id then by original order via enumerate key.
+    Stable sort by neuron_id then by original order.
     """
-    items = list(inputs)
-    # stable sort by (neuron_id, index)
-    items = stable_sorted(
-        list(enumerate(items)),
-        key=lambda iv: (iv[1].neuron_id, iv[0]),
-    )
-    weights = [max(0.0, iw.weight) for _, iw in items]
-    s = sum(weights)
+    items, s = _sort_and_sum(inputs)
     s = s if s > 0.0 else 1.0  # avoid div by zero; if all zero, keep zeros then renorm trivially
-    normed: List[InputWeight] = []
-    for (_, iw), w in zip(items, weights):
-        wn = w / s
-        normed.append(InputWeight(iw.neuron_id, quantize(wn, dp)))
-    return normed
+    return [InputWeight(iw.neuron_id, quantize(max(0.0, iw.weight) / s, dp)) for iw in items]
+
+
+def normalize_weights_arrays(inputs: Iterable[InputWeight]) -> Tuple[List[str], np.ndarray]:
+    """
+    Array form of normalize_weights for callers that only need ids and weights:
+    returns (ids in canonical order, float64 weights). Weights are not quantized
+    and no InputWeight objects are rebuilt.
+    """
+    items, s = _sort_and_sum(inputs)
+    s = s if s > 0.0 else 1.0
+    ids = [iw.neuron_id for iw in items]
+    raw = np.fromiter((iw.weight for iw in items), dtype=np.float64, count=len(items))
+    # max(0.0, w) elementwise: NaN and -0.0 clamp to 0.0 as well
+    weights = np.where(raw > 0.0, raw, 0.0)
+    weights /= s
+    return ids, weights
+
+
+def _mix_unquantized(
+    id_to_oklab: Dict[str, Tuple[float, float, float]],
+    ids: Sequence[str],
+    weights: np.ndarray,
+) -> Tuple[float, float, float]:
+    """
+    Shared convex-mix kernel: correctly rounded (math.fsum) per-channel sums of
+    weights[i] * id_to_oklab[ids[i]], without quantization.
+    """
+    # Filled straight from the triples (no intermediate list of tuples to convert)
+    pts = np.fromiter(
+        chain.from_iterable(id_to_oklab[nid] for nid in ids), dtype=np.float64, count=3 * len(ids)
+    ).reshape(-1, 3)
+    # fsum over Python floats: iterating the array itself would box each element
+    c0, c1, c2 = (pts * weights[:, None]).T.tolist()
+    return (math.fsum(c0), math.fsum(c1), math.fsum(c2))
+
+
+def _mix_inputs(
+    id_to_oklab: Dict[str, Tuple[float, float, float]],
+    inputs: Iterable[InputWeight],
+) -> Tuple[float, float, float]:
+    """
+    Normalize inputs and mix them, unquantized. Fan-ins below MIX_NUMPY_MIN use plain
+    floats; both paths form the same float64 products and fsum them, so the results
+    are identical.
+    """
+    if not isinstance(inputs, Sequence):
+        inputs = list(inputs)  # generators and other one-shot iterables: sized once
+    if len(inputs) >= MIX_NUMPY_MIN:
+        ids, w = normalize_weights_arrays(inputs)
+        return _mix_unquantized(id_to_oklab, ids, w)
+    items, s = _sort_and_sum(inputs)
+    s = s if s > 0.0 else 1.0
+    terms = [(max(0.0, iw.weight) / s, id_to_oklab[iw.neuron_id]) for iw in items]
+    return (
+        math.fsum(w * float(p[0]) for w, p in terms),
+        math.fsum(w * float(p[1]) for w, p in terms),
+        math.fsum(w * float(p[2]) for w, p in terms),
+    )
 
 
 def mix_oklab(
@@ -42,15 +112,11 @@ def mix_oklab(
     """
     Convex mix of OKLab states by normalized weights. Missing ids default to (0,0,0) which is off-range;
     callers should ensure inputs exist.
+    Intermediate weights are not quantized, only the returned triple is.
+    Each channel is summed with math.fsum, so the result is the correctly rounded sum
+    of the weighted terms regardless of fan-in or input order.
     """
-    normed = normalize_weights(list(inputs), dp=dp)
-    L = a = b = 0.0
-    for iw in normed:
-        L_i, a_i, b_i = id_to_oklab[iw.neuron_id]
-        L += iw.weight * L_i
-        a += iw.weight * a_i
-        b += iw.weight * b_i
-    return qtuple((L, a, b), dp)
+    return qtuple(_mix_inputs(id_to_oklab, inputs), dp)
 
 
 def reachable_convex_given_weights(
@@ -62,17 +128,5 @@ def reachable_convex_given_weights(
     """
     Check if target_ok equals the convex combination of provided inputs under their normalized weights.
     """
-    normed = normalize_weights(list(inputs))
-    Lm, am, bm = 0.0, 0.0, 0.0
-    for iw in normed:
-        L_i, a_i, b_i = id_to_oklab[iw.neuron_id]
-        Lm += iw.weight * L_i
-        am += iw.weight * a_i
-        bm += iw.weight * b_i
-
-    L, a, b = target_ok
-    return (
-        abs(L - Lm) <= tol and
-        abs(a - am) <= tol and
-        abs(b - bm) <= tol
-    )
\ No newline at end of file
+    mixed = _mix_inputs(id_to_oklab, inputs)
+    return all(math.isclose(t, m, rel_tol=0.0, abs_tol=tol) for t, m in zip(target_ok, mixed))
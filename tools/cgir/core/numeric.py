@@ -5,16 +5,23 @@ from typing import Iterable, List, Sequence, Tuple, TypeVar, Callable
 
 T = TypeVar("T")
 
+_PI = math.pi
+_NEG_PI = -math.pi
+_TWO_PI = 2.0 * math.pi
+_PI_EDGE = math.pi - 1e-15
+
 
 def quantize(x: float, dp: int = 12) -> float:
     """
     Deterministic quantization: round-half-to-even at given decimal places.
+    Uses the builtin correctly rounded round(); float() is only paid for non-floats.
     """
-    return round(float(x), ndigits=dp)
+    return round(x if x.__class__ is float else float(x), dp)
 
 
 def qtuple(vals: Sequence[float], dp: int = 12) -> Tuple[float, ...]:
-    return tuple(quantize(v, dp) for v in vals)
+    # Same rounding as quantize(), inlined to skip a Python-level call per element
+    return tuple([round(v if v.__class__ is float else float(v), dp) for v in vals])
 
 
 def approx_equal(x: float, y: float, tol: float = 1e-9) -> bool:
@@ -30,15 +37,16 @@ def clamp_angle_pi(h: float) -> float:
     """
     Map angle to canonical interval [-pi, pi).
     """
-    # Use math.remainder to wrap into (-pi, pi]; then adjust edge pi -> -pi
-    wrapped = math.remainder(h, 2.0 * math.pi)  # in (-pi, pi]
-    if approx_equal(wrapped, math.pi, 1e-15) or wrapped > math.pi:
-        wrapped = -math.pi
-    # ensure -pi <= wrapped < pi
-    if wrapped < -math.pi:
-        wrapped += 2.0 * math.pi
-    if wrapped >= math.pi:
-        wrapped -= 2.0 * math.pi
+    # fmod is exact and lands in (-2pi, 2pi); one shift by 2pi (also exact, by
+    # Sterbenz) brings it into [-pi, pi)
+    wrapped = math.fmod(h, _TWO_PI)
+    if wrapped >= _PI:
+        wrapped -= _TWO_PI
+    elif wrapped < _NEG_PI:
+        wrapped += _TWO_PI
+    # canonicalize the +pi edge (within 1e-15) to -pi
+    if wrapped >= _PI_EDGE:
+        wrapped = _NEG_PI
     return wrapped
 
 
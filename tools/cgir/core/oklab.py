@@ -3,7 +3,15 @@ from __future__ import annotations
 import math
 from typing import Tuple
 
-from .numeric import quantize, qtuple, approx_equal, clamp_angle_pi
+import numpy as np
+
+from .numeric import _PI_EDGE, quantize, qtuple, approx_equal, clamp_angle_pi
+
+# Module-level aliases for the scalar hot paths (skip the math.<attr> lookup per call)
+_hypot = math.hypot
+_atan2 = math.atan2
+_cos = math.cos
+_sin = math.sin
 
 
 def to_lch(L: float, a: float, b: float, dp: int = 12) -> Tuple[float, float, float]:
@@ -11,24 +19,41 @@ def to_lch(L: float, a: float, b: float, dp: int = 12) -> Tuple[float, float, fl
     Convert OKLab (L,a,b) to (L,h,S') with canonical hue wrapping to [-pi, pi).
     S' is the radial magnitude in the ab-plane.
     """
-    Sprime = math.hypot(a, b)  # sqrt(a^2 + b^2)
+    Sprime = _hypot(a, b)  # sqrt(a^2 + b^2)
     if Sprime == 0.0:
         # Hue undefined on gray axis; choose canonical h = 0
         h = 0.0
     else:
-        h = math.atan2(b, a)
+        h = _atan2(b, a)
         h = clamp_angle_pi(h)
     Lq, hq, Sq = quantize(L, dp), quantize(h, dp), quantize(Sprime, dp)
     return (Lq, hq, Sq)
 
 
+def to_lch_batch(ab: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized counterpart of to_lch for bulk callers: ab has shape (..., 2).
+    Returns (h, S') as float64 arrays with the same canonical conventions
+    (h in [-pi, pi), h = 0 on the gray axis). Values are not quantized; callers
+    that need the dp policy should quantize at their output boundary.
+    """
+    ab = np.asarray(ab, dtype=np.float64)
+    a = ab[..., 0]
+    b = ab[..., 1]
+    Sprime = np.hypot(a, b)
+    h = np.arctan2(b, a)  # in [-pi, pi]
+    h = np.where(h >= _PI_EDGE, -math.pi, h)  # same +pi edge band as clamp_angle_pi
+    h = np.where(Sprime == 0.0, 0.0, h)
+    return h, Sprime
+
+
 def from_lch(L: float, h: float, Sprime: float, dp: int = 12) -> Tuple[float, float, float]:
     """
     Convert (L,h,S') to OKLab (L,a,b) using a = S' cos h, b = S' sin h with canonical hue wrapping.
     """
     h = clamp_angle_pi(h)
-    a = Sprime * math.cos(h)
-    b = Sprime * math.sin(h)
+    a = Sprime * _cos(h)
+    b = Sprime * _sin(h)
     return qtuple((L, a, b), dp)
 
 
@@ -16,6 +16,7 @@ Panels and controllers will live under this package:
   - dashboard.py
   - process_controller.py
   - state.py
+  - io_pool.py
   - fs_watcher.py
 """
 __all__ = []
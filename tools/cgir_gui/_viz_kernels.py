@@ -0,0 +1,81 @@
+# pylint: disable=import-error,no-name-in-module
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+# Optional JIT; without it every slice selection uses the NumPy path
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except Exception:
+    njit = None  # type: ignore
+    prange = range  # type: ignore
+    _HAS_NUMBA = False
+
+# Point sets at least this large use the compiled kernel (when numba is installed);
+# below it the JIT call overhead outweighs the saving
+NUMBA_MIN_POINTS = 50_000
+
+
+def _select_slice_np(arr: np.ndarray, L: float, tolL: float, max_other: int) -> Tuple[np.ndarray, np.ndarray]:
+    # One pass over the L column; only the plotted (a,b) columns are gathered
+    m_in = np.abs(arr[:, 0] - L) <= tolL
+    ab = arr[:, 1:3]
+    ab_in = ab[m_in]
+    ab_out = ab[~m_in]
+    # Deterministic stride: touches only the selected rows (no N-sized permutation).
+    # Rounded up, so the sample spans all rows instead of the first max_other
+    stride = max(1, -(-ab_out.shape[0] // max_other))
+    return ab_in, ab_out[::stride][:max_other]
+
+
+def _select_slice_loops(arr: np.ndarray, L: float, tolL: float, max_other: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    _select_slice_np as explicit loops, for numba. Two passes: a parallel mask and
+    count, then one write pass into outputs sized from the counts (no appends).
+    """
+    n = arr.shape[0]
+    m_in = np.empty(n, dtype=np.bool_)
+    for i in prange(n):
+        m_in[i] = abs(arr[i, 0] - L) <= tolL
+    n_in = 0
+    for i in range(n):
+        if m_in[i]:
+            n_in += 1
+    n_out = n - n_in
+    stride = max(1, -(-n_out // max_other))
+    n_sel = min(max_other, (n_out + stride - 1) // stride)
+
+    ab_in = np.empty((n_in, 2), dtype=arr.dtype)
+    ab_sel = np.empty((n_sel, 2), dtype=arr.dtype)
+    k_in = 0
+    j_out = 0
+    for i in range(n):
+        if m_in[i]:
+            ab_in[k_in, 0] = arr[i, 1]
+            ab_in[k_in, 1] = arr[i, 2]
+            k_in += 1
+        else:
+            if j_out % stride == 0 and j_out // stride < n_sel:
+                k = j_out // stride
+                ab_sel[k, 0] = arr[i, 1]
+                ab_sel[k, 1] = arr[i, 2]
+            j_out += 1
+    return ab_in, ab_sel
+
+
+if _HAS_NUMBA:
+    _select_slice_jit = njit(cache=True, parallel=True)(_select_slice_loops)
+
+
+def select_slice(arr: np.ndarray, L: float, tolL: float, max_other: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split (k,3) rows of (L,a,b) into the (a,b) points within tolL of the L slice and
+    at most max_other stride-sampled (a,b) points off it.
+    """
+    if _HAS_NUMBA and arr.shape[0] >= NUMBA_MIN_POINTS:
+        return _select_slice_jit(np.ascontiguousarray(arr, dtype=np.float64), float(L), float(tolL), int(max_other))
+    return _select_slice_np(arr, L, tolL, max_other)
@@ -5,7 +5,7 @@ import os
 import json
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from PySide6.QtCore import Qt, QUrl, QTimer
 from PySide6.QtGui import QDesktopServices
@@ -43,6 +43,14 @@ class DashboardWidget(QWidget):
     def __init__(self, parent: Optional[QWidget] = None, *, on_open_file=None) -> None:
         super().__init__(parent)
         self._on_open_file = on_open_file
+        # Per-directory scan cache: dir -> (st_mtime_ns, direct *.json count, subdirs).
+        # A directory's mtime only changes on entry add/remove/rename, so steady-state
+        # refreshes cost one stat per directory instead of a full listing.
+        self._dir_cache: Dict[str, Tuple[int, int, Tuple[str, ...]]] = {}
+        # runs dir -> (st_mtime_ns, newest run json)
+        self._runs_cache: Dict[str, Tuple[int, Optional[Path]]] = {}
+        # last run text keyed by (path, st_mtime_ns) of the run json
+        self._last_run_cache: Optional[Tuple[Path, int, str]] = None
         self._build_ui()
         self._refresh_timer = QTimer(self)
         self._refresh_timer.setInterval(5000)  # 5 seconds
@@ -153,11 +161,11 @@ class DashboardWidget(QWidget):
             ex_dir = Path(self.edit_examples.text().strip())
             sim_dir = Path(self.edit_build.text().strip()) / "sim"
             try:
-                ex_count = sum(1 for _ in ex_dir.rglob("*.json")) if ex_dir.exists() else 0
+                ex_count = self._count_json(ex_dir) if ex_dir.exists() else 0
             except Exception:
                 ex_count = 0
             try:
-                sim_count = sum(1 for _ in sim_dir.rglob("*.json")) if sim_dir.exists() else 0
+                sim_count = self._count_json(sim_dir) if sim_dir.exists() else 0
             except Exception:
                 sim_count = 0
             self.lbl_examples_count.setText(str(ex_count))
@@ -168,18 +176,9 @@ class DashboardWidget(QWidget):
             last_text = "—"
             if runs_dir.exists():
                 try:
-                    last = max(runs_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, default=None)
+                    last = self._latest_run(runs_dir)
                     if last:
-                        with last.open("r", encoding="utf-8") as fh:
-                            meta = json.load(fh)
-                        task = (meta.get("metadata") or {}).get("task")
-                        exit_code = meta.get("exit_code")
-                        t = meta.get("finished_at") or meta.get("started_at")
-                        if t:
-                            timestr = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(float(t)))
-                        else:
-                            timestr = ""
-                        last_text = f"{task or 'run'} exit {exit_code} at {timestr}"
+                        last_text = self._describe_run(last)
                 except Exception:
                     last_text = "n/a"
             self.lbl_last_run.setText(last_text)
@@ -187,6 +186,67 @@ class DashboardWidget(QWidget):
             QMessageBox.warning(self, "Dashboard", f"Failed to refresh workspace: {e}")
 
     # Helpers
+    def _count_json(self, root: Path) -> int:
+        """
+        Count *.json entries under root (recursive), rescanning only directories
+        whose st_mtime_ns changed since the previous refresh.
+        """
+        total = 0
+        stack = [str(root)]
+        while stack:
+            d = stack.pop()
+            try:
+                mtime = os.stat(d).st_mtime_ns
+            except OSError:
+                self._dir_cache.pop(d, None)
+                continue
+            cached = self._dir_cache.get(d)
+            if cached is None or cached[0] != mtime:
+                count = 0
+                subdirs = []
+                with os.scandir(d) as it:
+                    for entry in it:
+                        if entry.name.endswith(".json"):
+                            count += 1
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                cached = (mtime, count, tuple(subdirs))
+                self._dir_cache[d] = cached
+            total += cached[1]
+            stack.extend(cached[2])
+        return total
+
+    def _latest_run(self, runs_dir: Path) -> Optional[Path]:
+        """
+        Newest runs/*.json by mtime; recomputed only when the runs dir changes.
+        """
+        key = str(runs_dir)
+        mtime = runs_dir.stat().st_mtime_ns
+        cached = self._runs_cache.get(key)
+        if cached is not None and cached[0] == mtime and (cached[1] is None or cached[1].exists()):
+            return cached[1]
+        last = max(runs_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, default=None)
+        self._runs_cache[key] = (mtime, last)
+        return last
+
+    def _describe_run(self, path: Path) -> str:
+        mtime = path.stat().st_mtime_ns
+        cached = self._last_run_cache
+        if cached is not None and cached[0] == path and cached[1] == mtime:
+            return cached[2]
+        with path.open("r", encoding="utf-8") as fh:
+            meta = json.load(fh)
+        task = (meta.get("metadata") or {}).get("task")
+        exit_code = meta.get("exit_code")
+        t = meta.get("finished_at") or meta.get("started_at")
+        if t:
+            timestr = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(float(t)))
+        else:
+            timestr = ""
+        text = f"{task or 'run'} exit {exit_code} at {timestr}"
+        self._last_run_cache = (path, mtime, text)
+        return text
+
     def _open_in_finder(self, path: Path) -> None:
         try:
             if not path.exists():
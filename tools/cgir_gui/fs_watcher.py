@@ -52,6 +52,8 @@ class FSWatcher(QObject):
     """
 
     changed = Signal(str)
+    # Emitted from the watchdog thread; queued to the GUI thread, where the timer lives
+    _event_seen = Signal()
 
     def __init__(self, parent: Optional[QObject] = None, *, debounce_ms: int = 250) -> None:
         super().__init__(parent)
@@ -65,6 +67,7 @@ class FSWatcher(QObject):
         self._debounce.setSingleShot(True)
         self._debounce.setInterval(int(debounce_ms))
         self._debounce.timeout.connect(self._emit_debounced)
+        self._event_seen.connect(self._restart_debounce)
 
         self._lock = threading.Lock()
 
@@ -135,12 +138,15 @@ class FSWatcher(QObject):
         try:
             with self._lock:
                 self._last_path = src_path
-                # Restart debounce timer in the GUI thread
-                # Using singleShot pattern to coalesce frequent events
-                self._debounce.start()
+            # Restart debounce timer in the GUI thread (QTimer is not thread-safe)
+            # Using singleShot pattern to coalesce frequent events
+            self._event_seen.emit()
         except Exception:
             pass
 
+    def _restart_debounce(self) -> None:
+        self._debounce.start()
+
     def _emit_debounced(self) -> None:
         try:
             with self._lock:
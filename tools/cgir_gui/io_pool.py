@@ -0,0 +1,52 @@
+# pylint: disable=import-error,no-name-in-module
+
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+
+from PySide6.QtCore import QRunnable, QThreadPool
+
+
+class _IoJob(QRunnable):
+    """Runs one file write off the GUI thread; errors are swallowed (best-effort persistence)."""
+
+    def __init__(self, fn: Callable[..., Any], args: tuple) -> None:
+        super().__init__()
+        self._fn = fn
+        self._args = args
+
+    def run(self) -> None:
+        try:
+            self._fn(*self._args)
+        except Exception:
+            pass
+
+
+_io_pool: Optional[QThreadPool] = None
+
+
+def io_pool() -> QThreadPool:
+    """
+    Process-wide pool for disk writes. A single thread, so writes run in submission
+    order (a later save of the same file always lands last).
+    """
+    global _io_pool
+    if _io_pool is None:
+        _io_pool = QThreadPool()
+        _io_pool.setMaxThreadCount(1)
+    return _io_pool
+
+
+def submit_io(fn: Callable[..., Any], *args: Any) -> None:
+    """
+    Queue fn(*args) on the I/O thread. Pass immutable snapshots (e.g. encoded bytes),
+    never live GUI state.
+    """
+    io_pool().start(_IoJob(fn, args))
+
+
+def wait_for_io(msecs: int = -1) -> bool:
+    """Block until queued writes are done (e.g. before quitting). True if none remain."""
+    if _io_pool is None:
+        return True
+    return _io_pool.waitForDone(msecs)
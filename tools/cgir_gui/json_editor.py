@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import functools
+import itertools
 import json
+import math
+import mmap
+import re
+import threading
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtCore import QObject, QRunnable, QSignalBlocker, QThreadPool, QTimer, Signal
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -18,9 +26,8 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QMessageBox,
     QListWidget,
-    QListWidgetItem,
 )
-from .state import load_workspace, save_workspace, update_params
+from .state import load_workspace, save_workspace, update_params, write_atomic
 
 try:
     from jsonschema import Draft202012Validator
@@ -29,19 +36,758 @@ except Exception:
     Draft202012Validator = None  # type: ignore
     _HAS_JSONSCHEMA = False
 
+# Optional Rust validator (jsonschema-rs); preferred over python-jsonschema when importable
+try:
+    import jsonschema_rs
+    _HAS_JSONSCHEMA_RS = True
+except Exception:
+    jsonschema_rs = None  # type: ignore
+    _HAS_JSONSCHEMA_RS = False
+
+_SCHEMA_BACKEND: Optional[str] = "rs" if _HAS_JSONSCHEMA_RS else ("python" if _HAS_JSONSCHEMA else None)
+
+# Optional schema code generator; fronts the python-jsonschema backend as a fail-fast check
+try:
+    import fastjsonschema
+    _HAS_FASTJSONSCHEMA = True
+except Exception:
+    fastjsonschema = None  # type: ignore
+    _HAS_FASTJSONSCHEMA = False
+
+# Optional incremental JSON parser for documents too large to materialize
+try:
+    import ijson
+    _HAS_IJSON = True
+except Exception:
+    ijson = None  # type: ignore
+    _HAS_IJSON = False
+
+# Optional fast JSON (C parser/serializer); stdlib json is the fallback
+try:
+    import orjson
+    _HAS_ORJSON = True
+except Exception:
+    orjson = None  # type: ignore
+    _HAS_ORJSON = False
+
 
 def _read_text(path: Path) -> str:
     with path.open("r", encoding="utf-8") as f:
         return f.read()
 
 
+# Text orjson reads differently from json: NaN/Infinity, which it rejects, and runs of
+# 19+ digits, which may be integers beyond 64 bits that it reads as floats
+_ORJSON_UNSAFE_RE = re.compile(r"\d{19}|NaN|Infinity")
+
+
+def _all_floats_finite(obj: Any) -> bool:
+    """False if obj holds a NaN/Infinity anywhere (orjson would write those as null)."""
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        if isinstance(o, float):
+            if not math.isfinite(o):
+                return False
+        elif isinstance(o, dict):
+            stack.extend(o.values())
+        elif isinstance(o, list):
+            stack.extend(o)
+    return True
+
+
 def _load_json(text: str) -> Any:
+    if _HAS_ORJSON and _ORJSON_UNSAFE_RE.search(text) is None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass  # e.g. lone surrogates; json parses those (and reports real errors)
     return json.loads(text)
 
 
+def _dump_json(obj: Any) -> bytes:
+    """Pretty JSON (2-space indent) as UTF-8 bytes, no trailing newline."""
+    if _HAS_ORJSON and _all_floats_finite(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # integers beyond 64 bits
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 def _load_schema(path: Path) -> Any:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    with path.open("rb") as f:
+        if _HAS_ORJSON:
+            # Parse straight from the page cache; no intermediate bytes copy or decode
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                mm = None  # empty files cannot be mapped
+            if mm is not None:
+                try:
+                    with memoryview(mm) as view:
+                        return orjson.loads(view)
+                finally:
+                    mm.close()
+        return _load_json(f.read().decode("utf-8"))
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_schema(path: str, mtime_ns: int) -> Any:
+    """
+    Parsed schema shared by every editor on the same file; the mtime in the key
+    drops stale entries when the schema is edited. Callers must not mutate it.
+    """
+    return _load_schema(Path(path))
+
+
+# 2020-12 keywords that fastjsonschema (drafts 4/6/7) does not implement
+_DRAFT2020_ONLY_KEYWORDS = frozenset({
+    "prefixItems", "unevaluatedProperties", "unevaluatedItems", "dependentRequired",
+    "dependentSchemas", "minContains", "maxContains", "$anchor", "$dynamicRef",
+    "$dynamicAnchor", "$recursiveRef", "$recursiveAnchor", "$vocabulary",
+})
+_ANNOTATION_KEYWORDS = frozenset({
+    "$comment", "title", "description", "default", "examples", "deprecated", "readOnly", "writeOnly",
+})
+
+
+def _draft7_equivalent(node: Any) -> bool:
+    """
+    True if draft-7 evaluation of this (sub)schema can never accept an instance that
+    2020-12 rejects. Conservative: property names are checked like keywords too.
+    """
+    if isinstance(node, list):
+        return all(_draft7_equivalent(item) for item in node)
+    if not isinstance(node, dict):
+        return True
+    if not _DRAFT2020_ONLY_KEYWORDS.isdisjoint(node):
+        return False
+    # Draft 7 ignores keywords next to $ref; 2020-12 applies them
+    if "$ref" in node and not _ANNOTATION_KEYWORDS.issuperset(k for k in node if k != "$ref"):
+        return False
+    if isinstance(node.get("items"), list):
+        return False
+    return all(_draft7_equivalent(v) for k, v in node.items() if k not in ("enum", "const", "default", "examples"))
+
+
+class _PrecheckedValidator:
+    """
+    python-jsonschema validator fronted by fastjsonschema's generated code: documents
+    that pass the generated check skip the much slower error walk, failing ones get
+    the full report from python-jsonschema.
+    """
+
+    def __init__(self, validator: Any, check: Callable[[Any], Any]) -> None:
+        self._validator = validator
+        self._check = check
+
+    def iter_errors(self, instance: Any) -> Any:
+        try:
+            self._check(instance)
+        except Exception:
+            yield from self._validator.iter_errors(instance)
+
+
+def _make_validator(schema: Any) -> Optional[Any]:
+    """
+    Compile a Draft 2020-12 validator with the selected backend. Both expose
+    iter_errors(instance) yielding errors with a .message attribute.
+    """
+    if _SCHEMA_BACKEND == "rs":
+        return jsonschema_rs.Draft202012Validator(schema)
+    if _SCHEMA_BACKEND == "python":
+        validator = Draft202012Validator(schema)  # type: ignore
+        if _HAS_FASTJSONSCHEMA and isinstance(schema, dict) and _draft7_equivalent(schema):
+            # Compiled as draft 7 (fastjsonschema has no 2020-12); $id is dropped so
+            # "#/$defs/..." refs resolve against this document, never over the network
+            draft7 = {k: v for k, v in schema.items() if k != "$id"}
+            draft7["$schema"] = "http://json-schema.org/draft-07/schema#"
+            try:
+                return _PrecheckedValidator(validator, fastjsonschema.compile(draft7))
+            except Exception:
+                pass
+        return validator
+    return None
+
+
+@functools.lru_cache(maxsize=16)
+def _get_validator(path: str, mtime_ns: int) -> Tuple[Optional[Any], Any]:
+    """
+    (compiled validator, schema) shared by all editors on the same schema file.
+    Compiling resolves $ref/$defs once per (path, mtime) instead of once per tab.
+    """
+    schema = _cached_schema(path, mtime_ns)
+    return (_make_validator(schema) if schema is not None else None), schema
+
+
+# Root keywords whose outcome depends only on the set of top-level keys and on each
+# key's own subschema; with anything else at the root only a full pass is sound
+_SCOPED_ROOT_KEYWORDS = frozenset({
+    "$schema", "$id", "$defs", "definitions", "$comment", "title", "description",
+    "type", "properties", "patternProperties", "additionalProperties", "required",
+})
+
+
+_REF_KEYWORDS = ("$ref", "$dynamicRef", "$recursiveRef")
+# Same-document refs a scoped schema can still resolve (the root's definitions are carried)
+_CARRIED_REF_PREFIXES = ("#/$defs/", "#/definitions/")
+
+
+def _has_root_relative_ref(node: Any) -> bool:
+    """
+    True if node holds a same-document ref other than into $defs/definitions ("#",
+    "#/properties/...", "#anchor"): those resolve against the document root, which a
+    scoped schema no longer is.
+    """
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        if isinstance(n, dict):
+            for kw in _REF_KEYWORDS:
+                ref = n.get(kw)
+                if isinstance(ref, str) and ref.startswith("#") and not ref.startswith(_CARRIED_REF_PREFIXES):
+                    return True
+            stack.extend(n.values())
+        elif isinstance(n, list):
+            stack.extend(n)
+    return False
+
+
+@functools.lru_cache(maxsize=4)
+def _scopable_schema(path: str, mtime_ns: int) -> Optional[Dict[str, Any]]:
+    """The root schema if per-key (scoped) validation is sound for it, else None."""
+    schema = _cached_schema(path, mtime_ns)
+    if not isinstance(schema, dict) or not _SCOPED_ROOT_KEYWORDS.issuperset(schema):
+        return None
+    if _has_root_relative_ref(schema):
+        return None
+    return schema
+
+
+@functools.lru_cache(maxsize=64)
+def _get_key_validator(path: str, mtime_ns: int, key: str) -> Optional[Any]:
+    """
+    Validator for the subschema of top-level property `key`, or None if errors under
+    `key` cannot be computed from its value alone.
+    """
+    schema = _scopable_schema(path, mtime_ns)
+    if schema is None:
+        return None
+    sub = schema.get("properties", {}).get(key)
+    if not isinstance(sub, dict):
+        return None
+    if any(re.search(pattern, key) for pattern in schema.get("patternProperties", {})):
+        return None
+    scoped = _scoped_schema(schema, sub)
+    return _make_validator(scoped) if scoped is not None else None
+
+
+def _scoped_schema(schema: Dict[str, Any], sub: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    sub as a standalone schema, or None if its refs would resolve differently: a
+    subschema with its own $defs (and no $id) would shadow the root's.
+    """
+    if "$id" not in sub and ("$defs" in sub or "definitions" in sub):
+        return None
+    scoped = dict(sub)
+    # Carry the root's base URI and definitions so "#/$defs/..." refs still resolve
+    for kw in ("$schema", "$id", "$defs", "definitions"):
+        if kw in schema and kw not in scoped:
+            scoped[kw] = schema[kw]
+    return scoped
+
+
+# Keywords of a top-level array property that still hold when elements are checked one
+# at a time and the array itself only by its length
+_STREAMABLE_ARRAY_KEYWORDS = frozenset({"type", "items", "minItems", "maxItems"}) | _ANNOTATION_KEYWORDS
+
+
+@functools.lru_cache(maxsize=4)
+def _get_stream_plan(path: str, mtime_ns: int) -> Optional[Dict[str, Any]]:
+    """
+    {key: length validator} for top-level array properties whose elements can be
+    validated one at a time, or None if the root schema could couple sibling keys
+    (then the document cannot be checked key by key at all).
+    """
+    schema = _scopable_schema(path, mtime_ns)
+    if schema is None:
+        return None
+    plan = {}
+    for key, sub in schema.get("properties", {}).items():
+        if (
+            isinstance(sub, dict)
+            and sub.get("type") == "array"
+            and isinstance(sub.get("items"), dict)
+            and _STREAMABLE_ARRAY_KEYWORDS.issuperset(sub)
+            and not any(re.search(pattern, key) for pattern in schema.get("patternProperties", {}))
+        ):
+            scoped = _scoped_schema(schema, {k: v for k, v in sub.items() if k != "items"})
+            if scoped is not None:
+                plan[key] = _make_validator(scoped)
+    return plan
+
+
+def _error_path(err: Any) -> Any:
+    """Instance path components of a validation error (jsonschema-rs or python-jsonschema)."""
+    path = getattr(err, "instance_path", None)
+    return err.path if path is None else path
+
+
+def _format_error(err: Any, prefix: Tuple[str, ...] = (), skip: int = 0) -> str:
+    parts = [*prefix, *(str(p) for p in list(_error_path(err))[skip:])]
+    loc = "$." + ".".join(parts) if parts else "$"
+    return f"{loc}: {err.message}"
+
+
+# Debounce bounds (ms); the interval tracks ~3x the last parse+validate wall time
+_DEBOUNCE_MIN_MS = 150
+_DEBOUNCE_MAX_MS = 1500
+
+# Diagnostics shown per validation pass; iteration stops once this many are found
+_MAX_DIAGNOSTICS = 50
+
+# Documents at least this long are parsed/validated on QThreadPool instead of the GUI thread
+_ASYNC_MIN_CHARS = 200_000
+
+# Documents at least this long are checked from an ijson event stream instead of a full
+# parse, so memory follows the largest array element rather than the whole document
+_STREAM_MIN_CHARS = 20_000_000
+
+
+@dataclass
+class _Baseline:
+    """
+    Diagnostics of the last complete (uncapped) pass over a top-level object, split by
+    top-level key, with the text they were computed for and where each top-level value
+    sits in it, so a later pass only revalidates the value the edit falls in.
+    """
+    text: str
+    # [start, end) of each top-level value in text; None until a later pass needs them,
+    # so a full pass parses the document once
+    spans: Optional[Dict[str, Tuple[int, int]]]
+    key_diags: Dict[str, List[str]]
+    root_diags: List[str]
+
+    def diags(self) -> List[str]:
+        out = list(self.root_diags)
+        for key_diags in self.key_diags.values():
+            out.extend(key_diags)
+        return out
+
+
+_DECODER = json.JSONDecoder()
+_WS = re.compile(r"[ \t\n\r]*")
+
+
+def _top_level_spans(text: str) -> Optional[Dict[str, Tuple[int, int]]]:
+    """
+    [start, end) of each value of a top-level object, in document order, or None if
+    text is not an object or repeats a key.
+    """
+    scan = _DECODER.scan_once
+    spans: Dict[str, Tuple[int, int]] = {}
+    try:
+        i = _WS.match(text).end()
+        if text[i:i + 1] != "{":
+            return None
+        i = _WS.match(text, i + 1).end()
+        if text[i:i + 1] == "}":
+            return spans
+        while True:
+            key, i = scan(text, i)
+            i = _WS.match(text, i).end()
+            if not isinstance(key, str) or key in spans or text[i:i + 1] != ":":
+                return None
+            start = _WS.match(text, i + 1).end()
+            _, i = scan(text, start)
+            spans[key] = (start, i)
+            i = _WS.match(text, i).end()
+            sep = text[i:i + 1]
+            if sep == "}":
+                return spans
+            if sep != ",":
+                return None
+            i = _WS.match(text, i + 1).end()
+    except (StopIteration, ValueError):
+        return None
+
+
+def _edit_range(old: str, new: str) -> Tuple[int, int, int]:
+    """
+    (start, old_end, new_end) such that new is old with old[start:old_end] replaced by
+    new[start:new_end]. The common prefix and suffix are found by bisection on slice
+    compares, so no character is compared twice.
+    """
+    n = min(len(old), len(new))
+    lo, hi = 0, n  # common prefix length is in [lo, hi]
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if old[lo:mid] == new[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    a, b = 0, n - lo  # common suffix length, not overlapping the prefix
+    lo_old, lo_new = len(old), len(new)
+    while a < b:
+        mid = (a + b + 1) // 2
+        if old[lo_old - mid:lo_old - a] == new[lo_new - mid:lo_new - a]:
+            a = mid
+        else:
+            b = mid - 1
+    return lo, len(old) - a, len(new) - a
+
+
+def _edited_key(baseline: _Baseline, text: str, obj: Dict[str, Any]) -> Optional[Tuple[str, Dict[str, Tuple[int, int]]]]:
+    """
+    (key, spans for text) if text differs from baseline.text only inside the value of
+    one top-level key, else None. Only that key's value needs revalidating.
+    """
+    if baseline.spans is None:
+        # {} when text has no usable spans (e.g. repeated keys): never matches below
+        baseline.spans = _top_level_spans(baseline.text) or {}
+    if obj.keys() != baseline.spans.keys():
+        return None
+    start, old_end, new_end = _edit_range(baseline.text, text)
+    for key, (s, e) in baseline.spans.items():
+        if s <= start and old_end <= e:
+            break
+    else:
+        return None
+    end = e + (new_end - old_end)
+    try:
+        # The edited span must still hold one whole value; the text around it is unchanged
+        json.loads(text[s:end])
+    except ValueError:
+        return None
+    delta = new_end - old_end
+    spans = {
+        k: (ks + delta, ke + delta) if ks >= e else ((ks, end) if k == key else (ks, ke))
+        for k, (ks, ke) in baseline.spans.items()
+    }
+    return key, spans
+
+
+@dataclass
+class _CheckResult:
+    text: str
+    parsed: Any = None
+    parse_exc: Optional[Exception] = None
+    diags: List[str] = field(default_factory=list)
+    status: str = ""
+    ok: Optional[bool] = None  # None: nothing to decorate (no schema)
+    elapsed_ms: float = 0.0
+    baseline: Optional[_Baseline] = None
+    streamed: bool = False  # checked without materializing; parsed is not available
+
+
+def _collect_errors(validator: Any, instance: Any, cancel: Optional[threading.Event]) -> Optional[List[Any]]:
+    # Lazily pull one past the cap: enough to know there are more, without walking
+    # the rest of the document
+    errors = []
+    for err in itertools.islice(validator.iter_errors(instance), _MAX_DIAGNOSTICS + 1):
+        if cancel is not None and cancel.is_set():
+            return None
+        errors.append(err)
+    return errors
+
+
+def _validate_full(
+    obj: Any,
+    validator: Any,
+    text: str,
+    scoped: bool,
+    cancel: Optional[threading.Event],
+) -> Optional[Tuple[List[str], bool, Optional[_Baseline]]]:
+    """(diags, capped, baseline) for a whole-document pass, or None if cancelled."""
+    errors = _collect_errors(validator, obj, cancel)
+    if errors is None:
+        return None
+    if not scoped or len(errors) > _MAX_DIAGNOSTICS:
+        return [_format_error(e) for e in errors[:_MAX_DIAGNOSTICS]], len(errors) > _MAX_DIAGNOSTICS, None
+    baseline = _Baseline(text, None, {k: [] for k in obj}, [])
+    for err in errors:
+        path = _error_path(err)
+        bucket = baseline.key_diags.get(str(path[0])) if len(path) else None
+        (baseline.root_diags if bucket is None else bucket).append(_format_error(err))
+    return baseline.diags(), False, baseline
+
+
+def _validate_key(
+    obj: Dict[str, Any],
+    baseline: _Baseline,
+    key: str,
+    validator: Any,
+    text: str,
+    spans: Dict[str, Tuple[int, int]],
+    cancel: Optional[threading.Event],
+) -> Optional[Tuple[List[str], bool, Optional[_Baseline]]]:
+    """Like _validate_full, revalidating only obj[key] against its subschema."""
+    errors = _collect_errors(validator, obj[key], cancel)
+    if errors is None:
+        return None
+    key_diags = dict(baseline.key_diags)
+    key_diags[key] = [_format_error(e, (key,)) for e in errors[:_MAX_DIAGNOSTICS]]
+    updated = _Baseline(text, spans, key_diags, baseline.root_diags)
+    if len(errors) > _MAX_DIAGNOSTICS:
+        # This key's list is incomplete; the next pass has to be a full one
+        return updated.diags(), True, None
+    return updated.diags(), False, updated
+
+
+def _check_text(
+    text: str,
+    validator: Optional[Any],
+    parse: Callable[[str], Any],
+    cancel: Optional[threading.Event] = None,
+    baseline: Optional[_Baseline] = None,
+    key_validator: Optional[Callable[[str], Optional[Any]]] = None,
+) -> Optional[_CheckResult]:
+    """
+    Parse and schema-check text without touching any widget, so it can run on a
+    worker thread. Returns None if cancel was set before the pass finished.
+
+    With a baseline from the previous pass and a key_validator (see _get_key_validator),
+    an edit inside one top-level value revalidates only that value.
+    """
+    t0 = time.perf_counter()
+    res = _CheckResult(text)
+    try:
+        res.parsed = parse(text)
+    except Exception as e:
+        res.parse_exc = e
+        res.diags.append(f"JSON parse error: {e}")
+        res.status = "Invalid JSON"
+        res.ok = False
+    else:
+        if validator is not None and res.parsed is not None:
+            try:
+                obj = res.parsed
+                outcome = None
+                scoped = isinstance(obj, dict) and key_validator is not None
+                if scoped and baseline is not None:
+                    edited = _edited_key(baseline, text, obj)
+                    if edited is not None:
+                        key, spans = edited
+                        sub = key_validator(key)
+                        if sub is not None:
+                            outcome = _validate_key(obj, baseline, key, sub, text, spans, cancel)
+                            if outcome is None:
+                                return None
+                if outcome is None:
+                    outcome = _validate_full(obj, validator, text, scoped, cancel)
+                if outcome is None:
+                    return None
+                diags, capped, res.baseline = outcome
+                if diags:
+                    res.diags = diags[:_MAX_DIAGNOSTICS]
+                    if capped or len(diags) > _MAX_DIAGNOSTICS:
+                        res.status = f"Schema invalid: {_MAX_DIAGNOSTICS}+ issue(s)"
+                    else:
+                        res.status = f"Schema invalid: {len(diags)} issue(s)"
+                    res.ok = False
+                else:
+                    res.status = "Valid JSON (schema OK)"
+                    res.ok = True
+            except Exception as e:
+                res.diags.append(f"Schema validation error: {e}")
+                res.status = "Schema validation failed"
+                res.ok = False
+        else:
+            # No schema loaded; only JSON checked
+            res.status = "Valid JSON (no schema)"
+    if cancel is not None and cancel.is_set():
+        return None
+    res.elapsed_ms = (time.perf_counter() - t0) * 1000.0
+    return res
+
+
+class _Utf8Reader:
+    """File-like UTF-8 view of a str, encoded chunk by chunk as ijson reads it."""
+
+    def __init__(self, text: str) -> None:
+        self._text = text
+        self._pos = 0
+
+    def read(self, size: int = -1) -> bytes:
+        end = len(self._text) if size < 0 else self._pos + size
+        chunk = self._text[self._pos:end]
+        self._pos += len(chunk)
+        return chunk.encode("utf-8")
+
+
+def _build_value(event: str, value: Any, events: Any) -> Any:
+    """Materialize one JSON value from an ijson event stream, starting at its first event."""
+    builder = ijson.ObjectBuilder()
+    builder.event(event, value)
+    depth = 1 if event in ("start_map", "start_array") else 0
+    while depth:
+        _, event, value = next(events)
+        builder.event(event, value)
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+    return builder.value
+
+
+def _stream_check_text(
+    text: str,
+    validator: Any,
+    plan: Dict[str, Any],
+    cancel: Optional[threading.Event] = None,
+) -> Optional[_CheckResult]:
+    """
+    Schema-check text like _check_text, but from an ijson event stream: each top-level
+    value is validated on its own as {key: value}, and arrays in plan one element at a
+    time. Only valid for roots accepted by _get_stream_plan, where errors under a key
+    depend on that key's value alone and the rest only on the set of keys.
+    """
+    t0 = time.perf_counter()
+    res = _CheckResult(text, streamed=True)
+    diags: List[str] = []
+    keys: Dict[str, None] = {}
+
+    def check(v: Any, instance: Any, keep: Callable[[Any], bool], fmt: Callable[[Any], str]) -> bool:
+        # False once the cap is reached; the rest of the stream is then only parsed
+        for err in v.iter_errors(instance):
+            if cancel is not None and cancel.is_set():
+                return False
+            if keep(err):
+                diags.append(fmt(err))
+                if len(diags) > _MAX_DIAGNOSTICS:
+                    return False
+        return True
+
+    try:
+        events = ijson.parse(_Utf8Reader(text), use_float=True)
+        _, event, value = next(events)
+        if event != "start_map":
+            # Not an object: nothing to split, validate it whole
+            check(validator, _build_value(event, value, events), lambda e: True, _format_error)
+        else:
+            checking = True
+            for _, event, key in events:
+                if cancel is not None and cancel.is_set():
+                    return None
+                if event == "end_map":
+                    break
+                keys[key] = None
+                _, event, value = next(events)
+                if checking and key in plan and event == "start_array":
+                    count = 0
+                    for _, event, value in events:
+                        if event == "end_array":
+                            break
+                        item = _build_value(event, value, events)
+                        if checking:
+                            checking = check(
+                                validator,
+                                {key: [item]},
+                                lambda e: len(_error_path(e)) > 1,
+                                lambda e, i=count: _format_error(e, (key, str(i)), skip=2),
+                            )
+                        count += 1
+                    if checking:
+                        checking = check(
+                            plan[key],
+                            [None] * count,
+                            lambda e: True,
+                            lambda e: _format_error(e, (key,)),
+                        )
+                elif checking:
+                    item = _build_value(event, value, events)
+                    checking = check(validator, {key: item}, lambda e: len(_error_path(e)) > 0, _format_error)
+                else:
+                    _build_value(event, value, events)
+            if checking:
+                # Root rules (required, additionalProperties: false) only see the key set
+                root: List[str] = []
+                for err in validator.iter_errors(dict.fromkeys(keys)):
+                    if not len(_error_path(err)):
+                        root.append(_format_error(err))
+                diags[:0] = root
+        # Drain to the end so trailing syntax errors are still reported
+        for _ in events:
+            if cancel is not None and cancel.is_set():
+                return None
+    except (ijson.JSONError, UnicodeError, StopIteration) as e:
+        if cancel is not None and cancel.is_set():
+            return None
+        res.parse_exc = e
+        res.diags = [f"JSON parse error: {str(e).strip()}"]
+        res.status = "Invalid JSON"
+        res.ok = False
+        res.elapsed_ms = (time.perf_counter() - t0) * 1000.0
+        return res
+    except Exception as e:
+        res.diags = [f"Schema validation error: {e}"]
+        res.status = "Schema validation failed"
+        res.ok = False
+        res.elapsed_ms = (time.perf_counter() - t0) * 1000.0
+        return res
+    if cancel is not None and cancel.is_set():
+        return None
+    if diags:
+        res.diags = diags[:_MAX_DIAGNOSTICS]
+        if len(diags) > _MAX_DIAGNOSTICS:
+            res.status = f"Schema invalid: {_MAX_DIAGNOSTICS}+ issue(s)"
+        else:
+            res.status = f"Schema invalid: {len(diags)} issue(s)"
+        res.ok = False
+    else:
+        res.status = "Valid JSON (schema OK)"
+        res.ok = True
+    res.elapsed_ms = (time.perf_counter() - t0) * 1000.0
+    return res
+
+
+class _ValidateSignals(QObject):
+    """
+    Result channel of an editor's validation jobs. It has no Qt parent and each job
+    holds a reference, so it outlives the editor while a pass is in flight.
+    """
+
+    done = Signal(int, object)  # (generation, _CheckResult)
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Set when the editor is destroyed; in-flight passes then drop their results
+        self.closed = threading.Event()
+        # Cancel event of the pass currently running, if any
+        self.inflight: Optional[threading.Event] = None
+
+    def close(self) -> None:
+        self.closed.set()
+        if self.inflight is not None:
+            self.inflight.set()
+
+
+class _ValidateJob(QRunnable):
+    """
+    One background parse + validate pass. Results are posted back through a queued
+    signal; a set cancel event makes the job drop its result.
+    """
+
+    def __init__(
+        self,
+        generation: int,
+        check: Callable[[threading.Event], Optional[_CheckResult]],
+        cancel: threading.Event,
+        signals: _ValidateSignals,
+    ) -> None:
+        super().__init__()
+        self._generation = generation
+        self._check = check
+        self._cancel = cancel
+        self._signals = signals
+
+    def run(self) -> None:
+        if self._signals.closed.is_set():
+            return
+        res = self._check(self._cancel)
+        if res is not None and not self._cancel.is_set() and not self._signals.closed.is_set():
+            self._signals.done.emit(self._generation, res)
 
 
 class JsonEditorWidget(QWidget):
@@ -65,13 +811,35 @@ class JsonEditorWidget(QWidget):
         super().__init__(parent)
         self._schema_path: Optional[Path] = Path(schema_path) if schema_path else None
         self._schema: Optional[Any] = None
-        self._validator: Optional[Draft202012Validator] = None  # type: ignore
+        self._validator: Optional[Any] = None
+        # Editor contents for the current revision; dropped on every textChanged
+        self._text_cache: Optional[str] = None
         self._build_ui()
         self._debounce = QTimer(self)
         self._debounce.setSingleShot(True)
         self._debounce.setInterval(400)
         self._debounce.timeout.connect(self._validate_now)
+        self._last_validate_ms: Optional[float] = None
+        # Text of the last completed validation pass (None forces the next pass)
+        self._last_validated_text: Optional[str] = None
         self._current_path: Optional[Path] = None
+        # One parse per text revision, shared by validation, parsed(), save and format
+        self._parse_text: Optional[str] = None
+        self._parse_obj: Any = None
+        self._parse_exc: Optional[Exception] = None
+        # Background validation: newest generation wins; older passes are cancelled
+        self._validate_gen = 0
+        self._validate_cancel: Optional[threading.Event] = None
+        self._inflight_text: Optional[str] = None
+        self._validate_signals = _ValidateSignals()
+        # Incremental validation: per-key record of the last complete pass
+        self._baseline: Optional[_Baseline] = None
+        self._key_validator: Optional[Callable[[str], Optional[Any]]] = None
+        self._schema_key: Optional[Tuple[str, int]] = None  # (path, mtime_ns) of the loaded schema
+        self._validate_signals.done.connect(self._on_validation_done)
+        # Must not capture self: it runs while the editor is being torn down
+        signals = self._validate_signals
+        self.destroyed.connect(lambda *_: signals.close())
 
         if self._schema_path:
             self._try_load_schema(self._schema_path)
@@ -85,7 +853,7 @@ class JsonEditorWidget(QWidget):
         self.btn_schema_browse = QPushButton("Browse…")
         self.btn_schema_browse.clicked.connect(self._on_browse_schema)
         self.btn_validate = QPushButton("Validate now")
-        self.btn_validate.clicked.connect(self._validate_now)
+        self.btn_validate.clicked.connect(lambda: self._validate_now(force=True))
         self.lbl_status = QLabel("")
         self.lbl_status.setStyleSheet("color: #666;")
 
@@ -143,19 +911,42 @@ class JsonEditorWidget(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "Open File Error", f"{path}: {e}")
 
+    def current_path(self) -> Optional[Path]:
+        return self._current_path
+
+    def is_modified(self) -> bool:
+        return self.editor.document().isModified()
+
     def set_text(self, text: str) -> None:
         self.editor.setPlainText(text)
 
     def text(self) -> str:
-        return self.editor.toPlainText()
+        if self._text_cache is None:
+            self._text_cache = self.editor.toPlainText()
+        return self._text_cache
 
     def parsed(self) -> Optional[Any]:
         try:
-            return _load_json(self.text())
+            return self._parse_cached(self.text())
         except Exception:
             return None
 
     # Internal
+    def _parse_cached(self, text: str) -> Any:
+        """
+        Parse text, reusing the previous result (or error) if the text is unchanged.
+        The returned object is shared between callers; treat it as read-only.
+        """
+        if text != self._parse_text:
+            try:
+                obj, exc = _load_json(text), None
+            except Exception as e:
+                obj, exc = None, e
+            self._parse_text, self._parse_obj, self._parse_exc = text, obj, exc
+        if self._parse_exc is not None:
+            raise self._parse_exc
+        return self._parse_obj
+
     def _on_browse_schema(self) -> None:
         p, _ = QFileDialog.getOpenFileName(self, "Choose Schema", self.schema_edit.text().strip() or ".", "JSON (*.json)")
         if p:
@@ -163,72 +954,119 @@ class JsonEditorWidget(QWidget):
 
     def _try_load_schema(self, path: Path) -> None:
         try:
-            self._schema = _load_schema(path)
-            if _HAS_JSONSCHEMA and self._schema is not None:
-                self._validator = Draft202012Validator(self._schema)  # type: ignore
+            mtime_ns = path.stat().st_mtime_ns
+            self._validator, self._schema = _get_validator(str(path), mtime_ns)
+            self._key_validator = functools.partial(_get_key_validator, str(path), mtime_ns)
+            self._schema_key = (str(path), mtime_ns)
             self.lbl_status.setText(f"Loaded schema: {path}")
         except Exception as e:
             self._schema = None
             self._validator = None
+            self._key_validator = None
+            self._schema_key = None
             self.lbl_status.setText(f"Schema load error: {e}")
+        self._last_validated_text = None
+        self._baseline = None
 
     def _on_text_changed(self) -> None:
+        self._text_cache = None
         # debounce validation to avoid on-every-keystroke heavy work
         self._debounce.start()
 
-    def _validate_now(self) -> None:
+    def _validate_now(self, force: bool = False) -> None:
         text = self.text()
-        diags: List[str] = []
-
-        # Clear diagnostics view
-        self.diag_list.clear()
+        # No-op edits (undo back to the same text, re-inserting identical content)
+        # leave the previous diagnostics valid
+        if not force and (text == self._last_validated_text or text == self._inflight_text):
+            return
+        # Any pass still running is for older text
+        if self._validate_cancel is not None:
+            self._validate_cancel.set()
+            self._validate_cancel = None
+        self._validate_gen += 1
+        # An explicit request always revalidates the whole document
+        baseline = None if force else self._baseline
 
-        # Step 1: parse JSON
-        parsed_obj: Optional[Any] = None
-        try:
-            parsed_obj = _load_json(text)
-            self.textParsed.emit(parsed_obj)
-        except Exception as e:
-            msg = f"JSON parse error: {e}"
-            diags.append(msg)
-            self.diag_list.addItem(QListWidgetItem(msg))
-            self.lbl_status.setText("Invalid JSON")
-            self._decorate_editor_valid(False)
-            self.diagnosticsUpdated.emit(diags)
+        if len(text) < _ASYNC_MIN_CHARS:
+            self._inflight_text = None
+            res = _check_text(text, self._validator, self._parse_cached, None, baseline, self._key_validator)
+            if res is not None:
+                self._apply_validation(res)
             return
 
-        # Step 2: schema validation
-        if self._validator is not None and parsed_obj is not None:
+        parse: Callable[[str], Any] = _load_json
+        if text == self._parse_text:
+            # Already parsed on this thread (e.g. by Save/Format); hand the result over
+            parsed, parse_exc = self._parse_obj, self._parse_exc
+
+            def parse(_text: str) -> Any:
+                if parse_exc is not None:
+                    raise parse_exc
+                return parsed
+
+        plan = None
+        if _HAS_IJSON and len(text) >= _STREAM_MIN_CHARS and self._validator is not None and text != self._parse_text:
             try:
-                errors = list(self._validator.iter_errors(parsed_obj))  # type: ignore
-                if errors:
-                    for err in errors[:50]:
-                        loc = "$." + ".".join(str(p) for p in err.path)
-                        msg = f"{loc}: {err.message}"
-                        diags.append(msg)
-                        self.diag_list.addItem(QListWidgetItem(msg))
-                    self.lbl_status.setText(f"Schema invalid: {len(errors)} issue(s)")
-                    self._decorate_editor_valid(False)
-                else:
-                    self.lbl_status.setText("Valid JSON (schema OK)")
-                    self._decorate_editor_valid(True)
-            except Exception as e:
-                msg = f"Schema validation error: {e}"
-                diags.append(msg)
-                self.diag_list.addItem(QListWidgetItem(msg))
-                self.lbl_status.setText("Schema validation failed")
-                self._decorate_editor_valid(False)
+                plan = _get_stream_plan(*self._schema_key) if self._schema_key else None
+            except Exception:
+                plan = None
+        if plan is not None:
+            check = functools.partial(_stream_check_text, text, self._validator, plan)
         else:
-            # No schema loaded; only JSON checked
-            self.lbl_status.setText("Valid JSON (no schema)")
+            check = functools.partial(
+                _check_text, text, self._validator, parse, baseline=baseline, key_validator=self._key_validator
+            )
 
-        self.diagnosticsUpdated.emit(diags)
+        cancel = threading.Event()
+        self._validate_cancel = cancel
+        self._validate_signals.inflight = cancel
+        self._inflight_text = text
+        self.lbl_status.setText("Validating…")
+        job = _ValidateJob(self._validate_gen, check, cancel, self._validate_signals)
+        QThreadPool.globalInstance().start(job)
+
+    def _on_validation_done(self, generation: int, res: _CheckResult) -> None:
+        if generation != self._validate_gen:
+            return  # superseded by a newer edit
+        self._validate_cancel = None
+        self._validate_signals.inflight = None
+        self._inflight_text = None
+        if not res.streamed:
+            # Seed the parse cache so Save/Format/parsed() reuse the worker's parse
+            self._parse_text, self._parse_obj, self._parse_exc = res.text, res.parsed, res.parse_exc
+        self._apply_validation(res)
+
+    def _apply_validation(self, res: _CheckResult) -> None:
+        if res.parse_exc is None and not res.streamed:
+            self.textParsed.emit(res.parsed)
+        self._show_diagnostics(res.diags)
+        self.lbl_status.setText(res.status)
+        if res.ok is not None:
+            self._decorate_editor_valid(res.ok)
+        self._last_validated_text = res.text
+        self._baseline = res.baseline
+        # Adapt the debounce to document cost: snappy on small docs, no thrashing on huge ones
+        self._last_validate_ms = res.elapsed_ms
+        self._debounce.setInterval(max(_DEBOUNCE_MIN_MS, min(_DEBOUNCE_MAX_MS, int(res.elapsed_ms * 3))))
+        self.diagnosticsUpdated.emit(res.diags)
+
+    def _show_diagnostics(self, diags: List[str]) -> None:
+        # One repaint for the whole batch; addItems builds the items on the C++ side
+        self.diag_list.setUpdatesEnabled(False)
+        try:
+            self.diag_list.clear()
+            if diags:
+                self.diag_list.addItems(diags)
+        finally:
+            self.diag_list.setUpdatesEnabled(True)
 
     def _decorate_editor_valid(self, ok: bool) -> None:
-        if ok:
-            self.editor.setStyleSheet("QPlainTextEdit { background: #f8fff8; }")
-        else:
-            self.editor.setStyleSheet("QPlainTextEdit { background: #fff8f8; }")
+        # Restyling must not feed back into textChanged -> debounce -> validate
+        with QSignalBlocker(self.editor):
+            if ok:
+                self.editor.setStyleSheet("QPlainTextEdit { background: #f8fff8; }")
+            else:
+                self.editor.setStyleSheet("QPlainTextEdit { background: #fff8f8; }")
 
     # -------------------------
     # File ops and utilities
@@ -242,15 +1080,14 @@ class JsonEditorWidget(QWidget):
         if not p:
             return
         try:
-            parsed = _load_json(self.text())
+            parsed = self._parse_cached(self.text())
         except Exception as e:
             QMessageBox.information(self, "Save", f"Cannot save: invalid JSON: {e}")
             return
         try:
-            with open(p, "w", encoding="utf-8") as f:
-                json.dump(parsed, f, indent=2, ensure_ascii=False)
-                f.write("\n")
+            write_atomic(p, _dump_json(parsed) + b"\n")
             self._current_path = Path(p)
+            self.editor.document().setModified(False)
             self.lbl_status.setText(f"Saved: {p}")
         except Exception as e:
             QMessageBox.critical(self, "Save Error", f"{p}: {e}")
@@ -263,8 +1100,12 @@ class JsonEditorWidget(QWidget):
 
     def _on_format(self) -> None:
         try:
-            parsed = _load_json(self.text())
-            pretty = json.dumps(parsed, indent=2, ensure_ascii=False)
+            parsed = self._parse_cached(self.text())
+            pretty = _dump_json(parsed).decode("utf-8")
+            if pretty == self.text():
+                # Keep the document (and its undo stack and cursor) untouched
+                self.lbl_status.setText("Already formatted")
+                return
             self.editor.setPlainText(pretty)
             self.lbl_status.setText("Formatted JSON")
         except Exception as e:
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
 import os
 import sys
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import Qt, QProcess, QSize, QDir
+from PySide6.QtCore import Qt, QCoreApplication, QProcess, QSize, QDir, QTimer
 from PySide6.QtGui import QAction, QIcon
 from PySide6.QtWidgets import (
     QMainWindow,
@@ -36,15 +39,20 @@ from PySide6.QtWidgets import (
 from .json_editor import JsonEditorWidget
 from .process_controller import ProcessController
 from .dashboard import DashboardWidget
-from .state import load_workspace, save_workspace, update_params, update_last_opened
+from .io_pool import submit_io, wait_for_io
+from .state import encode_workspace, load_workspace, update_params, update_last_opened, write_workspace_bytes
 from .fs_watcher import FSWatcher
 from .project_explorer import ProjectExplorer
 
 
+# Path helpers are resolved once per process: handlers call them on every click and
+# Path.resolve() stats each component
+@functools.lru_cache(maxsize=1)
 def repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
+@functools.lru_cache(maxsize=1)
 def venv_python() -> str:
     # Use the repo's venv if present, else current interpreter
     root = repo_root()
@@ -54,18 +62,30 @@ def venv_python() -> str:
     return sys.executable
 
 
+@functools.lru_cache(maxsize=1)
 def default_schema() -> str:
     return str(repo_root() / "docs" / "ir" / "cgir-schema.json")
 
 
+@functools.lru_cache(maxsize=1)
 def default_examples_dir() -> str:
     return str(repo_root() / "examples" / "cgir")
 
 
+@functools.lru_cache(maxsize=1)
 def default_build_dir() -> str:
     return str(repo_root() / "build" / "cgir")
 
 
+# Editor tabs kept alive at once; the least recently used unmodified one is closed beyond this
+MAX_EDITOR_TABS = 8
+
+# Cooldown between filesystem-driven dashboard refreshes
+DASHBOARD_REFRESH_COOLDOWN_MS = 300
+
+# Workspace preference changes within this window are written once
+WORKSPACE_SAVE_DELAY_MS = 500
+
 
 
 class ParamsPanel(QWidget):
@@ -141,16 +161,34 @@ class MainWindow(QMainWindow):
     def _init_state(self) -> None:
         self.python = venv_python()
         self.root = repo_root()
+        # CLI scripts launched by the Run actions
+        self._tool_paths = {
+            name: str(self.root / "tools" / "cgir" / f"cli_{name}.py")
+            for name in ("validate", "sim", "viz", "verify", "train")
+        }
         # Load workspace preferences
         self._ws = load_workspace()
+        # Preference writes are coalesced and skipped when nothing persisted changed
+        self._ws_snapshot: Optional[bytes] = self._ws_fingerprint()
+        self._ws_save_timer = QTimer(self)
+        self._ws_save_timer.setSingleShot(True)
+        self._ws_save_timer.setInterval(WORKSPACE_SAVE_DELAY_MS)
+        self._ws_save_timer.timeout.connect(self._flush_ws)
+        # Quitting without closing the window (e.g. QApplication.quit()) skips closeEvent
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._on_about_to_quit)
         self.schema_path = self._ws.params.schema
         self.proc = ProcessController(self)
         self.current_file: Optional[Path] = None
+        # Open editors by resolved path, least recently used first
+        self._editors_by_path: "OrderedDict[Path, JsonEditorWidget]" = OrderedDict()
 
     def _create_widgets(self) -> None:
         # Central tabs
         self.tabs = QTabWidget(self)
         self.setCentralWidget(self.tabs)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
         # Welcome tab
         welcome = QTextEdit(self)
@@ -163,7 +201,8 @@ class MainWindow(QMainWindow):
         self.tabs.addTab(welcome, "Welcome")
         # Dashboard tab
         self.dashboard = DashboardWidget(self, on_open_file=self.open_in_editor)
-        self.tabs.addTab(self.dashboard, "Dashboard")
+        self._dashboard_tab_index = self.tabs.addTab(self.dashboard, "Dashboard")
+        self.tabs.tabBar().tabMoved.connect(lambda _f, _t: self._recompute_tab_indices())
 
         # Dock: Project Explorer
         self.explorer = ProjectExplorer(self)
@@ -221,11 +260,19 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-        # Filesystem watcher: auto-refresh Dashboard on workspace/artifacts changes
+        # Throttle for watcher-driven refreshes: refresh on the first event, then at most
+        # once more when the cooldown ends if further events arrived meanwhile
+        self._refresh_pending = False
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(DASHBOARD_REFRESH_COOLDOWN_MS)
+        self._refresh_timer.timeout.connect(self._on_refresh_cooldown)
+
+        # Filesystem watcher: auto-refresh Dashboard (and Explorer) on workspace/artifacts changes
         try:
             self.fs = FSWatcher(self)
             self.fs.watch([repo_root() / ".cgir", Path(default_examples_dir()), Path(default_build_dir())])
-            self.fs.changed.connect(lambda _p: self.dashboard.refresh())
+            self.fs.changed.connect(self._on_fs_changed)
         except Exception:
             pass
 
@@ -324,9 +371,6 @@ class MainWindow(QMainWindow):
             return sel
         return Path(default_examples_dir())
 
-    def _tools_path(self, rel: str) -> str:
-        return str(self.root / rel)
-
     # ----------------------------
     # File/Folder actions
     # ----------------------------
@@ -350,7 +394,7 @@ class MainWindow(QMainWindow):
         # Persist preference
         try:
             self._ws = update_last_opened(self._ws, directory=p)
-            save_workspace(self._ws)
+            self._ws_save_timer.start()
         except Exception:
             pass
 
@@ -363,20 +407,71 @@ class MainWindow(QMainWindow):
 
     def open_in_editor(self, path: Path) -> None:
         try:
-            editor = JsonEditorWidget(self, schema_path=default_schema())
-            editor.load_file(path)
-            self.tabs.addTab(editor, path.name)
+            key = Path(path).resolve()
+            editor = self._editors_by_path.get(key)
+            if editor is None:
+                editor = JsonEditorWidget(self, schema_path=default_schema())
+                editor.load_file(path)
+                self._editors_by_path[key] = editor
+                self.tabs.addTab(editor, path.name)
+                self._evict_editors(keep=key)
             self.tabs.setCurrentWidget(editor)
             self.statusBar().showMessage(str(path))
             # Update workspace recents
             try:
                 self._ws = update_last_opened(self._ws, file=str(path))
-                save_workspace(self._ws)
+                self._ws_save_timer.start()
             except Exception:
                 pass
         except Exception as e:
             QMessageBox.critical(self, "Open in Editor Error", f"{path}: {e}")
 
+    def _on_tab_changed(self, index: int) -> None:
+        w = self.tabs.widget(index)
+        if isinstance(w, JsonEditorWidget):
+            for key, editor in self._editors_by_path.items():
+                if editor is w:
+                    self._editors_by_path.move_to_end(key)
+                    break
+
+    def _evict_editors(self, keep: Optional[Path] = None) -> None:
+        """
+        Close least recently used editor tabs beyond MAX_EDITOR_TABS. Editors with
+        unsaved changes are never closed, nor is keep (the editor being opened), so
+        the cap is soft.
+        """
+        excess = len(self._editors_by_path) - MAX_EDITOR_TABS
+        if excess <= 0:
+            return
+        victims = [
+            k for k, ed in self._editors_by_path.items() if k != keep and not ed.is_modified()
+        ][:excess]
+        for key in victims:
+            editor = self._editors_by_path.pop(key)
+            idx = self.tabs.indexOf(editor)
+            if idx != -1:
+                self.tabs.removeTab(idx)
+            editor.deleteLater()
+
+    def _on_fs_changed(self, _path: str) -> None:
+        if self._refresh_timer.isActive():
+            self._refresh_pending = True
+            return
+        self._refresh_views()
+        self._refresh_timer.start()
+
+    def _refresh_views(self) -> None:
+        self.dashboard.refresh()
+        # Cheap when nothing changed: one stat per directory already listed
+        self.explorer.refresh()
+
+    def _on_refresh_cooldown(self) -> None:
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self._refresh_views()
+            # Events during the trailing refresh's own cooldown are coalesced again
+            self._refresh_timer.start()
+
     # ----------------------------
     # Run: Validate
     # ----------------------------
@@ -385,7 +480,7 @@ class MainWindow(QMainWindow):
         schema = self.params_panel.params()["schema"]
         cmd = [
             self.python,
-            self._tools_path("tools/cgir/cli_validate.py"),
+            self._tool_paths["validate"],
             "--in", str(target),
             "--schema", schema,
             "--print-report", "text",
@@ -404,7 +499,7 @@ class MainWindow(QMainWindow):
         schema = params["schema"]
         cmd = [
             self.python,
-            self._tools_path("tools/cgir/cli_sim.py"),
+            self._tool_paths["sim"],
             "--in", str(target),
             "--out", str(out_dir),
             "--schema", schema,
@@ -434,7 +529,7 @@ class MainWindow(QMainWindow):
         L = 0.65
         cmd = [
             self.python,
-            self._tools_path("tools/cgir/cli_viz.py"),
+            self._tool_paths["viz"],
             "--in", str(target),
             "--slice-L", str(L),
             "--out", str(out_dir),
@@ -465,16 +560,37 @@ class MainWindow(QMainWindow):
                 dp=int(self.params_panel.spin_dp.value()),
                 out_dir=self.params_panel.edit_out.text().strip(),
             )
-            save_workspace(self._ws)
+            self._ws_save_timer.start()
         except Exception:
             # Non-fatal
             pass
 
-    def closeEvent(self, event) -> None:
+    def _ws_fingerprint(self) -> Optional[bytes]:
+        # updated_at is bumped by every update_* call, so it is left out of the digest
+        try:
+            return hashlib.blake2b(encode_workspace(self._ws, stamp=False), digest_size=16).digest()
+        except Exception:
+            return None
+
+    def _flush_ws(self) -> None:
+        self._ws_save_timer.stop()
+        snapshot = self._ws_fingerprint()
+        if snapshot is not None and snapshot == self._ws_snapshot:
+            return
         try:
-            save_workspace(self._ws)
+            # Encoded here (a snapshot of the live state), written on the I/O thread
+            submit_io(write_workspace_bytes, encode_workspace(self._ws))
+            self._ws_snapshot = snapshot
         except Exception:
             pass
+
+    def _on_about_to_quit(self) -> None:
+        self._flush_ws()
+        wait_for_io()
+
+    def closeEvent(self, event) -> None:
+        # Write any pending change now; the timer would never fire after close
+        self._flush_ws()
         super().closeEvent(event)
 
     # ----------------------------
@@ -489,7 +605,7 @@ class MainWindow(QMainWindow):
             return
         cmd = [
             self.python,
-            self._tools_path("tools/cgir/cli_verify.py"),
+            self._tool_paths["verify"],
             "--a", A,
             "--b", B,
             "--tol", "1e-12",
@@ -497,11 +613,17 @@ class MainWindow(QMainWindow):
         metadata = {"task": "verify", "A": A, "B": B, "tol": 1e-12}
         self.proc.run(cmd, workdir=self.root, metadata=metadata)
 
+    def _recompute_tab_indices(self) -> None:
+        self._dashboard_tab_index = self.tabs.indexOf(self.dashboard)
+
     def show_dashboard(self) -> None:
         try:
-            idx = self.tabs.indexOf(self.dashboard)
-            if idx != -1:
-                self.tabs.setCurrentIndex(idx)
+            # Editor tabs are appended after the dashboard, so the cached index only
+            # goes stale when tabs are reordered; the widget check covers that case.
+            if self.tabs.widget(self._dashboard_tab_index) is not self.dashboard:
+                self._recompute_tab_indices()
+            if self._dashboard_tab_index != -1:
+                self.tabs.setCurrentIndex(self._dashboard_tab_index)
         except Exception:
             # Non-fatal if dashboard not yet constructed
             pass
@@ -516,7 +638,7 @@ class MainWindow(QMainWindow):
         dp = self.params_panel.params()["dp"]
         cmd = [
             self.python,
-            self._tools_path("tools/cgir/cli_train.py"),
+            self._tool_paths["train"],
             "--in", str(target),
             "--out", str(out_dir),
             "--quantize-dp", str(dp),
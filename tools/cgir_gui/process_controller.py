@@ -2,33 +2,194 @@
 
 from __future__ import annotations
 
+import codecs
+import functools
 import json
+import mmap
 import os
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-from PySide6.QtCore import QObject, QProcess, QProcessEnvironment, QTimer, Signal
+from PySide6.QtCore import QCoreApplication, QObject, QProcess, QProcessEnvironment, QSocketNotifier, QTimer, Signal
 
+from .io_pool import submit_io, wait_for_io
 
+# Optional fast JSON (C serializer); stdlib json is the fallback
+try:
+    import orjson
+    _HAS_ORJSON = True
+except Exception:
+    orjson = None  # type: ignore
+    _HAS_ORJSON = False
+
+
+@functools.lru_cache(maxsize=1)
 def repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
+_RUNS_DIR = repo_root() / ".cgir" / "runs"
+_LOGS_DIR = repo_root() / ".cgir" / "logs"
+_run_dirs_ready = False
+
+# POSIX: the child's stdout/stderr go to a pipe we own, read with os.read as soon as
+# data arrives (no QProcess ring buffer). Elsewhere QProcess' own channel is used.
+_RAW_PIPE = os.name == "posix" and os.path.isdir("/dev/fd")
+
+DEFAULT_KILL_GRACE_MS = 2000
+# Output is handed to the log/output signal at most once per interval (~frame cadence)
+OUTPUT_FLUSH_MS = 30
+_MAX_KILL_GRACE_MS = 60_000
+
+
+def _clamp_grace(ms: int) -> int:
+    """Kill grace in (0, 60 s), so terminate() always escalates in bounded time."""
+    return min(max(int(ms), 1), _MAX_KILL_GRACE_MS - 1)
+
+
+def _ensure_run_dirs(force: bool = False) -> None:
+    """Create .cgir/runs and .cgir/logs once per process (again with force=True)."""
+    global _run_dirs_ready
+    if force or not _run_dirs_ready:
+        _RUNS_DIR.mkdir(parents=True, exist_ok=True)
+        _LOGS_DIR.mkdir(parents=True, exist_ok=True)
+        _run_dirs_ready = True
+
+
 @dataclass
 class ProcessResult:
     exit_code: int
-    stdout: str
+    stdout: Optional[str] = None  # None: not kept in memory, see read_stdout()
     log_path: Optional[Path] = None
     run_meta: Optional[Dict[str, Any]] = None
+    stdout_path: Optional[Path] = None
+    stdout_offset: int = 0  # bytes of log header preceding the process output
+
+    def read_stdout(self, max_bytes: Optional[int] = None) -> str:
+        """
+        Process output, read from the log file on demand (UTF-8, invalid bytes
+        dropped). With max_bytes, only the last max_bytes bytes are read.
+        """
+        if self.stdout is not None:
+            return self.stdout
+        if self.stdout_path is None:
+            return ""
+        try:
+            with self.stdout_path.open("rb") as fh:
+                size = os.fstat(fh.fileno()).st_size
+                start = self.stdout_offset if max_bytes is None else max(self.stdout_offset, size - max_bytes)
+                if start >= size:
+                    return ""
+                with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return mm[start:size].decode("utf-8", errors="ignore")
+        except Exception:
+            return ""
+
+
+def _write_synced(path: Path, data: bytes) -> None:
+    with path.open("wb") as fh:
+        fh.write(data)
+        fh.flush()
+        os.fsync(fh.fileno())
+
+
+class RunMetaWriter(QObject):
+    """
+    Batches .cgir/runs/*.json writes: finished runs are queued and encoded together
+    on a timer tick (or an explicit flush()), then written on the I/O thread.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None, interval_ms: int = 500) -> None:
+        super().__init__(parent)
+        self._pending: List[Tuple[Path, Dict[str, Any]]] = []
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(int(interval_ms))
+        self._timer.timeout.connect(self.flush)
+
+    def submit(self, path: Path, payload: Dict[str, Any]) -> None:
+        self._pending.append((path, payload))
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self) -> None:
+        self._timer.stop()
+        pending, self._pending = self._pending, []
+        for path, payload in pending:
+            try:
+                if _HAS_ORJSON:
+                    data = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+                else:
+                    data = (json.dumps(payload, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+                submit_io(_write_synced, path, data)
+            except Exception:
+                # Non-fatal
+                pass
+
+
+class _BufferedLog:
+    """
+    Binary append log that batches writes: buffered data goes to the OS once 64 KiB have
+    accumulated, and on flush()/close(). ProcessController flushes it on every output
+    tick (OUTPUT_FLUSH_MS), so the log follows the run even when output pauses.
+    """
+
+    # O_BINARY: no CRLF translation on Windows (0 elsewhere)
+    _FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+    def __init__(self, path: Path, max_bytes: int = 65536) -> None:
+        # 0o666: the umask applies as it does for open()
+        self._fd: Optional[int] = os.open(path, self._FLAGS, 0o666)
+        self._buf = bytearray()
+        self._max_bytes = max_bytes
+
+    def write(self, data: bytes) -> None:
+        self._buf += data
+        if len(self._buf) >= self._max_bytes:
+            self.flush()
+
+    def flush(self) -> None:
+        while self._buf:
+            # os.write may be partial (EINTR is retried by Python); keep whatever was not taken
+            del self._buf[:os.write(self._fd, self._buf)]
+
+    def close(self) -> None:
+        if self._fd is None:
+            return
+        try:
+            self.flush()
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+
+_run_meta_writer: Optional[RunMetaWriter] = None
+
+
+def run_meta_writer() -> RunMetaWriter:
+    """Process-wide RunMetaWriter; flushed when the application is about to quit."""
+    global _run_meta_writer
+    if _run_meta_writer is None:
+        app = QCoreApplication.instance()
+        _run_meta_writer = RunMetaWriter(app)
+        if app is not None:
+            app.aboutToQuit.connect(_flush_run_meta_and_wait)
+    return _run_meta_writer
+
+
+def _flush_run_meta_and_wait() -> None:
+    if _run_meta_writer is not None:
+        _run_meta_writer.flush()
+    wait_for_io()
 
 
 class ProcessController(QObject):
     """
     QProcess wrapper with:
       - Signals for started/output/finished/error/timeout
-      - Optional timeout with hard-kill grace period
+      - Optional timeout with hard-kill grace period (kill_grace_ms)
       - Structured reproducibility capture to .cgir/runs/*.json
       - Streaming log file to .cgir/logs/*.log
     """
@@ -42,21 +203,39 @@ class ProcessController(QObject):
     # Optional sink (e.g., QTextEdit) set by owner; not strictly required
     log_sink: Optional[Any] = None
 
-    def __init__(self, parent: Optional[QObject] = None) -> None:
+    def __init__(self, parent: Optional[QObject] = None, *, kill_grace_ms: int = DEFAULT_KILL_GRACE_MS) -> None:
         super().__init__(parent)
         self._proc: Optional[QProcess] = None
-        self._buffer: list[str] = []
+        self._default_kill_grace_ms = _clamp_grace(kill_grace_ms)
+        self._kill_grace_ms = self._default_kill_grace_ms
         self._workdir: Optional[Path] = None
         self._on_finish: Optional[Callable[[int], None]] = None
 
-        self._timeout_timer: Optional[QTimer] = None
-        self._kill_timer: Optional[QTimer] = None
+        # Allocated once and reused by every run
+        self._timeout_timer = QTimer(self)
+        self._timeout_timer.setSingleShot(True)
+        self._timeout_timer.timeout.connect(self._on_timeout)
+        self._kill_timer = QTimer(self)
+        self._kill_timer.setSingleShot(True)
+        self._kill_timer.timeout.connect(self._kill_now)
+        self._pending_out: List[bytes] = []
+        self._out_timer = QTimer(self)
+        self._out_timer.setSingleShot(True)
+        self._out_timer.setInterval(OUTPUT_FLUSH_MS)
+        self._out_timer.timeout.connect(self._flush_output)
 
         self._log_path: Optional[Path] = None
-        self._log_fh: Optional[Any] = None
+        self._log_fh: Optional[_BufferedLog] = None
+        self._stdout_offset = 0
+        # Decodes output for the output signal only; the log gets the raw bytes
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
         self._run_json_path: Optional[Path] = None
         self._run_meta: Dict[str, Any] = {}
 
+        # Raw output pipe (see _RAW_PIPE)
+        self._pipe_r: Optional[int] = None
+        self._notifier: Optional[QSocketNotifier] = None
+
     def run(
         self,
         cmd: list[str],
@@ -66,9 +245,15 @@ class ProcessController(QObject):
         env: Optional[Dict[str, str]] = None,
         timeout_ms: Optional[int] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        kill_grace_ms: Optional[int] = None,
     ) -> None:
         """
         Start a command. If a process is already running, emit error and ignore.
+
+        kill_grace_ms is how long terminate() (or a timeout) waits before killing;
+        it defaults to the controller's value and is clamped to (0, 60 s) and, with a
+        timeout, to timeout_ms. A terminate() before the timeout kills no later than
+        the timeout would have.
         """
         if self._proc is not None:
             self.error.emit("Process already running")
@@ -76,31 +261,43 @@ class ProcessController(QObject):
 
         self._workdir = workdir
         self._on_finish = on_finish
-        self._buffer = []
+        self._kill_grace_ms = self._default_kill_grace_ms if kill_grace_ms is None else _clamp_grace(kill_grace_ms)
+        self._decoder.reset()
+        # One clock read for the run meta, the file names and the log header
+        now = time.time()
+        lt = time.localtime(now)
         self._run_meta = {
             "cmd": cmd,
             "workdir": str(workdir) if workdir else None,
-            "started_at": time.time(),
+            "started_at": now,
             "env_overrides": dict(env) if env else None,
             "metadata": dict(metadata) if metadata else None,
         }
 
         # Prepare run/log paths
-        runs_dir = repo_root() / ".cgir" / "runs"
-        logs_dir = repo_root() / ".cgir" / "logs"
-        runs_dir.mkdir(parents=True, exist_ok=True)
-        logs_dir.mkdir(parents=True, exist_ok=True)
-        ts = time.strftime("%Y%m%d-%H%M%S")
-        self._log_path = logs_dir / f"{ts}.log"
-        self._run_json_path = runs_dir / f"{ts}.json"
+        # Random suffix: runs started within the same second get distinct files
+        ts = f"{time.strftime('%Y%m%d-%H%M%S', lt)}-{os.urandom(3).hex()}"
+        self._log_path = _LOGS_DIR / f"{ts}.log"
+        self._run_json_path = _RUNS_DIR / f"{ts}.json"
 
         # Open log file
         try:
-            self._log_fh = self._log_path.open("w", encoding="utf-8")
-            self._log_fh.write(f"# started_at: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-            self._log_fh.write(f"# workdir: {self._workdir}\n")
-            self._log_fh.write(f"$ {' '.join(cmd)}\n")
+            _ensure_run_dirs()
+            try:
+                self._log_fh = _BufferedLog(self._log_path)
+            except FileNotFoundError:
+                # .cgir was removed after the directories were first created
+                _ensure_run_dirs(force=True)
+                self._log_fh = _BufferedLog(self._log_path)
+            header = (
+                f"# started_at: {time.strftime('%Y-%m-%d %H:%M:%S', lt)}\n"
+                f"# workdir: {self._workdir}\n"
+                f"$ {' '.join(cmd)}\n"
+            )
+            header_bytes = header.encode("utf-8")
+            self._log_fh.write(header_bytes)
             self._log_fh.flush()
+            self._stdout_offset = len(header_bytes)
         except Exception as e:
             self._safe_emit_error(f"Failed to open log file: {e}")
             self._cleanup()
@@ -112,30 +309,29 @@ class ProcessController(QObject):
         if workdir:
             proc.setWorkingDirectory(str(workdir))
 
-        # Environment
-        try:
-            env_obj = QProcessEnvironment.systemEnvironment()
-            if env:
+        # Environment: without overrides QProcess inherits ours, no snapshot needed
+        if env:
+            try:
+                env_obj = QProcessEnvironment.systemEnvironment()
                 for k, v in env.items():
                     env_obj.insert(str(k), str(v))
-            proc.setProcessEnvironment(env_obj)
-        except Exception:
-            # Non-fatal: fall back to system env
-            pass
+                proc.setProcessEnvironment(env_obj)
+            except Exception:
+                # Non-fatal: fall back to system env
+                pass
 
         proc.setProcessChannelMode(QProcess.MergedChannels)
-        proc.readyReadStandardOutput.connect(self._read_output)
-        proc.readyReadStandardError.connect(self._read_output)
+        pipe_w = self._open_pipe(proc)
+        if pipe_w is None:
+            proc.readyReadStandardOutput.connect(self._read_output)
+            proc.readyReadStandardError.connect(self._read_output)
         proc.errorOccurred.connect(self._on_error)
         proc.finished.connect(self._on_finished)
 
         # Timeout handling
         if timeout_ms and timeout_ms > 0:
-            self._timeout_timer = QTimer(self)
-            self._timeout_timer.setSingleShot(True)
-            self._timeout_timer.setInterval(int(timeout_ms))
-            self._timeout_timer.timeout.connect(self._on_timeout)
-            self._timeout_timer.start()
+            self._kill_grace_ms = min(self._kill_grace_ms, int(timeout_ms))
+            self._timeout_timer.start(int(timeout_ms))
 
         cmd_str = " ".join(cmd)
         self.started.emit(cmd_str)
@@ -145,6 +341,10 @@ class ProcessController(QObject):
             self._safe_log(f"[spawn failed] {e}\n")
             self._cleanup()
             self._safe_emit_error(f"Spawn failed: {e}")
+        finally:
+            # The child holds its own copy of the write end; ours must go so EOF is seen
+            if pipe_w is not None:
+                os.close(pipe_w)
 
     def terminate(self) -> None:
         """
@@ -154,31 +354,103 @@ class ProcessController(QObject):
             return
         try:
             self._proc.terminate()
+            grace = self._kill_grace_ms
+            if self._timeout_timer.isActive():
+                # Terminated before the timeout: kill by the timeout at the latest (and
+                # the timeout no longer fires to restart the grace)
+                grace = min(grace, max(1, self._timeout_timer.remainingTime()))
+                self._timeout_timer.stop()
             # Hard-kill after grace if still running
-            self._kill_timer = QTimer(self)
-            self._kill_timer.setSingleShot(True)
-            self._kill_timer.setInterval(2000)
-            self._kill_timer.timeout.connect(self._kill_now)
-            self._kill_timer.start()
+            self._kill_timer.start(grace)
         except Exception as e:
             self._safe_emit_error(f"Terminate failed: {e}")
 
     # Internals
+    def _open_pipe(self, proc: QProcess) -> Optional[int]:
+        """
+        Redirect proc's (merged) output into a fresh pipe watched by a QSocketNotifier.
+        Returns the write end, to be closed once the process is started, or None when
+        QProcess' own channel should be used.
+        """
+        if not _RAW_PIPE:
+            return None
+        try:
+            r, w = os.pipe()
+        except OSError:
+            return None
+        os.set_blocking(r, False)
+        # QProcess opens the path in the parent, which yields a new fd for the same pipe
+        proc.setStandardOutputFile(f"/dev/fd/{w}")
+        self._pipe_r = r
+        self._notifier = QSocketNotifier(r, QSocketNotifier.Read, self)
+        self._notifier.activated.connect(self._read_pipe)
+        return w
+
+    def _read_pipe(self, *_args) -> None:
+        if self._pipe_r is None:
+            return
+        while True:
+            try:
+                raw = os.read(self._pipe_r, 65536)
+            except BlockingIOError:
+                return
+            except OSError:
+                raw = b""
+            if not raw:
+                # EOF: every writer is gone
+                self._close_pipe()
+                return
+            self._handle_output(raw)
+
+    def _close_pipe(self) -> None:
+        if self._notifier is not None:
+            self._notifier.setEnabled(False)
+            self._notifier.deleteLater()
+            self._notifier = None
+        if self._pipe_r is not None:
+            try:
+                os.close(self._pipe_r)
+            except OSError:
+                pass
+            self._pipe_r = None
+
     def _read_output(self) -> None:
         if self._proc is None:
             return
-        chunk = self._proc.readAllStandardOutput().data().decode("utf-8", errors="ignore")
-        if not chunk:
+        raw = self._proc.readAllStandardOutput().data()
+        if raw:
+            self._handle_output(raw)
+
+    def _handle_output(self, raw: bytes) -> None:
+        self._pending_out.append(raw)
+        if not self._out_timer.isActive():
+            self._out_timer.start()
+
+    def _flush_output(self) -> None:
+        """Log and emit everything read since the last flush as one chunk."""
+        self._out_timer.stop()
+        if not self._pending_out:
             return
-        self._buffer.append(chunk)
-        self.output.emit(chunk)
-        self._safe_log(chunk)
+        raw = b"".join(self._pending_out)
+        self._pending_out.clear()
+        self._safe_log(raw)
+        try:
+            if self._log_fh:
+                self._log_fh.flush()
+        except Exception:
+            pass
+        # Incremental so a multi-byte character split across reads is not dropped
+        chunk = self._decoder.decode(raw)
+        if chunk:
+            self.output.emit(chunk)
 
     def _on_error(self, _qproc_err) -> None:
+        self._flush_output()
         self._safe_log("[error] QProcess reported an error\n")
         self.error.emit("Process error signaled by QProcess")
 
     def _on_timeout(self) -> None:
+        self._flush_output()
         self._safe_log("[timeout] Process exceeded timeout; attempting terminate\n")
         self.timeout.emit()
         self.terminate()
@@ -187,14 +459,23 @@ class ProcessController(QObject):
         if self._proc is None:
             return
         try:
+            self._flush_output()
             self._safe_log("[kill] Force killing process\n")
             self._proc.kill()
         except Exception:
             pass
 
     def _on_finished(self, code: int, _status) -> None:
-        text = "".join(self._buffer)
-        # Persist run meta
+        # Drain what the child wrote before exiting; the notifier may not have fired yet
+        self._read_pipe()
+        self._flush_output()
+        # The log is complete once finished is emitted
+        try:
+            if self._log_fh:
+                self._log_fh.flush()
+        except Exception:
+            pass
+        # Persist run meta (written in batches by RunMetaWriter)
         try:
             payload = dict(self._run_meta)
             payload.update(
@@ -205,9 +486,7 @@ class ProcessController(QObject):
                 }
             )
             if self._run_json_path:
-                with self._run_json_path.open("w", encoding="utf-8") as fh:
-                    json.dump(payload, fh, indent=2, ensure_ascii=False)
-                    fh.write("\n")
+                run_meta_writer().submit(self._run_json_path, payload)
         except Exception:
             # Non-fatal
             pass
@@ -215,9 +494,10 @@ class ProcessController(QObject):
         self.finished.emit(
             ProcessResult(
                 exit_code=code,
-                stdout=text,
                 log_path=self._log_path,
                 run_meta=self._run_meta,
+                stdout_path=self._log_path,
+                stdout_offset=self._stdout_offset,
             )
         )
         if self._on_finish:
@@ -228,11 +508,10 @@ class ProcessController(QObject):
                 pass
         self._cleanup()
 
-    def _safe_log(self, text: str) -> None:
+    def _safe_log(self, data: Union[str, bytes]) -> None:
         try:
             if self._log_fh:
-                self._log_fh.write(text)
-                self._log_fh.flush()
+                self._log_fh.write(data.encode("utf-8") if isinstance(data, str) else data)
         except Exception:
             pass
 
@@ -243,25 +522,20 @@ class ProcessController(QObject):
             pass
 
     def _cleanup(self) -> None:
-        try:
-            if self._timeout_timer:
-                self._timeout_timer.stop()
-            if self._kill_timer:
-                self._kill_timer.stop()
-        except Exception:
-            pass
+        self._close_pipe()
+        self._timeout_timer.stop()
+        self._kill_timer.stop()
+        self._out_timer.stop()
+        self._pending_out.clear()
         try:
             if self._log_fh:
-                self._log_fh.flush()
                 self._log_fh.close()
         except Exception:
             pass
         self._proc = None
-        self._buffer = []
+        self._stdout_offset = 0
         self._workdir = None
         self._on_finish = None
-        self._timeout_timer = None
-        self._kill_timer = None
         self._log_fh = None
         self._log_path = None
         self._run_json_path = None
\ No newline at end of file
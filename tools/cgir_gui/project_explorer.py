@@ -2,38 +2,320 @@
 
 from __future__ import annotations
 
+import fnmatch
+import functools
+import os
+import re
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QAbstractItemModel, QFileSystemWatcher, QModelIndex, Qt
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QTreeView,
-    QFileSystemModel,
+    QFileIconProvider,
     QPushButton,
     QFileDialog,
 )
 
 
+@functools.lru_cache(maxsize=1)
 def repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
+@functools.lru_cache(maxsize=1)
 def default_examples_dir() -> str:
     return str(repo_root() / "examples" / "cgir")
 
 
+class _Node:
+    __slots__ = ("path", "name", "is_dir", "is_link", "parent", "row", "children", "stamp")
+
+    def __init__(
+        self, path: str, name: str, is_dir: bool, parent: Optional["_Node"], row: int = 0, is_link: bool = False
+    ) -> None:
+        self.path = path
+        self.name = name
+        self.is_dir = is_dir
+        self.is_link = is_link  # symlinked directory: shown, never expanded
+        self.parent = parent
+        self.row = row
+        self.children: Optional[List["_Node"]] = None  # None until listed
+        self.stamp: Optional[Tuple[int, int]] = None  # (inode, mtime_ns) of the listing shown
+
+
+class LazyJsonFileModel(QAbstractItemModel):
+    """
+    Single-column file tree that lists a directory only when it is expanded (or looked
+    up by path), keeping subdirectories and files matching the name filters. Listed
+    directories are watched and re-listed when they change; a listed directory whose
+    mtime has changed is also re-listed on the next fetch or refresh().
+
+    Mirrors the parts of the QFileSystemModel API the explorer uses: setRootPath(),
+    index(path), filePath(), nameFilters(), nameFilterDisables().
+    """
+
+    def __init__(self, parent: Optional[Any] = None, name_filters: Optional[List[str]] = None) -> None:
+        super().__init__(parent)
+        self._filters = list(name_filters or ["*.json"])
+        # All filters as one compiled pattern, matched once per directory entry
+        self._filter_match = re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in self._filters)).match
+        self._root = _Node("", "", True, None)
+        # dir path -> (inode, mtime_ns, [(name, is_dir, is_link)] in ascending order); re-listing an unchanged dir is free
+        self._listing_cache: Dict[str, Tuple[int, int, List[Tuple[str, bool, bool]]]] = {}
+        self._icons = QFileIconProvider()
+        # Listed directories, watched so any root (not only the app's own dirs) stays current
+        self._watched: Dict[str, _Node] = {}
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+
+    # QFileSystemModel-compatible surface
+    def nameFilters(self) -> List[str]:
+        return list(self._filters)
+
+    def nameFilterDisables(self) -> bool:
+        return False
+
+    def setRootPath(self, path: str) -> QModelIndex:
+        self.beginResetModel()
+        if self._watched:
+            self._watcher.removePaths(list(self._watched))
+            self._watched.clear()
+        self._root = _Node(os.path.abspath(path), "", True, None)
+        self.endResetModel()
+        return QModelIndex()
+
+    def rootPath(self) -> str:
+        return self._root.path
+
+    def filePath(self, index: QModelIndex) -> str:
+        node = self._node(index)
+        return "" if node is self._root else node.path
+
+    def index(self, *args: Any) -> QModelIndex:  # type: ignore[override]
+        if len(args) == 1 and isinstance(args[0], (str, os.PathLike)):
+            return self._index_for_path(os.fspath(args[0]))
+        row, column = args[0], args[1]
+        parent = args[2] if len(args) > 2 else QModelIndex()
+        node = self._node(parent)
+        if column != 0 or node.children is None or not 0 <= row < len(node.children):
+            return QModelIndex()
+        return self.createIndex(row, 0, node.children[row])
+
+    # QAbstractItemModel
+    def parent(self, *args: Any) -> Any:  # type: ignore[override]
+        if not args:
+            return QAbstractItemModel.parent(self)  # QObject parent
+        index = args[0]
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self._root:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        node = self._node(parent)
+        return len(node.children) if node.children is not None else 0
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        node = self._node(parent)
+        if not node.is_dir or node.is_link:
+            return False
+        return node.children is None or bool(node.children)
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        node = self._node(parent)
+        if not node.is_dir or node.is_link:
+            return False
+        return node.children is None or self._stamp(node.path) != node.stamp
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        node = self._node(parent)
+        if node.children is None:
+            self._load(node, parent)
+        else:
+            self._sync(node, parent)
+
+    def refresh(self) -> None:
+        """Re-list every already listed directory that changed on disk."""
+        stack = [(self._root, QModelIndex())]
+        while stack:
+            node, index = stack.pop()
+            if node.children is None:
+                continue
+            if self._stamp(node.path) != node.stamp:
+                self._sync(node, index)
+            stack.extend((c, self.createIndex(c.row, 0, c)) for c in node.children if c.children is not None)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == Qt.DisplayRole:
+            return node.name
+        if role == Qt.DecorationRole:
+            return self._icons.icon(QFileIconProvider.Folder if node.is_dir else QFileIconProvider.File)
+        if role == Qt.ToolTipRole:
+            return node.path
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and section == 0:
+            return "Name"
+        return None
+
+    # Internals
+    def _node(self, index: QModelIndex) -> _Node:
+        return index.internalPointer() if index.isValid() else self._root
+
+    @staticmethod
+    def _sort_key(name: str, is_dir: bool) -> Tuple[bool, str]:
+        # Directories first, then case-insensitive by name (QFileSystemModel's order)
+        return (not is_dir, name.casefold())
+
+    @staticmethod
+    def _stamp(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_mtime_ns)
+
+    def _list_dir(self, path: str) -> Tuple[Optional[Tuple[int, int]], List[Tuple[str, bool, bool]]]:
+        stamp = self._stamp(path)
+        if stamp is None:
+            return None, []
+        cached = self._listing_cache.get(path)
+        if cached is not None and cached[:2] == stamp:
+            return stamp, cached[2]
+        entries: List[Tuple[str, bool, bool]] = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.name.startswith("."):
+                        continue
+                    try:
+                        is_dir = entry.is_dir()
+                        # Symlinked directories are listed but not expanded: no endless symlink cycles
+                        is_link = is_dir and entry.is_symlink()
+                    except OSError:
+                        continue
+                    if is_dir or self._filter_match(entry.name):
+                        entries.append((entry.name, is_dir, is_link))
+        except OSError:
+            return stamp, []
+        # Sorted once per listing; loading a directory then only assigns rows
+        entries.sort(key=lambda e: self._sort_key(e[0], e[1]))
+        self._listing_cache[path] = (stamp[0], stamp[1], entries)
+        return stamp, entries
+
+    def _load(self, node: _Node, index: QModelIndex) -> None:
+        if not node.is_dir or node.is_link or node.children is not None:
+            return
+        node.stamp, entries = self._list_dir(node.path)
+        self._watch(node)
+        children = [
+            _Node(os.path.join(node.path, name), name, is_dir, node, row, is_link)
+            for row, (name, is_dir, is_link) in enumerate(entries)
+        ]
+        if not children:
+            node.children = children
+            return
+        self.beginInsertRows(index, 0, len(children) - 1)
+        node.children = children
+        self.endInsertRows()
+
+    def _sync(self, node: _Node, index: QModelIndex) -> None:
+        """
+        Bring a listed directory in line with a fresh listing: vanished entries are
+        removed and new ones inserted in sorted position. Surviving nodes (and any
+        subtrees listed under them) are kept.
+        """
+        children = node.children
+        if children is None:
+            return
+        node.stamp, entries = self._list_dir(node.path)
+        self._watch(node)
+        wanted = set(entries)
+        for row in range(len(children) - 1, -1, -1):
+            c = children[row]
+            if (c.name, c.is_dir, c.is_link) not in wanted:
+                self._unwatch(c)
+                self.beginRemoveRows(index, row, row)
+                del children[row]
+                for r in range(row, len(children)):
+                    children[r].row = r
+                self.endRemoveRows()
+        # Survivors keep their relative (sorted) order, so each new entry goes in at
+        # its position in the listing
+        have = {(c.name, c.is_dir, c.is_link) for c in children}
+        for row, (name, is_dir, is_link) in enumerate(entries):
+            if (name, is_dir, is_link) in have:
+                continue
+            self.beginInsertRows(index, row, row)
+            children.insert(row, _Node(os.path.join(node.path, name), name, is_dir, node, row, is_link))
+            for r in range(row + 1, len(children)):
+                children[r].row = r
+            self.endInsertRows()
+
+    def _watch(self, node: _Node) -> None:
+        if node.stamp is not None and node.path not in self._watched:
+            self._watched[node.path] = node
+            self._watcher.addPath(node.path)
+
+    def _unwatch(self, node: _Node) -> None:
+        """Stop watching node and every directory listed under it."""
+        stack = [node]
+        while stack:
+            n = stack.pop()
+            if self._watched.get(n.path) is n:
+                del self._watched[n.path]
+                self._watcher.removePath(n.path)
+            stack.extend(n.children or ())
+
+    def _on_directory_changed(self, path: str) -> None:
+        node = self._watched.get(path)
+        if node is None or node.children is None:
+            return
+        if not os.path.isdir(path):
+            # The watcher drops deleted dirs; the parent's re-listing removes the node
+            del self._watched[path]
+            return
+        index = QModelIndex() if node is self._root else self.createIndex(node.row, 0, node)
+        self._sync(node, index)
+
+    def _index_for_path(self, path: str) -> QModelIndex:
+        target = os.path.abspath(path)
+        root = self._root.path
+        if not root or os.path.commonpath([root, target]) != root or target == root:
+            return QModelIndex()
+        node, index = self._root, QModelIndex()
+        for part in os.path.relpath(target, root).split(os.sep):
+            self._load(node, index)
+            match = next((c for c in node.children or () if c.name == part), None)
+            if match is None:
+                return QModelIndex()
+            node, index = match, self.createIndex(match.row, 0, match)
+        return index
+
+
 class ProjectExplorer(QWidget):
     """
     Minimal project explorer for CGIR examples.
 
-    - Shows a QFileSystemModel filtered to *.json
+    - Shows a lazily listed file tree filtered to *.json
     - Button to select a new root directory
     - Public API:
         * selected_path() -> Optional[Path]
         * set_root(path: str) -> None
+        * refresh() -> None
     """
 
     def __init__(self, parent: Optional[QWidget] = None, initial: Optional[str] = None) -> None:
@@ -42,20 +324,17 @@ class ProjectExplorer(QWidget):
         self._build_ui()
 
     def _build_ui(self) -> None:
-        # Build file system model
-        self.model = QFileSystemModel(self)
-        self.model.setNameFilters(["*.json"])
-        self.model.setNameFilterDisables(False)
-        self.model.setRootPath(self.root_path)
+        # Directories are listed on expand, not scanned up front
+        self.model = LazyJsonFileModel(self, ["*.json"])
 
         # Tree view
         self.tree = QTreeView(self)
         self.tree.setAccessibleName("project_explorer_tree")
         self.tree.setModel(self.model)
-        self.tree.setRootIndex(self.model.index(self.root_path))
+        self.tree.setRootIndex(self.model.setRootPath(self.root_path))
         self.tree.setSelectionMode(QTreeView.SingleSelection)
-        self.tree.setSortingEnabled(True)
-        self.tree.sortByColumn(0, Qt.AscendingOrder)
+        # The model lists entries already sorted; view-driven sorting would only re-sort them
+        self.tree.setSortingEnabled(False)
 
         # Controls
         btn_row = QHBoxLayout()
@@ -84,6 +363,10 @@ class ProjectExplorer(QWidget):
         idx = self.model.setRootPath(self.root_path)
         self.tree.setRootIndex(idx)
 
+    def refresh(self) -> None:
+        """Pick up files created or deleted in directories already shown."""
+        self.model.refresh()
+
     def _choose_root(self) -> None:
         p = QFileDialog.getExistingDirectory(self, "Open Workspace", self.root_path)
         if p:
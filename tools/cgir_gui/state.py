@@ -1,16 +1,110 @@
 from __future__ import annotations
 
+import functools
 import json
-from dataclasses import dataclass, field, asdict
+import os
+import stat
+import tempfile
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Tuple
 import time
 
+# Optional fast JSON (C serializer); stdlib json is the fallback
+try:
+    import orjson
+    _HAS_ORJSON = True
+except Exception:
+    orjson = None  # type: ignore
+    _HAS_ORJSON = False
 
+
+def _dumps_pretty(obj: Any) -> bytes:
+    """2-space indented JSON as UTF-8 bytes with a trailing newline."""
+    if _HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+_UMASK_LOCK = threading.Lock()
+_UMASK: Optional[int] = None
+
+
+def _process_umask() -> int:
+    """
+    The process umask, read once on first use. Linux reports it in /proc; elsewhere
+    os.umask can only be queried by setting it, which is done at most once, under a lock.
+    """
+    global _UMASK
+    with _UMASK_LOCK:
+        if _UMASK is None:
+            try:
+                with open("/proc/self/status", "rb") as fh:
+                    for line in fh:
+                        if line.startswith(b"Umask:"):
+                            _UMASK = int(line.split()[1], 8)
+                            break
+            except (OSError, ValueError, IndexError):
+                pass
+            if _UMASK is None:
+                _UMASK = os.umask(0o022)
+                os.umask(_UMASK)
+        return _UMASK
+
+
+def write_atomic(path: str | os.PathLike, data: bytes) -> None:
+    """
+    Replace path with data: write a uniquely named temp file next to it, fsync it,
+    carry over path's mode, then rename it over path. Concurrent writers never share
+    a temp file, and a crash leaves either the old or the new contents. A symlinked
+    path is written through: its final target is replaced, the link is kept. A file
+    with several hard links is rewritten in place (not atomically), so the links
+    keep sharing it.
+    """
+    path = os.path.realpath(path)
+    try:
+        st = os.stat(path)
+        mode = stat.S_IMODE(st.st_mode)
+        if st.st_nlink > 1:
+            with open(path, "r+b") as fh:
+                fh.write(data)
+                fh.truncate()
+                fh.flush()
+                os.fsync(fh.fileno())
+            return
+    except FileNotFoundError:
+        # New file: the mode open() would have given it, not mkstemp's 0600
+        mode = 0o666 & ~_process_umask()
+    fd, tmp = tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".", prefix=os.path.basename(path) + ".", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+@functools.lru_cache(maxsize=1)
 def repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
+_REPO = repo_root()
+_SCHEMA_DEFAULT = str(_REPO / "docs" / "ir" / "cgir-schema.json")
+_OUTDIR_DEFAULT = str(_REPO / "build" / "cgir")
+_EXAMPLES_DEFAULT = str(_REPO / "examples" / "cgir")
+
+
 def workspace_dir(root: Optional[Path] = None) -> Path:
     root = root or repo_root()
     return root / ".cgir"
@@ -27,15 +121,15 @@ class PanelLayout:
 
 @dataclass
 class Parameters:
-    schema: str = str(repo_root() / "docs" / "ir" / "cgir-schema.json")
+    schema: str = _SCHEMA_DEFAULT
     dp: int = 12
-    out_dir: str = str(repo_root() / "build" / "cgir")
+    out_dir: str = _OUTDIR_DEFAULT
 
 
 @dataclass
 class WorkspaceState:
     version: str = "0.1.0"
-    last_opened_dir: str = str(repo_root() / "examples" / "cgir")
+    last_opened_dir: str = _EXAMPLES_DEFAULT
     last_opened_file: Optional[str] = None
     recent_files: List[str] = field(default_factory=list)
     params: Parameters = field(default_factory=Parameters)
@@ -43,11 +137,20 @@ class WorkspaceState:
     updated_at: float = field(default_factory=lambda: time.time())
 
 
+# Marks a key absent from workspace.json, so defaults are only produced when needed
+_MISSING = object()
+
+
+def _str_or(obj: Dict[str, Any], key: str, default: str) -> str:
+    v = obj.get(key, _MISSING)
+    return default if v is _MISSING else str(v)
+
+
 def _coerce_parameters(obj: Dict[str, Any]) -> Parameters:
     return Parameters(
-        schema=str(obj.get("schema", Parameters.schema)),
+        schema=_str_or(obj, "schema", _SCHEMA_DEFAULT),
         dp=int(obj.get("dp", Parameters.dp)),
-        out_dir=str(obj.get("out_dir", Parameters.out_dir)),
+        out_dir=_str_or(obj, "out_dir", _OUTDIR_DEFAULT),
     )
 
 
@@ -60,14 +163,15 @@ def _coerce_layout(obj: Dict[str, Any]) -> PanelLayout:
 def _coerce_workspace(obj: Dict[str, Any]) -> WorkspaceState:
     params_obj = obj.get("params", {})
     layout_obj = obj.get("panel_layout", {})
+    updated_at = obj.get("updated_at", _MISSING)
     return WorkspaceState(
         version=str(obj.get("version", "0.1.0")),
-        last_opened_dir=str(obj.get("last_opened_dir", str(repo_root() / "examples" / "cgir"))),
+        last_opened_dir=_str_or(obj, "last_opened_dir", _EXAMPLES_DEFAULT),
         last_opened_file=obj.get("last_opened_file"),
         recent_files=[str(p) for p in obj.get("recent_files", [])],
         params=_coerce_parameters(params_obj if isinstance(params_obj, dict) else {}),
         panel_layout=_coerce_layout(layout_obj if isinstance(layout_obj, dict) else {}),
-        updated_at=float(obj.get("updated_at", time.time())),
+        updated_at=time.time() if updated_at is _MISSING else float(updated_at),
     )
 
 
@@ -78,30 +182,49 @@ def load_workspace(root: Optional[Path] = None) -> WorkspaceState:
     p = workspace_file(root)
     try:
         if p.exists():
-            with p.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            raw = p.read_bytes()
+            data = orjson.loads(raw) if _HAS_ORJSON else json.loads(raw)
             return _coerce_workspace(data if isinstance(data, dict) else {})
     except Exception:
         pass
     return WorkspaceState()
 
 
+def encode_workspace(state: WorkspaceState, *, stamp: bool = True) -> bytes:
+    """
+    Serialize state to the pretty JSON written to workspace.json. stamp=False leaves
+    out updated_at, giving bytes that only change when persisted content does.
+    """
+    # Built by hand: asdict() would deep-copy recent_files and docks just to serialize them
+    payload = {
+        "version": state.version,
+        "last_opened_dir": state.last_opened_dir,
+        "last_opened_file": state.last_opened_file,
+        "recent_files": state.recent_files,
+        "params": {"schema": state.params.schema, "dp": state.params.dp, "out_dir": state.params.out_dir},
+        "panel_layout": {"docks": state.panel_layout.docks},
+    }
+    if stamp:
+        payload["updated_at"] = time.time()
+    return _dumps_pretty(payload)
+
+
+def write_workspace_bytes(data: bytes, root: Optional[Path] = None) -> None:
+    """
+    Write already-encoded workspace JSON to .cgir/workspace.json via write_atomic, so a
+    crash mid-write leaves the previous version intact. Safe to call from a worker
+    thread, also while a synchronous save_workspace runs.
+    """
+    workspace_dir(root).mkdir(parents=True, exist_ok=True)
+    write_atomic(workspace_file(root), data)
+
+
 def save_workspace(state: WorkspaceState, root: Optional[Path] = None) -> None:
     """
-    Save workspace.json with pretty JSON in .cgir.
+    Save workspace.json with pretty JSON in .cgir (synchronously; see write_workspace_bytes).
     """
-    wd = workspace_dir(root)
-    wd.mkdir(parents=True, exist_ok=True)
-    p = workspace_file(root)
     try:
-        payload = asdict(state)
-        # Flatten dataclasses
-        payload["params"] = asdict(state.params)
-        payload["panel_layout"] = asdict(state.panel_layout)
-        payload["updated_at"] = time.time()
-        with p.open("w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2, ensure_ascii=False)
-            f.write("\n")
+        write_workspace_bytes(encode_workspace(state), root)
     except Exception:
         # Best-effort persistence; swallow exceptions to avoid UI crashes
         pass
@@ -112,15 +235,10 @@ def update_last_opened(state: WorkspaceState, *, directory: Optional[str] = None
         state.last_opened_dir = directory
     if file:
         state.last_opened_file = file
-        # Update recents
-        try:
-            if file in state.recent_files:
-                state.recent_files.remove(file)
-            state.recent_files.insert(0, file)
-            # Keep most recent 20
-            state.recent_files = state.recent_files[:20]
-        except Exception:
-            pass
+        # Update recents (ordered-set idiom); keep most recent 20
+        d = dict.fromkeys(state.recent_files)
+        d.pop(file, None)
+        state.recent_files = [file, *list(d)[:19]]
     state.updated_at = time.time()
     return state
 
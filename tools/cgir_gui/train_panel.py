@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, Qt, QTimer, Signal
+from PySide6.QtGui import QColor, QTextCursor
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -19,23 +21,45 @@ from PySide6.QtWidgets import (
     QLabel,
     QFileDialog,
     QSpinBox,
-    QTextEdit,
+    QPlainTextEdit,
     QMessageBox,
     QSizePolicy,
-    QTableWidget,
-    QTableWidgetItem,
+    QAbstractItemView,
+    QTableView,
     QHeaderView,
     QSplitter,
     QCheckBox,
     QComboBox,
 )
 
+# Optional fast JSON (C parser); stdlib json is the fallback
+try:
+    import orjson
+    _HAS_ORJSON = True
+except Exception:
+    orjson = None  # type: ignore
+    _HAS_ORJSON = False
+
+# Optional streaming parser; very large attribution files are read event by event
+try:
+    import ijson
+    _HAS_IJSON = True
+except Exception:
+    ijson = None  # type: ignore
+    _HAS_IJSON = False
+
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
 from .process_controller import ProcessController
 
 
+# Console backlog (lines) kept for the process output
+CONSOLE_MAX_LINES = 5000
+# Console text is buffered and written at most this often
+CONSOLE_FLUSH_MS = 50
+
+
 def repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
@@ -54,17 +78,185 @@ def default_train_dir() -> str:
     return str(repo_root() / "build" / "cgir" / "train")
 
 
-@dataclass
+@dataclass(slots=True)
 class AttribEvent:
     index: int
     target_ok: Tuple[float, float, float]
-    alphas: List[Tuple[str, float]]
+    # alpha contributions as parallel ids / float32 values (one contiguous buffer per event)
+    alpha_ids: Tuple[str, ...]
+    alpha_vals: np.ndarray = field(compare=False, repr=False)
     residual_norm: float
     sum_alpha_before_norm: float
     normalized: bool
     error: Optional[str] = None
 
 
+# Fixed chart margins (room for rotated tick labels); cheaper than tight_layout per plot
+_CHART_MARGINS = {"left": 0.12, "right": 0.98, "bottom": 0.25, "top": 0.9}
+
+# Attribution files at least this large are streamed with ijson (when installed)
+_STREAM_MIN_BYTES = 64 * 1024 * 1024
+
+
+def _read_json(path: Path) -> Any:
+    if _HAS_ORJSON:
+        return orjson.loads(path.read_bytes())
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _error_event(index: int, error: str) -> AttribEvent:
+    return AttribEvent(
+        index=index,
+        target_ok=(0.0, 0.0, 0.0),
+        alpha_ids=(),
+        alpha_vals=np.zeros(0, dtype=np.float32),
+        residual_norm=0.0,
+        sum_alpha_before_norm=0.0,
+        normalized=False,
+        error=error,
+    )
+
+
+def _parse_attrib_event(ev: Dict[str, Any]) -> AttribEvent:
+    """One events[] entry of an _attrib.json file; malformed entries become error events."""
+    if "error" in ev:
+        return _error_event(int(ev.get("index", -1)), str(ev.get("error")))
+    try:
+        idx = int(ev.get("index", -1))
+        tgt = ev.get("target_ok", {})
+        target = (float(tgt.get("L", 0.0)), float(tgt.get("a", 0.0)), float(tgt.get("b", 0.0)))
+        raw = ev.get("alphas", []) or []
+        ids = tuple(str(a.get("id")) for a in raw)
+        vals = np.fromiter((float(a.get("alpha")) for a in raw), dtype=np.float32, count=len(raw))
+        return AttribEvent(
+            index=idx,
+            target_ok=target,
+            alpha_ids=ids,
+            alpha_vals=vals,
+            residual_norm=float(ev.get("residual_norm", 0.0)),
+            sum_alpha_before_norm=float(ev.get("sum_alpha_before_norm", 0.0)),
+            normalized=bool(ev.get("normalized", False)),
+        )
+    except Exception as e:
+        return _error_event(int(ev.get("index", -1)), f"parse error: {e}")
+
+
+def _stream_attrib_events(path: Path) -> List[AttribEvent]:
+    """Parse events one at a time without building the whole document."""
+    with path.open("rb") as f:
+        return [_parse_attrib_event(ev) for ev in ijson.items(f, "events.item", use_float=True)]
+
+
+def _read_attrib_events(path: Path) -> List[AttribEvent]:
+    if _HAS_IJSON and path.stat().st_size >= _STREAM_MIN_BYTES:
+        return _stream_attrib_events(path)
+    data = _read_json(path)
+    return [_parse_attrib_event(ev) for ev in data.get("events", []) or []]
+
+
+# Per-event scalars shown in the table, one record per event
+_EVENT_TABLE_DTYPE = np.dtype(
+    [("index", "i8"), ("residual_norm", "f8"), ("sum_alpha_before_norm", "f8"), ("normalized", "?"), ("error", "?")]
+)
+
+
+def _events_table(events: List[AttribEvent]) -> np.ndarray:
+    """Table columns of all events as one structured array, filled in a single pass."""
+    return np.fromiter(
+        ((ev.index, ev.residual_norm, ev.sum_alpha_before_norm, ev.normalized, bool(ev.error)) for ev in events),
+        dtype=_EVENT_TABLE_DTYPE,
+        count=len(events),
+    )
+
+
+class _AttribLoaderSignals(QObject):
+    """
+    Result channel of a panel's loaders. It has no Qt parent and each loader holds a
+    reference, so it outlives the panel while a load is in flight.
+    """
+
+    # (load sequence number, path, events + their table / error message)
+    loaded = Signal(int, object, object, object)
+    failed = Signal(int, object, str)
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Set when the panel is destroyed; in-flight loads then drop their results
+        self.closed = threading.Event()
+
+
+class _AttribLoader(QRunnable):
+    """Reads and parses one _attrib.json on a pool thread; results are delivered queued to the GUI thread."""
+
+    def __init__(self, seq: int, path: Path, signals: _AttribLoaderSignals) -> None:
+        super().__init__()
+        self._seq = seq
+        self._path = path
+        self.signals = signals
+
+    def run(self) -> None:
+        if self.signals.closed.is_set():
+            return
+        try:
+            events = _read_attrib_events(self._path)
+        except Exception as e:
+            if not self.signals.closed.is_set():
+                self.signals.failed.emit(self._seq, self._path, str(e))
+            return
+        if not self.signals.closed.is_set():
+            self.signals.loaded.emit(self._seq, self._path, events, _events_table(events))
+
+
+class AttribEventsModel(QAbstractTableModel):
+    """
+    Read-only table over a list of AttribEvent; cell text is produced on demand for
+    the rows the view paints, from the events' structured scalar table (see
+    _events_table). Error rows are shown in red.
+    """
+
+    HEADERS = ("event_index", "residual_norm", "normalized", "sum_alpha_before_norm")
+
+    def __init__(self, parent: Optional[Any] = None) -> None:
+        super().__init__(parent)
+        self._table = _events_table([])
+
+    def set_events(self, events: List[AttribEvent], table: Optional[np.ndarray] = None) -> None:
+        self.beginResetModel()
+        self._table = _events_table(events) if table is None else table
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._table)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        rec = self._table[index.row()]
+        if role == Qt.DisplayRole:
+            col = index.column()
+            if col == 0:
+                return str(rec["index"])
+            if col == 1:
+                return f"{rec['residual_norm']:.6g}" if not rec["error"] else "error"
+            if col == 2:
+                return "true" if rec["normalized"] else "false"
+            if col == 3:
+                return f"{rec['sum_alpha_before_norm']:.6g}"
+            return None
+        if role == Qt.ForegroundRole and rec["error"]:
+            return QColor(Qt.red)
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self.HEADERS):
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
 class TrainPanel(QWidget):
     """
     NNLS Attribution Trainer Panel (CGIR).
@@ -82,12 +274,20 @@ class TrainPanel(QWidget):
 
     Emits:
       - finished(int): exit code (0 OK, nonzero failure)
+      - attribs_loaded(int): number of events shown after an attribution file is loaded
     """
 
     finished = Signal(int)
+    attribs_loaded = Signal(int)
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
+        # Log text queued for the console, written in one insert per CONSOLE_FLUSH_MS
+        self._log_buf: List[str] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(CONSOLE_FLUSH_MS)
+        self._log_timer.timeout.connect(self._flush_log)
         self._proc = ProcessController(self)
         self._proc.started.connect(lambda s: self._append_log(f"$ {s}\n"))
         self._proc.output.connect(self._append_log)
@@ -101,6 +301,14 @@ class TrainPanel(QWidget):
         self._last_out_dir: Optional[Path] = None
         self._attrib_files: List[Path] = []
         self._events: List[AttribEvent] = []
+        # Attribution files are parsed off the GUI thread; only the latest request is shown
+        self._load_seq = 0
+        self._loader_signals = _AttribLoaderSignals()
+        self._loader_signals.loaded.connect(self._on_attribs_loaded)
+        self._loader_signals.failed.connect(self._on_attribs_failed)
+        # Must not capture self: it runs while the panel is being torn down
+        closed = self._loader_signals.closed
+        self.destroyed.connect(lambda *_: closed.set())
 
     def _build_ui(self) -> None:
         root = QVBoxLayout(self)
@@ -164,18 +372,20 @@ class TrainPanel(QWidget):
 
         left.addLayout(row_files)
 
-        self.table = QTableWidget(self)
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["event_index", "residual_norm", "normalized", "sum_alpha_before_norm"])
+        self._model = AttribEventsModel(self)
+        self.table = QTableView(self)
+        self.table.setModel(self._model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.table.setSelectionBehavior(self.table.SelectRows)
-        self.table.setSelectionMode(self.table.SingleSelection)
-        self.table.itemSelectionChanged.connect(self._on_table_selection)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.selectionModel().selectionChanged.connect(self._on_table_selection)
         left.addWidget(self.table, stretch=1)
 
-        self.console = QTextEdit(self)
+        # Plain-text console; the oldest lines are dropped past CONSOLE_MAX_LINES
+        self.console = QPlainTextEdit(self)
         self.console.setReadOnly(True)
-        self.console.setLineWrapMode(QTextEdit.NoWrap)
+        self.console.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.console.setMaximumBlockCount(CONSOLE_MAX_LINES)
         left.addWidget(self.console, stretch=0)
 
         splitter.addWidget(leftw)
@@ -188,6 +398,10 @@ class TrainPanel(QWidget):
         self.figure = Figure(figsize=(6.0, 4.0), dpi=150)
         self.canvas = FigureCanvas(self.figure)
         self.canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        # One axes reused by every plot (cleared, never rebuilt); margins set once
+        self.figure.subplots_adjust(**_CHART_MARGINS)
+        self._ax = self.figure.add_subplot(111)
+        self._ax.set_visible(False)
 
         right.addWidget(QLabel("Alpha contributions (selected event)"))
         right.addWidget(self.canvas, stretch=1)
@@ -243,6 +457,7 @@ class TrainPanel(QWidget):
             ]
 
         # Clear console, table, chart and run
+        self._log_buf.clear()
         self.console.clear()
         self._clear_table()
         self._clear_chart()
@@ -260,6 +475,7 @@ class TrainPanel(QWidget):
     def _on_finished(self, result) -> None:
         exit_code = int(getattr(result, "exit_code", -1))
         self._append_log(f"\n[train finished with exit code {exit_code}]\n")
+        self._flush_log()
         self.finished.emit(exit_code)
         # Attempt to load results automatically
         if self._last_out_dir is not None:
@@ -270,7 +486,7 @@ class TrainPanel(QWidget):
             return
         self._load_attrib_file(self._attrib_files[idx])
 
-    def _on_table_selection(self) -> None:
+    def _on_table_selection(self, *_args: Any) -> None:
         rows = self.table.selectionModel().selectedRows()
         if not rows:
             return
@@ -301,87 +517,44 @@ class TrainPanel(QWidget):
             self._append_log("[info] No _attrib.json files found yet\n")
 
     def _load_attrib_file(self, path: Path) -> None:
-        try:
-            with path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-        except Exception as e:
-            QMessageBox.critical(self, "Load Attribution Error", f"{path}: {e}")
-            return
+        # Parsed on a pool thread; _on_attribs_loaded fills the table and chart
+        self._load_seq += 1
+        QThreadPool.globalInstance().start(_AttribLoader(self._load_seq, path, self._loader_signals))
 
-        events = []
-        for ev in data.get("events", []) or []:
-            if "error" in ev:
-                events.append(AttribEvent(
-                    index=int(ev.get("index", -1)),
-                    target_ok=(0.0, 0.0, 0.0),
-                    alphas=[],
-                    residual_norm=0.0,
-                    sum_alpha_before_norm=0.0,
-                    normalized=False,
-                    error=str(ev.get("error")),
-                ))
-                continue
-            try:
-                idx = int(ev.get("index", -1))
-                tgt = ev.get("target_ok", {})
-                target = (float(tgt.get("L", 0.0)), float(tgt.get("a", 0.0)), float(tgt.get("b", 0.0)))
-                alphas = [(str(a.get("id")), float(a.get("alpha"))) for a in (ev.get("alphas", []) or [])]
-                res = float(ev.get("residual_norm", 0.0))
-                sum_a = float(ev.get("sum_alpha_before_norm", 0.0))
-                normed = bool(ev.get("normalized", False))
-                events.append(AttribEvent(
-                    index=idx,
-                    target_ok=target,
-                    alphas=alphas,
-                    residual_norm=res,
-                    sum_alpha_before_norm=sum_a,
-                    normalized=normed,
-                ))
-            except Exception as e:
-                events.append(AttribEvent(
-                    index=int(ev.get("index", -1)),
-                    target_ok=(0.0, 0.0, 0.0),
-                    alphas=[],
-                    residual_norm=0.0,
-                    sum_alpha_before_norm=0.0,
-                    normalized=False,
-                    error=f"parse error: {e}",
-                ))
+    def _on_attribs_failed(self, seq: int, path: Path, error: str) -> None:
+        if seq != self._load_seq:
+            return
+        QMessageBox.critical(self, "Load Attribution Error", f"{path}: {error}")
 
+    def _on_attribs_loaded(self, seq: int, _path: Path, events: List[AttribEvent], table: np.ndarray) -> None:
+        # A newer file was requested meanwhile; drop this result
+        if seq != self._load_seq:
+            return
         self._events = events
-        self._populate_table(events)
+        self._populate_table(events, table)
         # Plot first event if available
         if events:
             self.table.selectRow(0)
             self._plot_event(events[0])
         else:
             self._clear_chart()
+        self.attribs_loaded.emit(len(events))
 
     # -------------------------
     # Internal: Table/Chart
     # -------------------------
-    def _populate_table(self, events: List[AttribEvent]) -> None:
-        self.table.setRowCount(len(events))
-        for r, ev in enumerate(events):
-            def _set(c: int, text: str) -> None:
-                item = QTableWidgetItem(text)
-                if ev.error:
-                    item.setForeground(Qt.red)
-                self.table.setItem(r, c, item)
-
-            _set(0, str(ev.index))
-            _set(1, f"{ev.residual_norm:.6g}" if not ev.error else "error")
-            _set(2, "true" if ev.normalized else "false")
-            _set(3, f"{ev.sum_alpha_before_norm:.6g}")
+    def _populate_table(self, events: List[AttribEvent], table: Optional[np.ndarray] = None) -> None:
+        self._model.set_events(events, table)
 
     def _plot_event(self, ev: AttribEvent) -> None:
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
+        ax = self._ax
+        ax.cla()
+        ax.set_visible(True)
         if ev.error:
             ax.text(0.5, 0.5, f"Error: {ev.error}", ha="center", va="center", color="red", transform=ax.transAxes)
         else:
-            names = [n for (n, _) in ev.alphas] or ["<none>"]
-            vals = [v for (_, v) in ev.alphas] or [0.0]
+            names = ev.alpha_ids or ("<none>",)
+            vals = ev.alpha_vals if ev.alpha_vals.size else np.zeros(1)
             x = np.arange(len(names))
             ax.bar(x, vals, color="#4a7c59")
             ax.set_xticks(x, names, rotation=45, ha="right")
@@ -389,18 +562,30 @@ class TrainPanel(QWidget):
             ax.set_ylabel("alpha")
             ax.set_title(f"Event {ev.index} — residual={ev.residual_norm:.6g}, normalized={ev.normalized}")
             ax.grid(True, linestyle=":", linewidth=0.5, alpha=0.4)
-        self.figure.tight_layout()
         self.canvas.draw_idle()
 
     def _clear_table(self) -> None:
-        self.table.clearContents()
-        self.table.setRowCount(0)
+        # Results of a load still in flight are stale now
+        self._load_seq += 1
+        self._model.set_events([])
 
     def _clear_chart(self) -> None:
-        self.figure.clear()
+        self._ax.cla()
+        self._ax.set_visible(False)
         self.canvas.draw_idle()
 
     def _append_log(self, text: str) -> None:
-        self.console.moveCursor(self.console.textCursor().End)
-        self.console.insertPlainText(text)
-        self.console.moveCursor(self.console.textCursor().End)
\ No newline at end of file
+        self._log_buf.append(text)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self) -> None:
+        """Write all queued text to the console in one insert."""
+        self._log_timer.stop()
+        if not self._log_buf:
+            return
+        text = "".join(self._log_buf)
+        self._log_buf.clear()
+        # Inserted at the end as-is: output chunks need not end on a line boundary
+        self.console.moveCursor(QTextCursor.End)
+        self.console.insertPlainText(text)
\ No newline at end of file
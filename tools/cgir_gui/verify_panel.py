@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtGui import QTextCursor
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -16,7 +17,7 @@ from PySide6.QtWidgets import (
     QLabel,
     QFileDialog,
     QDoubleSpinBox,
-    QTextEdit,
+    QPlainTextEdit,
     QMessageBox,
     QSizePolicy,
     QCheckBox,
@@ -25,6 +26,12 @@ from PySide6.QtWidgets import (
 from .process_controller import ProcessController
 
 
+# Console backlog (lines) kept for the process output
+CONSOLE_MAX_LINES = 5000
+# Console text is buffered and written at most this often
+CONSOLE_FLUSH_MS = 50
+
+
 def repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
@@ -59,6 +66,12 @@ class VerifyPanel(QWidget):
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self._build_ui()
+        # Log text queued for the console, written in one insert per CONSOLE_FLUSH_MS
+        self._log_buf: List[str] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(CONSOLE_FLUSH_MS)
+        self._log_timer.timeout.connect(self._flush_log)
         self._proc = ProcessController(self)
         self._proc.started.connect(lambda s: self._append(f"$ {s}\n"))
         self._proc.output.connect(self._append)
@@ -111,10 +124,11 @@ class VerifyPanel(QWidget):
 
         root.addLayout(form)
 
-        # Results console
-        self.console = QTextEdit(self)
+        # Results console (plain text; the oldest lines are dropped past CONSOLE_MAX_LINES)
+        self.console = QPlainTextEdit(self)
         self.console.setReadOnly(True)
-        self.console.setLineWrapMode(QTextEdit.NoWrap)
+        self.console.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.console.setMaximumBlockCount(CONSOLE_MAX_LINES)
         self.console.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         root.addWidget(self.console, stretch=1)
 
@@ -122,9 +136,20 @@ class VerifyPanel(QWidget):
 
     # Helpers
     def _append(self, text: str) -> None:
-        self.console.moveCursor(self.console.textCursor().End)
+        self._log_buf.append(text)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self) -> None:
+        """Write all queued text to the console in one insert."""
+        self._log_timer.stop()
+        if not self._log_buf:
+            return
+        text = "".join(self._log_buf)
+        self._log_buf.clear()
+        # Inserted at the end as-is: output chunks need not end on a line boundary
+        self.console.moveCursor(QTextCursor.End)
         self.console.insertPlainText(text)
-        self.console.moveCursor(self.console.textCursor().End)
 
     def _choose_a(self) -> None:
         base = self.edit_a.text().strip() or default_sim_dir()
@@ -161,6 +186,7 @@ class VerifyPanel(QWidget):
                 "--tol", f"{tol:.12g}",
             ]
 
+        self._log_buf.clear()
         self.console.clear()
         self._proc.run(cmd, workdir=repo_root())
 
@@ -168,4 +194,5 @@ class VerifyPanel(QWidget):
         # result is ProcessResult
         exit_code = int(getattr(result, "exit_code", -1))
         self._append(f"\n[verify finished with exit code {exit_code}]\n")
+        self._flush_log()
         self.finished.emit(exit_code)
\ No newline at end of file
@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import json
 import math
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -24,12 +25,60 @@ from PySide6.QtWidgets import (
     QSizePolicy,
 )
 
+# Optional fast JSON (C parser); stdlib json is the fallback
+try:
+    import orjson
+    _HAS_ORJSON = True
+except Exception:
+    orjson = None  # type: ignore
+    _HAS_ORJSON = False
+
+# Optional streaming parser; very large CGIR files are scanned for points without a full parse
+try:
+    import ijson
+    _HAS_IJSON = True
+except Exception:
+    ijson = None  # type: ignore
+    _HAS_IJSON = False
+
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+from matplotlib.patches import Polygon
+
+from ._viz_kernels import select_slice
+
+# Boundary points per slice, and how many slices' boundaries are kept
+BOUNDARY_POINTS = 720
+BOUNDARY_CACHE_SIZE = 64
+
+# Render requests within one frame (~60 Hz) are coalesced into a single render
+RENDER_DELAY_MS = 16
+
+# Exported PNGs are rendered at this resolution, whatever the widget's size
+EXPORT_DPI = 160
+
+# Overlay key (as in _collect_points) -> (color, legend label), in drawing order
+_OVERLAY_STYLES = (
+    ("neurons", "#555555", "neurons"),
+    ("mix_raw", "#cc3333", "mix_raw_ok"),
+    ("after_proj", "#33aa55", "after_projection_ok"),
+)
+
+# Files at least this large are streamed with ijson (when installed) instead of loaded whole
+_STREAM_MIN_BYTES = 64 * 1024 * 1024
+
+# ijson prefix of each plotted ok_state object -> point class
+_STREAM_TARGETS = {
+    "neurons.item.state.ok_state": "neurons",
+    "events.item.mix_raw_ok.ok_state": "mix_raw",
+    "events.item.after_projection_ok.ok_state": "after_proj",
+}
+# ok_state key -> column of the (L,a,b) row
+_OK_FIELDS = {"L": 0, "a": 1, "b": 2}
 
 # Reuse the same droplet geometry used by the CLI for perfect alignment
 try:
-    from cgir.core.droplet import cmax_ok_v1
+    from cgir.core.droplet import cmax_ok_v1, cmax_ok_v1_batch
 except Exception as e:
     # Provide a minimal fallback so the panel still loads (with a simple envelope)
     def cmax_ok_v1(L: float, h: float) -> float:  # type: ignore
@@ -37,8 +86,14 @@ except Exception as e:
         ripple = 0.03 * math.sin(3.0 * h)
         return max(0.0, base + ripple)
 
+    def cmax_ok_v1_batch(L: float, h: np.ndarray) -> np.ndarray:  # type: ignore
+        base = 0.35 * (1.0 - abs(2.0 * L - 1.0)) + 0.05
+        return np.maximum(base + 0.03 * np.sin(3.0 * np.asarray(h, dtype=float)), 0.0)
+
 
 def _read_json(path: Path) -> Any:
+    if _HAS_ORJSON:
+        return orjson.loads(path.read_bytes())
     with path.open("r", encoding="utf-8") as f:
         return json.load(f)
 
@@ -58,23 +113,79 @@ def _extract_ok_state(node: Dict[str, Any]) -> Optional[Tuple[float, float, floa
     return None
 
 
-def _collect_points(instance: Dict[str, Any]) -> Dict[str, List[Tuple[float, float, float]]]:
-    pts: Dict[str, List[Tuple[float, float, float]]] = {"neurons": [], "mix_raw": [], "after_proj": []}
-    # Neurons
-    for n in instance.get("neurons", []) or []:
-        st = n.get("state", {})
-        ok = _extract_ok_state(st)
+def _ok_array(nodes: Iterable[Any], n: int) -> np.ndarray:
+    """(k,3) float array of the OKLab states found in nodes (at most n of them)."""
+    out = np.empty((n, 3), dtype=float)
+    k = 0
+    for node in nodes:
+        ok = _extract_ok_state(node)
         if ok is not None:
-            pts["neurons"].append(ok)
-    # Events
-    for ev in instance.get("events", []) or []:
-        raw = _extract_ok_state(ev.get("mix_raw_ok", {}))
-        if raw is not None:
-            pts["mix_raw"].append(raw)
-        ap = _extract_ok_state(ev.get("after_projection_ok", {}))
-        if ap is not None:
-            pts["after_proj"].append(ap)
-    return pts
+            out[k] = ok
+            k += 1
+    return out[:k]
+
+
+def _collect_points(instance: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """Plotted points per class as ready-to-plot (k,3) arrays of (L,a,b)."""
+    neurons = instance.get("neurons", []) or []
+    events = instance.get("events", []) or []
+    return {
+        "neurons": _ok_array((n.get("state", {}) for n in neurons), len(neurons)),
+        "mix_raw": _ok_array((ev.get("mix_raw_ok", {}) for ev in events), len(events)),
+        "after_proj": _ok_array((ev.get("after_projection_ok", {}) for ev in events), len(events)),
+    }
+
+
+def _scalar_float(event: str, value: Any) -> Optional[float]:
+    """float() of an ijson scalar, None where _extract_ok_state's float() would fail."""
+    if event not in ("number", "string", "boolean"):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _stream_points(path: Path) -> Dict[str, np.ndarray]:
+    """
+    Same result as _collect_points(_read_json(path)), from one ijson pass that copies
+    only the L/a/b scalars of each ok_state into a flat float buffer per class; no
+    Python object is built for anything else (memory stays flat for huge instances).
+    """
+    bufs: Dict[str, List[float]] = {key: [] for key in _STREAM_TARGETS.values()}
+    with path.open("rb") as f:
+        events = ijson.parse(f, use_float=True)
+        for prefix, event, value in events:
+            key = _STREAM_TARGETS.get(prefix)
+            if key is None or event != "start_map":
+                continue
+            # Inside one ok_state object: the first event after an L/a/b key is its value
+            vals: List[Optional[float]] = [None, None, None]
+            field = -1
+            depth = 1
+            for _, ev, val in events:
+                if depth == 1:
+                    if ev == "map_key":
+                        field = _OK_FIELDS.get(val, -1)
+                        continue
+                    if field >= 0:
+                        vals[field] = _scalar_float(ev, val)
+                        field = -1
+                if ev in ("start_map", "start_array"):
+                    depth += 1
+                elif ev in ("end_map", "end_array"):
+                    depth -= 1
+                    if depth == 0:
+                        break
+            if None not in vals:
+                bufs[key].extend(vals)  # type: ignore[arg-type]
+    return {key: np.array(buf, dtype=float).reshape(-1, 3) for key, buf in bufs.items()}
+
+
+def _load_points(path: Path) -> Dict[str, np.ndarray]:
+    if _HAS_IJSON and path.stat().st_size >= _STREAM_MIN_BYTES:
+        return _stream_points(path)
+    return _collect_points(_read_json(path))
 
 
 class VizPanel(QWidget):
@@ -97,6 +208,21 @@ class VizPanel(QWidget):
         super().__init__(parent)
         self._path: Optional[Path] = None
         self._last_image_path: Optional[Path] = None
+        # (L, n) -> (a, b) boundary arrays, least recently used first
+        self._bnd_cache: "OrderedDict[Tuple[float, int], Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+        # n -> (hs, cos(hs), sin(hs)); the hue grid does not depend on L
+        self._hue_cache: Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        # Points of the last file read, keyed by (path, st_mtime_ns, st_size), so an L
+        # change only re-slices them
+        self._points_key: Optional[Tuple[str, int, int]] = None
+        self._points: Optional[Dict[str, np.ndarray]] = None
+        # Blit background of the current plot. The axes (self._ax), the boundary patch
+        # and the overlay collections are created once in _build_ui and updated per render.
+        self._bg: Optional[Any] = None
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(RENDER_DELAY_MS)
+        self._render_timer.timeout.connect(self._do_render)
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -124,6 +250,11 @@ class VizPanel(QWidget):
         self.chk_mix.setChecked(True)
         self.chk_after = QCheckBox("Show after_projection_ok")
         self.chk_after.setChecked(True)
+        self._overlay_boxes = {"neurons": self.chk_neurons, "mix_raw": self.chk_mix, "after_proj": self.chk_after}
+        for chk in self._overlay_boxes.values():
+            chk.toggled.connect(self._refresh_overlays)
+        # The background shows one slice of one file; a shown plot follows the L slice
+        self.spin_L.valueChanged.connect(self._on_L_changed)
 
         row2 = QHBoxLayout()
         row2.addWidget(QLabel("L slice:"))
@@ -154,6 +285,32 @@ class VizPanel(QWidget):
         self.figure = Figure(figsize=(6.5, 6.5), dpi=160)
         self.canvas = FigureCanvas(self.figure)
         self.canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.canvas.mpl_connect("draw_event", self._on_canvas_draw)
+        # One axes for every render: styled here, only its artists are replaced per render
+        self._ax = self.figure.add_subplot(111)
+        self._ax.set_aspect("equal", adjustable="box")
+        self._ax.set_xlabel("a")
+        self._ax.set_ylabel("b")
+        self._ax.grid(True, linestyle=":", linewidth=0.5, alpha=0.4)
+        self._ax.set_visible(False)
+        # Boundary outline: its vertices are replaced when the L slice changes
+        self._boundary = Polygon(
+            np.zeros((1, 2)), closed=True, facecolor="#dde8ff", edgecolor="#6688cc", linewidth=1.0, alpha=0.6,
+            label="Droplet slice",
+        )
+        self._ax.add_patch(self._boundary)
+        # Per overlay class: (in-slice, other) collections whose offsets are replaced per render.
+        # They are animated: drawn over the cached background (see _on_canvas_draw), so
+        # toggling one does not redraw the figure.
+        self._overlays: Dict[str, Tuple[Any, Any]] = {}
+        for key, color, label in _OVERLAY_STYLES:
+            self._overlays[key] = (
+                self._ax.scatter(
+                    [], [], c=color, s=30, marker="o", edgecolors="k", linewidths=0.5, alpha=0.9, label=label,
+                    animated=True,
+                ),
+                self._ax.scatter([], [], c=color, s=12, marker=".", alpha=0.25, animated=True),
+            )
         root.addWidget(self.canvas, stretch=1)
 
         self.setLayout(root)
@@ -164,8 +321,20 @@ class VizPanel(QWidget):
         if p:
             self.edit_path.setText(p)
             self._path = Path(p)
+            self._bnd_cache.clear()
+            self._bg = None
 
     def render_plot(self) -> None:
+        """Schedule a render; requests arriving within RENDER_DELAY_MS share one render."""
+        if not self._render_timer.isActive():
+            self._render_timer.start()
+
+    def _on_L_changed(self, _value: float) -> None:
+        self._invalidate_background()
+        if self._has_plot():
+            self.render_plot()
+
+    def _do_render(self) -> None:
         try:
             path_text = self.edit_path.text().strip()
             if not path_text:
@@ -174,82 +343,174 @@ class VizPanel(QWidget):
             if not path.exists():
                 raise FileNotFoundError(path_text)
 
-            inst = _read_json(path)
-            pts = _collect_points(inst)
+            pts = self._get_points(path)
 
             L = float(self.spin_L.value())
-            self._plot_slice(L, pts)
+            # Block canvas repaints while the figure is rebuilt; draw once at the end
+            self.canvas.setUpdatesEnabled(False)
+            try:
+                self._plot_slice(L, pts)
+            finally:
+                self.canvas.setUpdatesEnabled(True)
+                self.canvas.draw_idle()
             self.rendered.emit()
         except Exception as e:
+            # Hide the stale plot so further L steps do not retry (and report) each time
+            self._ax.set_visible(False)
+            self._points_key = self._points = None
+            self.canvas.draw_idle()
             QMessageBox.critical(self, "Render Error", str(e))
 
+    def _get_points(self, path: Path) -> Dict[str, np.ndarray]:
+        """Overlay points of path, re-read only when the file changed since the last read."""
+        st = path.stat()
+        key = (str(path), st.st_mtime_ns, st.st_size)
+        if key != self._points_key or self._points is None:
+            self._points = _load_points(path)
+            self._points_key = key
+        return self._points
+
     def export_png(self) -> None:
         try:
             out_path, _ = QFileDialog.getSaveFileName(self, "Export PNG", "viz.png", "PNG (*.png)")
             if not out_path:
                 return
-            self.figure.savefig(out_path, format="png", dpi=160)
+            # savefig skips animated artists: draw the blitted overlays and legend normally
+            # for the export, then restore them
+            animated = [coll for colls in self._overlays.values() for coll in colls if coll.get_visible()]
+            if self._ax.get_legend() is not None:
+                animated.append(self._ax.get_legend())
+            for artist in animated:
+                artist.set_animated(False)
+            try:
+                self.figure.savefig(out_path, format="png", dpi=EXPORT_DPI)
+            finally:
+                for artist in animated:
+                    artist.set_animated(True)
             self._last_image_path = Path(out_path)
         except Exception as e:
             QMessageBox.critical(self, "Export Error", str(e))
 
     # Plotting
-    def _plot_slice(self, L: float, pts: Dict[str, List[Tuple[float, float, float]]]) -> None:
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
+    def _has_plot(self) -> bool:
+        """True once a slice has been rendered (the axes stay hidden until then)."""
+        return self._ax.get_visible()
+
+    def _get_hues(self, n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Hue grid of n points over [-pi, pi) with its cosines and sines, computed once per n."""
+        hit = self._hue_cache.get(n)
+        if hit is None:
+            hs = np.linspace(-math.pi, math.pi, num=n, endpoint=False)
+            hit = self._hue_cache[n] = (hs, np.cos(hs), np.sin(hs))
+        return hit
+
+    def _get_boundary(self, L: float, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Droplet slice outline at L as (a, b) arrays of n points, memoized per (L, n)."""
+        key = (L, n)
+        hit = self._bnd_cache.get(key)
+        if hit is not None:
+            self._bnd_cache.move_to_end(key)
+            return hit
+        hs, cos_hs, sin_hs = self._get_hues(n)
+        Smax = cmax_ok_v1_batch(L, hs)
+        bnd = (Smax * cos_hs, Smax * sin_hs)
+        self._bnd_cache[key] = bnd
+        if len(self._bnd_cache) > BOUNDARY_CACHE_SIZE:
+            self._bnd_cache.popitem(last=False)
+        return bnd
+
+    def _plot_slice(self, L: float, pts: Dict[str, np.ndarray]) -> None:
+        ax = self._ax
+        self._bg = None
+        # Data limits come from this render's data only
+        ax.ignore_existing_data_limits = True
 
         # Boundary
-        n = 720
-        hs = np.linspace(-math.pi, math.pi, num=n, endpoint=False)
-        Smax = np.array([cmax_ok_v1(L, float(h)) for h in hs], dtype=float)
-        a_bnd = Smax * np.cos(hs)
-        b_bnd = Smax * np.sin(hs)
-        ax.fill(a_bnd, b_bnd, facecolor="#dde8ff", edgecolor="#6688cc", linewidth=1.0, alpha=0.6, label="Droplet slice")
+        a_bnd, b_bnd = self._get_boundary(L, BOUNDARY_POINTS)
+        xy = np.column_stack((a_bnd, b_bnd))
+        self._boundary.set_xy(xy)
+        ax.update_datalim(xy)
 
         # Overlays
         tolL = 1e-3
+        empty = np.empty((0, 2))
 
-        def _scatter(points: List[Tuple[float, float, float]], color: str, label: str) -> None:
-            if not points:
+        def _scatter(arr: Optional[np.ndarray], coll_in: Any, coll_out: Any) -> None:
+            # arr: (k,3) rows of (L,a,b)
+            if arr is None or arr.shape[0] == 0:
+                coll_in.set_offsets(empty)
+                coll_out.set_offsets(empty)
                 return
-            arr = np.array(points, dtype=float)  # (k,3)
-            # Prefer slice points (abs(L-L_slice) small)
-            sel = np.where(np.abs(arr[:, 0] - L) <= tolL)[0]
-            other = np.where(np.abs(arr[:, 0] - L) > tolL)[0]
-            if sel.size > 0:
-                ax.scatter(arr[sel, 1], arr[sel, 2], c=color, s=30, marker="o", edgecolors="k", linewidths=0.5, alpha=0.9, label=label)
-            if other.size > 0:
-                # Subsample 'other' points for performance on large datasets
-                max_other = 2000
-                if other.size > max_other:
-                    try:
-                        rng = np.random.default_rng(123)
-                        sel_idx = rng.choice(other, size=max_other, replace=False)
-                        other_sel = arr[sel_idx]
-                    except Exception:
-                        other_sel = arr[other[:max_other]]
-                else:
-                    other_sel = arr[other]
-                ax.scatter(other_sel[:, 1], other_sel[:, 2], c=color, s=12, marker=".", alpha=0.25)
-
-        if self.chk_neurons.isChecked():
-            _scatter(pts.get("neurons", []), "#555555", "neurons")
-        if self.chk_mix.isChecked():
-            _scatter(pts.get("mix_raw", []), "#cc3333", "mix_raw_ok")
-        if self.chk_after.isChecked():
-            _scatter(pts.get("after_proj", []), "#33aa55", "after_projection_ok")
+            # Prefer slice points (abs(L-L_slice) small); 'other' points are subsampled
+            # for performance on large datasets
+            ab_in, other_sel = select_slice(arr, L, tolL, 2000)
+            for coll, sel in ((coll_in, ab_in), (coll_out, other_sel)):
+                coll.set_offsets(sel)
+                if sel.shape[0] > 0:
+                    ax.update_datalim(sel)
+
+        # All classes are plotted; the checkboxes only switch their visibility
+        for key, (coll_in, coll_out) in self._overlays.items():
+            _scatter(pts.get(key), coll_in, coll_out)
 
         # Finish
-        ax.set_aspect("equal", adjustable="box")
-        ax.set_xlabel("a")
-        ax.set_ylabel("b")
         ax.set_title(f"OKLab droplet slice at L={L:.3f}")
-        ax.grid(True, linestyle=":", linewidth=0.5, alpha=0.4)
-        handles, labels = ax.get_legend_handles_labels()
-        if handles:
-            uniq = {}
-            for h, lab in zip(handles, labels):
-                uniq[lab] = h
-            ax.legend(list(uniq.values()), list(uniq.keys()), loc="best", framealpha=0.85)
-
-        self.canvas.draw_idle()
\ No newline at end of file
+        ax.autoscale_view()
+        ax.set_visible(True)
+        self._update_overlay_artists()
+
+    # Overlay blitting
+    def _update_overlay_artists(self) -> None:
+        """Show the checked overlays and rebuild the legend for what is shown."""
+        ax = self._ax
+        if not self._has_plot():
+            return
+        handles: Dict[str, Any] = {self._boundary.get_label(): self._boundary}
+        for key, colls in self._overlays.items():
+            checked = self._overlay_boxes[key].isChecked()
+            for coll in colls:
+                # Collections without points this render stay hidden (and out of the legend)
+                on = checked and len(coll.get_offsets()) > 0
+                coll.set_visible(on)
+                label = coll.get_label()
+                if on and not label.startswith("_"):
+                    handles[label] = coll
+        if ax.get_legend() is not None:
+            ax.get_legend().remove()
+        legend = ax.legend(list(handles.values()), list(handles.keys()), loc="best", framealpha=0.85)
+        legend.set_animated(True)
+
+    def _draw_overlays(self) -> None:
+        ax = self._ax
+        for colls in self._overlays.values():
+            for coll in colls:
+                if coll.get_visible():
+                    ax.draw_artist(coll)
+        if ax.get_legend() is not None:
+            ax.draw_artist(ax.get_legend())
+
+    def _on_canvas_draw(self, _event: Any) -> None:
+        # A full draw skips animated artists: capture it as the background, then add them
+        if not self._has_plot() or self.canvas.is_saving():
+            return
+        try:
+            self._bg = self.canvas.copy_from_bbox(self._ax.bbox)
+            self._draw_overlays()
+        except Exception:
+            self._bg = None
+
+    def _refresh_overlays(self) -> None:
+        """Apply the overlay checkboxes to the current plot without redrawing it."""
+        if not self._has_plot():
+            return
+        self._update_overlay_artists()
+        if self._bg is None:
+            # No (or a stale) background yet: a full draw recaptures it
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._bg)
+        self._draw_overlays()
+        self.canvas.blit(self._ax.bbox)
+
+    def _invalidate_background(self, *_args: Any) -> None:
+        self._bg = None
@@ -21,12 +21,33 @@ import argparse
 import sys
 import re
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from urllib.parse import unquote
 
-MD_LINK_RE = re.compile(r'(?P<img>!\[.*?\]|\[.*?\])\((?P<url>[^)\s]+)(?:\s+"[^"]*")?\)')
+# Groups: 1 = "!" for an image else "", 2 = url. The link text may hold one level of
+# balanced brackets ([`a[0]`](api.md), [the [RFC] text](x.md)); each piece is a negated
+# class, so matching stays linear. Like "." before, it does not cross lines.
+MD_LINK_RE = re.compile(r'(!?)\[(?:[^\[\]\n]|\[[^\[\]\n]*\])*\]\(([^)\s]+)(?:\s+"[^"]*")?\)')
 SKIP_SCHEMES = ("http://", "https://", "mailto:", "tel:")
 ANCHOR_PREFIX = "#"
+# Blank, external-scheme or anchor-only URL (leading whitespace ignored), in one match
+_EXTERNAL_RE = re.compile(r"\s*(?:" + "|".join(map(re.escape, (*SKIP_SCHEMES, ANCHOR_PREFIX))) + r"|\Z)")
+# Repo-root-relative links written without a leading slash (docs/..., pdf/...).
+# Plain prefixes, as before: "Makefile.in" matches too
+TOP_LEVEL_PREFIXES = ("docs/", "pdf/", "coq/", "webapp/", "tools/", "build/", "examples/", "tests/", "dune-project", "Makefile")
+_TOPLEVEL_RE = re.compile("(?:" + "|".join(map(re.escape, TOP_LEVEL_PREFIXES)) + ")")
+# Normalized target path -> exists; many files link the same targets (index pages, images).
+# Per process: each pool worker fills its own.
+_exists_cache: dict[str, bool] = {}
+# Fewer markdown files than this are scanned in-process: starting the pool costs more
+# than scanning a few hundred files (this repo's docs/ scans serially in tens of ms)
+PARALLEL_MIN_FILES = 500
+# Threads reading files ahead of the in-process scan, for trees of at least
+# READ_AHEAD_MIN_FILES files; smaller ones are read inline (thread startup dominates)
+READ_THREADS = 8
+READ_AHEAD_MIN_FILES = 200
 
 
 def log(msg: str, verbose: bool):
@@ -35,14 +56,7 @@ def log(msg: str, verbose: bool):
 
 
 def is_external(url: str) -> bool:
-    u = url.strip()
-    if not u:
-        return True
-    if u.startswith(SKIP_SCHEMES):
-        return True
-    if u.startswith(ANCHOR_PREFIX):  # anchor-only links
-        return True
-    return False
+    return _EXTERNAL_RE.match(url) is not None
 
 
 def normalize_and_check(md_file: Path, url: str, repo_root: Path) -> tuple[bool, Path | None, str]:
@@ -53,38 +67,48 @@ def normalize_and_check(md_file: Path, url: str, repo_root: Path) -> tuple[bool,
     # Handle percent-encoding (e.g., spaces as %20)
     decoded = unquote(url)
 
+    # Normalize by removing any URL fragment (e.g., file.md#section) and query (rare in
+    # repo links) before the path is built
+    decoded = decoded.split("#", 1)[0].split("?", 1)[0]
+
     # Some docs links intentionally start with "./" or "../"
     # Absolute repo paths are sometimes written without leading slash (e.g., docs/..., pdf/...)
     # Treat them as relative to the repository root when path starts with a known top-level prefix.
-    top_level_prefixes = ("docs/", "pdf/", "coq/", "webapp/", "tools/", "build/", "examples/", "tests/", "dune-project", "Makefile")
-    candidate: Path
-    if any(decoded.startswith(p) for p in top_level_prefixes):
-        candidate = (repo_root / decoded).resolve()
+    if _TOPLEVEL_RE.match(decoded) is not None:
+        base = repo_root
     else:
         # Resolve relative to the markdown file directory
-        candidate = (md_file.parent / decoded).resolve()
-
-    # Normalize by removing any URL fragments (e.g., file.md#section)
-    candidate_str = str(candidate)
-    if "#" in candidate_str:
-        candidate = Path(candidate_str.split("#", 1)[0])
-
-    # If it has a query (rare in repo links), strip it
-    if "?" in candidate.name:
-        candidate = candidate.with_name(candidate.name.split("?", 1)[0])
-
-    # Check existence
-    if candidate.exists():
+        base = md_file.parent
+    # Lexical normalization only: symlinks need not be followed to check existence
+    candidate_str = os.path.normpath(os.path.join(base, decoded))
+    candidate = Path(candidate_str)
+
+    # Check existence (one stat per distinct target)
+    exists = _exists_cache.get(candidate_str)
+    if exists is None:
+        exists = _exists_cache[candidate_str] = os.path.exists(candidate_str)
+    if exists:
         return True, candidate, ""
     else:
         return False, candidate, "Path does not exist"
 
 
-def scan_markdown(md_file: Path, repo_root: Path, verbose: bool) -> list[dict]:
-    """Return a list of broken link dicts for a single markdown file."""
+def read_markdown(md_file: Path) -> bytes | None:
+    """Raw file bytes, or None if unreadable (scan_markdown then reports the error)."""
+    try:
+        return md_file.read_bytes()
+    except OSError:
+        return None
+
+
+def scan_markdown(md_file: Path, repo_root: Path, verbose: bool, data: bytes | None = None) -> list[dict]:
+    """
+    Return a list of broken link dicts for a single markdown file.
+    data: the file's bytes when already read (see read_markdown); read here otherwise.
+    """
     broken: list[dict] = []
     try:
-        text = md_file.read_text(encoding="utf-8")
+        text = (md_file.read_bytes() if data is None else data).decode("utf-8")
     except Exception as e:
         broken.append({
             "file": md_file,
@@ -94,13 +118,19 @@ def scan_markdown(md_file: Path, repo_root: Path, verbose: bool) -> list[dict]:
         })
         return broken
 
-    for m in MD_LINK_RE.finditer(text):
-        raw = m.group(0)
-        url = (m.group("url") or "").strip()
-        is_img = raw.startswith("!")
-        kind = "image" if is_img else "link"
+    # Every match contains "](": files without one never enter the regex engine
+    if "](" not in text:
+        return broken
+
+    # Locals: one lookup each instead of a global lookup per match
+    finditer = MD_LINK_RE.finditer
+    external = is_external
+    for m in finditer(text):
+        bang, url = m.groups()
+        url = url.strip()
+        kind = "image" if bang else "link"
 
-        if not url or is_external(url):
+        if not url or external(url):
             log(f"skip external/anchor in {md_file}: {url}", verbose)
             continue
 
@@ -118,10 +148,25 @@ def scan_markdown(md_file: Path, repo_root: Path, verbose: bool) -> list[dict]:
     return broken
 
 
+def find_markdown(scan_root: Path) -> list[Path]:
+    """*.md files under scan_root, in path order; os.walk already separates files from dirs."""
+    found = [
+        os.path.join(dirpath, name)
+        for dirpath, _dirnames, filenames in os.walk(scan_root)
+        for name in filenames
+        if name.endswith(".md")
+    ]
+    # Component-wise order, as sorting the Paths themselves would give
+    found.sort(key=lambda f: f.split(os.sep))
+    return [Path(f) for f in found]
+
+
 def main() -> int:
     ap = argparse.ArgumentParser(description="Validate Markdown links and images under docs/")
     ap.add_argument("--root", default="docs", help="Root directory to scan (default: docs)")
     ap.add_argument("--verbose", action="store_true", help="Verbose output")
+    ap.add_argument("--workers", type=int, default=None,
+                    help="Worker processes for scanning (default: CPU count; 1 = serial)")
     args = ap.parse_args()
 
     repo_root = Path(os.getcwd()).resolve()
@@ -131,15 +176,28 @@ def main() -> int:
         print(f"[error] scan root not found: {scan_root}", file=sys.stderr)
         return 2
 
-    md_files = sorted(p for p in scan_root.rglob("*.md") if p.is_file())
+    md_files = find_markdown(scan_root)
     if not md_files:
         print(f"[warn] no markdown files found under {scan_root}", file=sys.stderr)
         return 0
 
     all_broken: list[dict] = []
-    for md in md_files:
-        broken = scan_markdown(md, repo_root, args.verbose)
-        all_broken.extend(broken)
+    scan = partial(scan_markdown, repo_root=repo_root, verbose=args.verbose)
+    workers = args.workers if args.workers is not None else (os.cpu_count() or 1)
+    if len(md_files) < READ_AHEAD_MIN_FILES:
+        for md in md_files:
+            all_broken.extend(scan(md))
+    elif workers <= 1 or len(md_files) < PARALLEL_MIN_FILES:
+        # Reads run ahead on I/O threads while the files already read are scanned
+        with ThreadPoolExecutor(max_workers=READ_THREADS) as io:
+            for md, data in zip(md_files, io.map(read_markdown, md_files)):
+                all_broken.extend(scan(md, data=data))
+    else:
+        # Files are independent: scan them across processes (each reads its own files,
+        # so file contents are never pickled between processes); map keeps file order
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            for broken in ex.map(scan, md_files, chunksize=8):
+                all_broken.extend(broken)
 
     if not all_broken:
         print(f"[ok] All links and images valid under {scan_root}")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+json_io.py
+
+JSON read/write and schema-validator helpers shared by the O-IR tools
+(lower_from_tir.py, optimize_oir.py).
+
+- orjson (C parser/serializer) is used when installed; stdlib json is the fallback
+  and handles what orjson cannot (NaN/Infinity, which orjson rejects, and integers
+  beyond 64 bits, which orjson would silently read as floats).
+- Validators are compiled once per schema file (jsonschema is imported lazily).
+"""
+from __future__ import annotations
+
+import json
+import math
+import re
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Optional fast JSON (C parser/serializer); stdlib json is the fallback
+try:
+    import orjson
+    _HAS_ORJSON = True
+except Exception:
+    orjson = None  # type: ignore
+    _HAS_ORJSON = False
+
+
+# A run of 19+ digits may be an integer outside the 64-bit range (-2**63-1 already has
+# 19), which orjson reads as a float instead of failing. Matching inside strings or
+# fractions only costs a stdlib parse.
+_LONG_DIGITS_RE = re.compile(rb"\d{19}")
+
+
+def load_json(path: Path) -> Any:
+    raw = path.read_bytes()
+    if _HAS_ORJSON and _LONG_DIGITS_RE.search(raw) is None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity; json parses those (and reports real errors)
+    return json.loads(raw)
+
+
+def _all_floats_finite(obj: Any) -> bool:
+    """False if obj holds a NaN/Infinity anywhere (orjson would write those as null)."""
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        if isinstance(o, float):
+            if not math.isfinite(o):
+                return False
+        elif isinstance(o, dict):
+            stack.extend(o.values())
+        elif isinstance(o, (list, tuple)):
+            stack.extend(o)
+    return True
+
+
+def dumps_json(obj: Any) -> bytes:
+    """
+    2-space indented UTF-8 JSON with a trailing newline: the layout json.dump(indent=2)
+    writes. With orjson, floats use its shortest form (1e16, 1e-7 rather than json's
+    1e+16, 1e-07); they parse back to the same values.
+    """
+    if _HAS_ORJSON and _all_floats_finite(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits, non-string keys
+    return (json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=False) + "\n").encode("utf-8")
+
+
+def save_json(obj: Any, path: Path) -> None:
+    """Encode first, then one write call (no per-token writes through a text stream)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(dumps_json(obj))
+
+
+# Resolved schema path -> compiled Draft 2020-12 validator. jsonschema is imported and
+# each schema read on first use only, so validating input and output compiles it once.
+_VALIDATOR_CACHE: Dict[Path, Any] = {}
+
+
+def get_validator(schema_path: Path) -> Optional[Any]:
+    """Cached validator for schema_path, or None when jsonschema is not installed."""
+    key = schema_path.resolve()
+    v = _VALIDATOR_CACHE.get(key)
+    if v is None:
+        try:
+            from jsonschema import Draft202012Validator  # type: ignore
+        except Exception:
+            return None
+        v = _VALIDATOR_CACHE[key] = Draft202012Validator(load_json(schema_path))
+    return v
+
+
+__all__ = ["load_json", "dumps_json", "save_json", "get_validator"]
@@ -22,7 +22,6 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -33,40 +32,35 @@ from typing import Any, Dict, List, Optional, Tuple
 # - O-IR validator (lazy import for post-emit validation)
 TIR_SCHEMA_PATH = Path("docs/ir/tir-schema.json")
 OIR_SCHEMA_PATH = Path("docs/ir/oir-schema.json")
+# Shared stand-in for absent sub-terms (read only, never mutated): no {} per lookup
+_EMPTY: Dict[str, Any] = {}
 
 try:
     from tools.tir.codec import load_tir  # type: ignore
+    from tools.oir.json_io import get_validator, save_json  # type: ignore
 except Exception as e:
     print(
-        "ERROR: failed to import tools.tir.codec. Make sure you're running from repo root.\n"
+        "ERROR: failed to import tools.tir.codec / tools.oir.json_io. Make sure you're running from repo root.\n"
         "Details: {}".format(e),
         file=sys.stderr,
     )
     sys.exit(2)
 
 
-def _load_json(path: Path) -> Any:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
-
-
 def _validate_oir(doc: Any, schema_path: Path = OIR_SCHEMA_PATH) -> List[str]:
     """Validate O-IR using jsonschema if available; returns list of errors."""
-    try:
-        import jsonschema  # type: ignore
-        from jsonschema import Draft202012Validator  # type: ignore
-    except Exception:
+    v = get_validator(schema_path)
+    if v is None:
         # jsonschema not installed; skip validation but warn.
         return []
-    schema = _load_json(schema_path)
-    v = Draft202012Validator(schema)
-    errs = sorted(v.iter_errors(doc), key=lambda e: e.path)
     msgs: List[str] = []
-    for err in errs:
+    for err in v.iter_errors(doc):
         loc = "$"
         if err.path:
             loc = "$." + ".".join(str(p) for p in err.path)
         msgs.append(f"{loc}: {err.message}")
+    # Stable report order from the final strings (no comparisons of error paths)
+    msgs.sort()
     return msgs
 
 
@@ -120,33 +114,32 @@ class LowerFromTIR:
         if self.cfg.debug:
             sys.stderr.write(f"[debug] lowering T-IR module: {mod_name}\n")
 
-        oir_functions: List[Dict[str, Any]] = []
-        oir_globals: List[Dict[str, Any]] = []
-        oir_tables: List[Dict[str, Any]] = []
-        oir_data: List[Dict[str, Any]] = []
+        decls = mod.get("decls", [])
 
-        # Lower declarations (very small subset; extend here)
-        for decl in mod.get("decls", []):
-            # Proof relevance erasure: drop proof-only definitions and record certificate
+        # Proof relevance erasure: proof-only definitions are dropped; record certificates
+        erasure = self.report.erasure
+        for decl in decls:
             if decl.get("kind") == "Definition" and decl.get("proof_relevance") == "proof":
                 sym = str(decl.get("name", ""))
                 if sym:
-                    self.report.erasure.append({"symbol": sym, "reason": "proof-irrelevant"})
-                # Do not lower proof-only items into O-IR
-                continue
-
-            kind = decl.get("kind")
-            if kind == "Definition":
-                fn = self._lower_definition(decl)
-                if fn is not None:
-                    oir_functions.append(fn)
-            elif kind == "Inductive":
-                # For MVP: record tag spaces and shape metadata elsewhere as needed
-                continue
+                    erasure.append({"symbol": sym, "reason": "proof-irrelevant"})
+
+        # Lower the remaining definitions (very small subset; extend here).
+        # Inductive: for MVP, tag spaces and shape metadata are recorded elsewhere as needed
+        lower_def = self._lower_definition
+        oir_functions: List[Dict[str, Any]] = [
+            fn
+            for fn in (
+                lower_def(d)
+                for d in decls
+                if d.get("kind") == "Definition" and d.get("proof_relevance") != "proof"
+            )
+            if fn is not None
+        ]
 
         # Ensure we produce at least one function to satisfy O-IR schema
         if not oir_functions:
-            oir_functions.append(self._make_stub_function())
+            oir_functions = [self._make_stub_function()]
 
         oir = {
             "version": tir.get("version", "0.1.0"),
@@ -154,9 +147,9 @@ class LowerFromTIR:
             "module": {
                 "name": f"{mod_name}",
                 "functions": oir_functions,
-                "globals": oir_globals,
-                "dataSegments": oir_data,
-                "tables": oir_tables,
+                "globals": [],
+                "dataSegments": [],
+                "tables": [],
             },
             "certificates": self.report.to_oir_certs(),
             "metadata": {
@@ -176,18 +169,19 @@ class LowerFromTIR:
         - Otherwise, skip (future work will perform full lowering).
         """
         name = d.get("name")
-        term = d.get("term", {})
+        term = d.get("term", _EMPTY)
         kind = term.get("kind")
         if self.cfg.debug:
             sys.stderr.write(f"[debug] def {name}: term.kind={kind}\n")
 
         # Heuristic: Lambda x. x  -> id function
         if kind == "Lambda":
-            param = term.get("param") or {}
-            body = term.get("body") or {}
-            if body.get("kind") == "Var" and body.get("name") == param.get("name"):
+            param = term.get("param") or _EMPTY
+            body = term.get("body") or _EMPTY
+            p_name = param.get("name")
+            if body.get("kind") == "Var" and body.get("name") == p_name:
                 # Choose i32 as a placeholder physical type; real lowering will perform repr analysis.
-                x_name = str(param.get("name") or "x")
+                x_name = str(p_name or "x")
                 fn = {
                     "name": str(name),
                     "params": [{"name": x_name, "ty": {"kind": "i32"}}],
@@ -269,10 +263,7 @@ def main(argv: Optional[List[str]] = None) -> int:
 
     # Write output
     out_path = Path(args.out)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_path.open("w", encoding="utf-8") as f:
-        json.dump(oir, f, indent=2, ensure_ascii=False, sort_keys=False)
-        f.write("\n")
+    save_json(oir, out_path)
 
     if cfg.debug:
         sys.stderr.write(f"[ok] wrote O-IR to {out_path}\n")
@@ -18,50 +18,39 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from pathlib import Path
 from typing import Any, List
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
-OIR_SCHEMA_PATH = Path("docs/ir/oir-schema.json")
-
+# Ensure 'tools' imports work when run as a script
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
 
-def _load_json(path: Path) -> Any:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+from tools.oir.json_io import get_validator, load_json, save_json  # type: ignore  # noqa: E402
 
-
-def _save_json(obj: Any, path: Path) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(obj, f, indent=2, ensure_ascii=False, sort_keys=False)
-        f.write("\n")
+OIR_SCHEMA_PATH = Path("docs/ir/oir-schema.json")
 
 
 def _validate_json(doc: Any, schema_path: Path) -> List[str]:
     try:
-        import jsonschema  # type: ignore
-        from jsonschema import Draft202012Validator  # type: ignore
-    except Exception:
-        return []
-    if not schema_path.exists():
+        v = get_validator(schema_path)
+    except FileNotFoundError:
         return [f"schema not found: {schema_path}"]
-    schema = _load_json(schema_path)
-    v = Draft202012Validator(schema)
-    errors = sorted(v.iter_errors(doc), key=lambda e: e.path)
+    if v is None:
+        return []
     msgs: List[str] = []
-    for err in errors:
+    for err in v.iter_errors(doc):
         loc = "$"
         if err.path:
             loc = "$." + ".".join(str(p) for p in err.path)
         msgs.append(f"{loc}: {err.message}")
+    # Stable report order from the final strings (no comparisons of error paths)
+    msgs.sort()
     return msgs
 
 
 def main(argv: list[str] | None = None) -> int:
-    sys.path.insert(0, str(REPO_ROOT))  # ensure 'tools' imports work when run from repo root
-
     ap = argparse.ArgumentParser(description="Optimize an O-IR JSON with selected passes")
     ap.add_argument("--in", dest="inp", required=True, help="Path to input O-IR JSON")
     ap.add_argument("--out", dest="out", required=True, help="Path to output O-IR JSON")
@@ -84,7 +73,7 @@ def main(argv: list[str] | None = None) -> int:
     out_path = Path(args.out)
 
     try:
-        oir = _load_json(in_path)
+        oir = load_json(in_path)
     except Exception as e:
         print(f"[fail] failed to read O-IR: {e}", file=sys.stderr)
         return 2
@@ -126,7 +115,7 @@ def main(argv: list[str] | None = None) -> int:
             return 1
 
     try:
-        _save_json(oir, out_path)
+        save_json(oir, out_path)
     except Exception as e:
         print(f"[fail] failed to write O-IR: {e}", file=sys.stderr)
         return 2
@@ -28,8 +28,8 @@ Schema compliance:
 """
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple
-
+import sys
+from typing import Any, Callable, Dict, Optional, Tuple
 
 # ------------- helpers -------------
 
@@ -79,147 +79,152 @@ def _is_value_id(x: Any) -> bool:
 # ------------- evaluation core -------------
 
 
+_M32 = 0xFFFFFFFF
+_M64 = 0xFFFFFFFFFFFFFFFF
+
+
+def _div_float(a: Any, b: Any) -> Optional[float]:
+    af = float(a)
+    bf = float(b)
+    if bf == 0.0:
+        return None
+    return af / bf
+
+
+# (op, type kind) -> evaluator; one dict lookup instead of an if-cascade per fold.
+# Evaluators may raise on bad literals (the caller folds nothing then).
+_UNARY_TABLE: Dict[Tuple[str, str], Callable[[Any], Any]] = {
+    ("neg_i32", "i32"): lambda a: int(-int(a)),
+    ("neg_i64", "i64"): lambda a: int(-int(a)),
+    # bitwise not for 32/64-bit (two's complement)
+    ("not_i32", "i32"): lambda a: int(~int(a)) & _M32,
+    ("not_i64", "i64"): lambda a: int(~int(a)) & _M64,
+    ("abs_f32", "f32"): lambda a: float(abs(float(a))),
+    ("abs_f64", "f64"): lambda a: float(abs(float(a))),
+}
+
+_BINARY_TABLE: Dict[Tuple[str, str], Callable[[Any, Any], Any]] = {
+    ("add_i32", "i32"): lambda a, b: (int(a) + int(b)) & _M32,
+    ("sub_i32", "i32"): lambda a, b: (int(a) - int(b)) & _M32,
+    ("mul_i32", "i32"): lambda a, b: (int(a) * int(b)) & _M32,
+    ("add_i64", "i64"): lambda a, b: (int(a) + int(b)) & _M64,
+    ("sub_i64", "i64"): lambda a, b: (int(a) - int(b)) & _M64,
+    ("mul_i64", "i64"): lambda a, b: (int(a) * int(b)) & _M64,
+    ("add_f32", "f32"): lambda a, b: float(a) + float(b),
+    ("sub_f32", "f32"): lambda a, b: float(a) - float(b),
+    ("mul_f32", "f32"): lambda a, b: float(a) * float(b),
+    ("div_f32", "f32"): _div_float,
+    ("add_f64", "f64"): lambda a, b: float(a) + float(b),
+    ("sub_f64", "f64"): lambda a, b: float(a) - float(b),
+    ("mul_f64", "f64"): lambda a, b: float(a) * float(b),
+    ("div_f64", "f64"): _div_float,
+}
+
+
 def _eval_unary(op: str, kty: str, a: Any) -> Optional[Any]:
+    fn = _UNARY_TABLE.get((op, kty))
+    if fn is None:
+        return None
     try:
-        if op == "neg_i32" and kty == "i32":
-            return int(-int(a))
-        if op == "neg_i64" and kty == "i64":
-            return int(-int(a))
-        if op == "not_i32" and kty == "i32":
-            # bitwise not for 32-bit (two's complement)
-            return int(~int(a)) & 0xFFFFFFFF
-        if op == "not_i64" and kty == "i64":
-            return int(~int(a)) & 0xFFFFFFFFFFFFFFFF
-        if op == "abs_f32" and kty == "f32":
-            return float(abs(float(a)))
-        if op == "abs_f64" and kty == "f64":
-            return float(abs(float(a)))
+        return fn(a)
     except Exception:
         return None
-    return None
 
 
 def _eval_binary(op: str, kty: str, a: Any, b: Any) -> Optional[Any]:
+    fn = _BINARY_TABLE.get((op, kty))
+    if fn is None:
+        return None
     try:
-        if kty in ("i32", "i64"):
-            ai = int(a)
-            bi = int(b)
-            if op == "add_i32" and kty == "i32":
-                return (ai + bi) & 0xFFFFFFFF
-            if op == "sub_i32" and kty == "i32":
-                return (ai - bi) & 0xFFFFFFFF
-            if op == "mul_i32" and kty == "i32":
-                return (ai * bi) & 0xFFFFFFFF
-            if op == "add_i64" and kty == "i64":
-                return (ai + bi) & 0xFFFFFFFFFFFFFFFF
-            if op == "sub_i64" and kty == "i64":
-                return (ai - bi) & 0xFFFFFFFFFFFFFFFF
-            if op == "mul_i64" and kty == "i64":
-                return (ai * bi) & 0xFFFFFFFFFFFFFFFF
-        if kty in ("f32", "f64"):
-            af = float(a)
-            bf = float(b)
-            if op == "add_f32" and kty == "f32":
-                return af + bf
-            if op == "sub_f32" and kty == "f32":
-                return af - bf
-            if op == "mul_f32" and kty == "f32":
-                return af * bf
-            if op == "div_f32" and kty == "f32":
-                if bf == 0.0:
-                    return None
-                return af / bf
-            if op == "add_f64" and kty == "f64":
-                return af + bf
-            if op == "sub_f64" and kty == "f64":
-                return af - bf
-            if op == "mul_f64" and kty == "f64":
-                return af * bf
-            if op == "div_f64" and kty == "f64":
-                if bf == 0.0:
-                    return None
-                return af / bf
+        return fn(a, b)
     except Exception:
         return None
-    return None
 
 
 # ------------- pass implementation -------------
 
 
+def _folded_const(inst: Dict[str, Any], kty: str, res: Any) -> Dict[str, Any]:
+    # Replace with Const preserving bind/result type
+    return {
+        "kind": "Const",
+        "bind": inst.get("bind"),
+        "value": {
+            "ty": {"kind": kty},
+            "value": res,
+        },
+    }
+
+
 def _fold_block(bb: Dict[str, Any], debug: bool = False) -> None:
     """
-    Constant fold within a basic block. Mutates the block in place.
+    Constant fold within a basic block. Mutates the block in place: a folded
+    instruction is replaced at its index, the rest of the list is left untouched.
     """
+    insts = bb.get("insts")
+    if not isinstance(insts, list):
+        insts = bb["insts"] = list(insts or [])
     const_env: Dict[str, Tuple[str, Any]] = {}  # %id -> (type-kind, lit)
-    new_insts: List[Dict[str, Any]] = []
+    # One lookup per operand: entries are tuples, so None means "not a constant"
+    const_get = const_env.get
 
-    for inst in bb.get("insts") or []:
+    for pos, inst in enumerate(insts):
         k = inst.get("kind")
+        if k != "Const" and k != "Unary" and k != "Binary":
+            # Stays unchanged; may use const operands, but not foldable
+            continue
+
+        # _result_id / _bind_type_kind inlined: one bind lookup per instruction
+        bind = inst.get("bind")
+        rid = kty = None
+        if isinstance(bind, dict):
+            r = bind.get("result")
+            if isinstance(r, str) and r[:1] == "%":
+                rid = r
+            ty = bind.get("ty")
+            if isinstance(ty, dict):
+                tk = ty.get("kind")
+                if isinstance(tk, str):
+                    # Interned: the (op, kind) table lookups then match by identity, and
+                    # folded Consts share one "i32"/"f64"/... object instead of a copy each
+                    kty = sys.intern(tk)
 
         # Track constants introduced
         if k == "Const":
-            rid = _result_id(inst)
-            cv = _const_val(inst)
-            if rid and cv:
-                const_env[rid] = cv
-            new_insts.append(inst)
+            # _const_val inlined: prefer value.ty, else bind.ty
+            val = inst.get("value") or {}
+            vty = val.get("ty") or {}
+            ck = vty.get("kind")
+            if isinstance(ck, str):
+                ck = sys.intern(ck)
+            else:
+                ck = kty
+            if rid and isinstance(ck, str):
+                const_env[rid] = (ck, val.get("value"))
             continue
 
+        op = inst.get("op")
         if k == "Unary":
-            op = inst.get("op")
-            rid = _result_id(inst)
-            kty = _bind_type_kind(inst)
             arg = inst.get("arg")
-            if rid and kty and _is_value_id(arg) and arg in const_env:
-                (arg_k, aval) = const_env[arg]
-                # bind type determines result kind
-                res = _eval_unary(str(op or ""), kty, aval)
-                if res is not None:
-                    # Replace with Const preserving bind/result type
-                    folded = {
-                        "kind": "Const",
-                        "bind": inst.get("bind"),
-                        "value": {
-                            "ty": {"kind": kty},
-                            "value": res,
-                        },
-                    }
-                    new_insts.append(folded)
-                    const_env[rid] = (kty, res)
-                    if debug:
-                        import sys as _sys
-                        _sys.stderr.write(f"[const-fold] Unary {op} -> Const for {rid}\n")
-                    continue  # skip original
-        elif k == "Binary":
-            op = inst.get("op")
-            rid = _result_id(inst)
-            kty = _bind_type_kind(inst)
+            c = const_get(arg) if isinstance(arg, str) and arg[:1] == "%" else None
+            if not (rid and kty and c is not None):
+                continue
+            # bind type determines result kind
+            res = _eval_unary(str(op or ""), kty, c[1])
+        else:
             lhs = inst.get("lhs")
             rhs = inst.get("rhs")
-            if rid and kty and _is_value_id(lhs) and _is_value_id(rhs) and lhs in const_env and rhs in const_env:
-                (_, aval) = const_env[lhs]
-                (_, bval) = const_env[rhs]
-                res = _eval_binary(str(op or ""), kty, aval, bval)
-                if res is not None:
-                    folded = {
-                        "kind": "Const",
-                        "bind": inst.get("bind"),
-                        "value": {
-                            "ty": {"kind": kty},
-                            "value": res,
-                        },
-                    }
-                    new_insts.append(folded)
-                    const_env[rid] = (kty, res)
-                    if debug:
-                        import sys as _sys
-                        _sys.stderr.write(f"[const-fold] Binary {op} -> Const for {rid}\n")
-                    continue
-        # Default: keep instruction unchanged; may use const operands, but not foldable
-        new_insts.append(inst)
-
-    bb["insts"] = new_insts
+            a = const_get(lhs) if isinstance(lhs, str) and lhs[:1] == "%" else None
+            b = const_get(rhs) if a is not None and isinstance(rhs, str) and rhs[:1] == "%" else None
+            if not (rid and kty and b is not None):
+                continue
+            res = _eval_binary(str(op or ""), kty, a[1], b[1])
+        if res is not None:
+            insts[pos] = _folded_const(inst, kty, res)
+            const_env[rid] = (kty, res)
+            if debug:
+                sys.stderr.write(f"[const-fold] {k} {op} -> Const for {rid}\n")
+
     # Terminator not adjusted for constants (Return of %const will be handled by codegen)
 
 